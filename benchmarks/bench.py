@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+"""Headless frame-rate benchmarks for puffkit.
+
+Runs synthetic scenes in a `PkApp` under the SDL dummy video driver and
+measures how many frames per second they render. The results are written as
+JSON and can be compared against a stored baseline:
+
+```sh
+python benchmarks/bench.py --output baseline.json
+# ...upgrade or change something...
+python benchmarks/bench.py --baseline baseline.json
+```
+
+The comparison exits with status 1 if any workload got slower than the
+baseline by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time as t
+from collections.abc import Callable
+from typing import Any, Final
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+import puffkit
+from puffkit import PkApp, PkContainer, PkScene
+from puffkit.image import PkImage
+from puffkit.surface import PkSurface
+from puffkit.widget import (
+    PkButtonWidget,
+    PkImageWidget,
+    PkLabelWidget,
+    PkTextInputWidget,
+    PkWidget,
+)
+
+SCREEN_SIZE: Final[tuple[int, int]] = (1280, 720)
+DEFAULT_SIZES: Final[tuple[int, ...]] = (10, 100, 1000, 10000)
+DEFAULT_FRAMES: Final[int] = 120
+WARMUP_FRAMES: Final[int] = 5
+DEFAULT_TOLERANCE: Final[float] = 0.1
+
+type WidgetFactory = Callable[
+    [str, PkContainer, tuple[int, int, int, int]], PkWidget
+]
+
+
+def _image() -> PkImage:
+    """Create a small checkered image for the image widgets.
+
+    Returns:
+        PkImage: The image.
+    """
+    surface = PkSurface((16, 16))
+    surface.fill((200, 60, 60))
+    surface.internal_surface.fill((60, 60, 200), (0, 0, 8, 8))
+    surface.internal_surface.fill((60, 60, 200), (8, 8, 8, 8))
+    return PkImage("bench", surface)
+
+
+WIDGET_FACTORIES: Final[dict[str, WidgetFactory]] = {
+    "label": lambda id_, container, rect: PkLabelWidget(
+        id_, container, id_, rect
+    ),
+    "button": lambda id_, container, rect: PkButtonWidget(
+        id_, container, id_, rect
+    ),
+    "image": lambda id_, container, rect: PkImageWidget(
+        id_, container, _image(), rect
+    ),
+}
+
+
+def _grid(count: int) -> list[tuple[int, int, int, int]]:
+    """Lay out `count` cells in a grid filling the screen.
+
+    Args:
+        count (int): Number of cells.
+
+    Returns:
+        list[tuple[int, int, int, int]]: Rects of the cells.
+    """
+    width, height = SCREEN_SIZE
+    columns = math.ceil(math.sqrt(count * width / height))
+    rows = math.ceil(count / columns)
+    cell_width = max(1, width // columns)
+    cell_height = max(1, height // rows)
+    return [
+        (
+            (i % columns) * cell_width,
+            (i // columns) * cell_height,
+            cell_width,
+            cell_height,
+        )
+        for i in range(count)
+    ]
+
+
+class BenchScene(PkScene):
+    """Scene holding one container filled by a workload."""
+
+    def __init__(
+        self, app: PkApp, populate: Callable[[PkContainer], None]
+    ) -> None:
+        """Initialize the scene.
+
+        Args:
+            app (PkApp): The app.
+            populate (Callable[[PkContainer], None]): Adds the widgets of
+                the workload to the container.
+        """
+        super().__init__("bench", app, lazy=False, auto_unload=False)
+        self.populate = populate
+
+    def on_load(self) -> None:
+        self.container = PkContainer(
+            self.app, self.surface, "bench", (0, 0, *SCREEN_SIZE)
+        )
+        self.populate(self.container)
+
+    def on_update(self, delta: float) -> None:
+        self.container.input(self._input)
+        self.container.update(delta)
+
+    def on_render(self) -> None:
+        self.container.render()
+
+
+class BenchApp(PkApp):
+    """App the benchmarks run in."""
+
+    def __init__(self, *, dirty_rendering: bool) -> None:
+        """Initialize the app.
+
+        Args:
+            dirty_rendering (bool): Whether to use dirty rendering.
+        """
+        super().__init__(
+            "puffkit-bench",
+            "1",
+            SCREEN_SIZE,
+            {},
+            SCREEN_SIZE,
+            0,
+            dirty_rendering=dirty_rendering,
+        )
+
+
+class Workload:
+    """A scene setup and the input posted before each frame."""
+
+    def __init__(
+        self,
+        name: str,
+        populate: Callable[[PkContainer], None],
+        step: Callable[[PkContainer, int], None] | None = None,
+        check: Callable[[PkContainer, int], None] | None = None,
+    ) -> None:
+        """Initialize the workload.
+
+        Args:
+            name (str): Name of the workload, used as key in the results.
+            populate (Callable[[PkContainer], None]): Adds widgets to the
+                container.
+            step (Callable[[PkContainer, int], None] | None, optional):
+                Called with the frame number before each frame. Defaults to
+                None (moves the mouse across the screen).
+            check (Callable[[PkContainer, int], None] | None, optional):
+                Called with the frame number after each frame, outside the
+                measurement, to verify the workload did its work. Raises
+                RuntimeError if not. Defaults to None (no check).
+        """
+        self.name = name
+        self.populate = populate
+        self.step = step or _move_mouse
+        self.check = check
+
+    def run(self, frames: int, *, dirty_rendering: bool) -> dict[str, Any]:
+        """Run the workload.
+
+        Args:
+            frames (int): Number of measured frames.
+            dirty_rendering (bool): Whether to use dirty rendering.
+
+        Returns:
+            dict[str, Any]: The results.
+        """
+        app = BenchApp(dirty_rendering=dirty_rendering)
+        scene = BenchScene(app, self.populate)
+        app.scene_manager.add_scene(scene)
+        app.scene_manager.set_scene("bench")
+        container = scene.container
+
+        durations: list[float] = []
+        for frame in range(WARMUP_FRAMES + frames):
+            self.step(container, frame)
+            start = t.perf_counter()
+            app.update(1 / 60)
+            app.render()
+            if frame >= WARMUP_FRAMES:
+                durations.append(t.perf_counter() - start)
+            if self.check is not None:
+                self.check(container, frame)
+
+        pg.quit()
+
+        durations.sort()
+        total = sum(durations)
+        return {
+            "frames": frames,
+            "widgets": len(container.widgets),
+            "fps": frames / total if total else math.inf,
+            "frame_ms": {
+                "mean": total / frames * 1000,
+                "p50": _percentile(durations, 50) * 1000,
+                "p95": _percentile(durations, 95) * 1000,
+                "max": durations[-1] * 1000,
+            },
+        }
+
+
+def _percentile(samples: list[float], percentile: int) -> float:
+    """Get a nearest-rank percentile of sorted samples.
+
+    Args:
+        samples (list[float]): The sorted samples.
+        percentile (int): The percentile.
+
+    Returns:
+        float: The percentile.
+    """
+    return samples[max(0, (percentile * len(samples) + 99) // 100 - 1)]
+
+
+def _move_mouse(container: PkContainer, frame: int) -> None:
+    """Post a mouse motion sweeping diagonally across the screen.
+
+    Args:
+        container (PkContainer): The container of the workload.
+        frame (int): The frame number.
+    """
+    width, height = SCREEN_SIZE
+    pos = (frame * 7 % width, frame * 5 % height)
+    pg.event.post(
+        pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=(7, 5), buttons=(0, 0, 0))
+    )
+
+
+def _populate_grid(kind: str, count: int) -> Callable[[PkContainer], None]:
+    """Create a populate function filling a grid with widgets.
+
+    Args:
+        kind (str): Kind of the widgets, a key of `WIDGET_FACTORIES`.
+        count (int): Number of widgets.
+
+    Returns:
+        Callable[[PkContainer], None]: The populate function.
+    """
+    factory = WIDGET_FACTORIES[kind]
+
+    def populate(container: PkContainer) -> None:
+        for i, rect in enumerate(_grid(count)):
+            container.add_widget(factory(f"{kind}{i}", container, rect))
+
+    return populate
+
+
+def _populate_text_input(container: PkContainer) -> None:
+    """Add a focused text input and a few labels."""
+    for i, rect in enumerate(_grid(100)):
+        container.add_widget(PkLabelWidget(f"label{i}", container, "", rect))
+    text_input = PkTextInputWidget(
+        "input", container, (440, 340, 400, 40), placeholder="type here"
+    )
+    container.add_widget(text_input)
+    container.focus_manager.focus(text_input)
+
+
+def _type(container: PkContainer, frame: int) -> None:
+    """Type one key per frame, erasing the text every 40 keys."""
+    if frame % 40 == 39:
+        key, unicode = pg.K_BACKSPACE, ""
+        for _ in range(39):
+            _post_key(key, unicode)
+    else:
+        key = pg.K_a + frame % 26
+        _post_key(key, chr(ord("a") + frame % 26))
+
+
+def _check_typed(container: PkContainer, frame: int) -> None:
+    """Check the text input holds the keys typed since the last erase.
+
+    Args:
+        container (PkContainer): The container of the workload.
+        frame (int): The frame number.
+
+    Raises:
+        RuntimeError: If the text differs.
+    """
+    first = frame - frame % 40
+    expected = "".join(
+        chr(ord("a") + typed % 26) for typed in range(first, frame + 1)
+    )
+    if frame % 40 == 39:
+        expected = ""
+    text = container.get_widget("input").text
+    if text != expected:
+        raise RuntimeError(
+            f"Text input holds {text!r} after frame {frame}, expected "
+            f"{expected!r}; the typed keys did not reach it."
+        )
+
+
+def _post_key(key: int, unicode: str) -> None:
+    """Post a key press and release.
+
+    Args:
+        key (int): The key code.
+        unicode (str): The typed character.
+    """
+    for type_ in (pg.KEYDOWN, pg.KEYUP):
+        pg.event.post(
+            pg.event.Event(type_, key=key, unicode=unicode, mod=0, scancode=0)
+        )
+
+
+def _populate_image_resize(container: PkContainer) -> None:
+    """Add image widgets in every resize mode."""
+    image = _image()
+    for i, mode in enumerate(sorted(PkImageWidget.RESIZE_MODES, key=str)):
+        container.add_widget(
+            PkImageWidget(
+                f"image{i}",
+                container,
+                image,
+                (i * 256, 0, 200, 200),
+                resize_mode=mode,
+            )
+        )
+
+
+def _resize(container: PkContainer, frame: int) -> None:
+    """Resize every image widget, oscillating between sizes."""
+    size = 40 + abs(frame % 200 - 100) * 2
+    for widget in container.widgets.values():
+        widget.rect.size = (size, size)
+        widget.image = widget.image
+
+
+def workloads(sizes: list[int]) -> list[Workload]:
+    """Get all workloads.
+
+    Args:
+        sizes (list[int]): Numbers of widgets in the widget grid workloads.
+
+    Returns:
+        list[Workload]: The workloads.
+    """
+    return [
+        *(
+            Workload(f"{kind}-{count}", _populate_grid(kind, count))
+            for kind in WIDGET_FACTORIES
+            for count in sizes
+        ),
+        Workload(
+            "text-input-typing", _populate_text_input, _type, _check_typed
+        ),
+        Workload("image-resize", _populate_image_resize, _resize),
+    ]
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Compare results against a baseline and print the comparison.
+
+    Args:
+        results (dict[str, Any]): The results.
+        baseline (dict[str, Any]): The baseline results.
+        tolerance (float): Allowed relative slowdown.
+
+    Returns:
+        list[str]: Names of the workloads slower than the baseline by more
+            than `tolerance`.
+    """
+    regressions: list[str] = []
+    for name, result in results["workloads"].items():
+        base = baseline["workloads"].get(name)
+        if base is None:
+            print(f"{name:<24} {result['fps']:>10.1f} FPS   (no baseline)")
+            continue
+
+        ratio = result["fps"] / base["fps"]
+        result["baseline_fps"] = base["fps"]
+        result["ratio"] = ratio
+        regressed = ratio < 1 - tolerance
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<24} {result['fps']:>10.1f} FPS"
+            f"   baseline {base['fps']:>10.1f}   x{ratio:.2f}"
+            + ("   REGRESSION" if regressed else "")
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks.
+
+    Args:
+        argv (list[str] | None, optional): Command line arguments. Defaults
+            to None (use `sys.argv`).
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=DEFAULT_FRAMES,
+        help="measured frames per workload",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="widget counts of the widget grid workloads",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="NAME",
+        help="run only the workloads whose names start with one of these",
+    )
+    parser.add_argument(
+        "--dirty", action="store_true", help="use dirty rendering"
+    )
+    parser.add_argument(
+        "--output", metavar="PATH", help="write the results as JSON"
+    )
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="compare against these results"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed relative slowdown against the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [
+        workload
+        for workload in workloads(args.sizes)
+        if not args.only or workload.name.startswith(tuple(args.only))
+    ]
+
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "puffkit": puffkit.__version__,
+        "platform": platform.platform(),
+        "dirty_rendering": args.dirty,
+        "workloads": {},
+    }
+    for workload in selected:
+        result = workload.run(args.frames, dirty_rendering=args.dirty)
+        results["workloads"][workload.name] = result
+        if not args.baseline:
+            print(f"{workload.name:<24} {result['fps']:>10.1f} FPS")
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.tolerance):
+            status = 1
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,26 +6,35 @@ import pygame as _pygame
 del _pygame
 
 from puffkit.app import PkApp
+from puffkit.clock import PkClock, PkVirtualClock
 from puffkit.color.color import ColorValue, PkColor
+from puffkit.frame_input import PkFrameInput
 from puffkit.geometry.coordinate import PkCoordinate
 from puffkit.geometry.rect import PkRect
 from puffkit.object import PkObject
+from puffkit.profiler import PkFrameProfiler
 from puffkit.scene import PkScene
 from puffkit.subsurface import PkSubSurface
 from puffkit.surface import PkSurface
+from puffkit.surface_pool import PkSurfacePool
 from puffkit.textures import get_texture
 from puffkit.container import PkContainer
 
 __all__ = [
     "PkApp",
+    "PkClock",
+    "PkVirtualClock",
     "ColorValue",
     "PkColor",
     "PkCoordinate",
+    "PkFrameInput",
     "PkRect",
     "PkObject",
+    "PkFrameProfiler",
     "PkScene",
     "PkSubSurface",
     "PkSurface",
+    "PkSurfacePool",
     "get_texture",
     "PkContainer",
 ]
@@ -5,14 +5,19 @@ from __future__ import annotations
 
 import pygame as pg
 
+from collections.abc import Sequence
 from typing import Final
 
+from puffkit.clock import PkClock
 from puffkit.color.palettes import PkBasicPalette
-from puffkit.event import PkEventManager
+from puffkit.decorators.timing import trace
+from puffkit.event import PkEvent, PkEventManager
 from puffkit.font.font import PkFont
 from puffkit.font.sysfont import PkSysFont
+from puffkit.geometry.rect import PkRect, RectValue
 from puffkit.geometry.size import PkSize
 from puffkit.object import PkObject
+from puffkit.profiler import PkFrameProfiler
 from puffkit.scene import PkScene, PkSceneManager
 from puffkit.surface import PkSurface
 
@@ -26,6 +31,8 @@ class PkApp(PkObject):
     The class has to be subclassed to create custom apps.
     """
 
+    TICK_TOLERANCE: Final[float] = 1e-9  # [seconds]
+
     def __init__(
         self,
         app_name: str,
@@ -34,6 +41,17 @@ class PkApp(PkObject):
         display_arguments: dict[str, bool],
         internal_screen_size: tuple[int, int],
         fps_limit: int = 60,
+        *,
+        dirty_rendering: bool = False,
+        profile: bool = False,
+        idle: bool = False,
+        idle_timeout: float = 1.0,
+        tick_rate: int | None = None,
+        max_ticks_per_frame: int = 5,
+        clock: PkClock | None = None,
+        render_interval: int = 1,
+        coalesce_motion: bool = True,
+        auto_block: bool = False,
     ) -> None:
         """Initialize the app.
 
@@ -44,6 +62,42 @@ class PkApp(PkObject):
             display_arguments (dict[str, bool]): Arguments for the display window.
             internal_screen_size (tuple[int, int]): Size of the internal screen.
             fps_limit (int, optional): Frame rate cap. Defaults to 60.
+            dirty_rendering (bool, optional): Whether to present only the
+                regions reported with `mark_dirty` instead of the whole
+                screen every frame. Defaults to False.
+            profile (bool, optional): Whether to record the duration of each
+                frame phase in `profiler`. Defaults to False.
+            idle (bool, optional): Whether to skip frames while nothing
+                changes. The app then waits for events, and only runs a
+                frame on input or when one is requested with
+                `request_frame`. Defaults to False.
+            idle_timeout (float, optional): Maximum time to wait for a
+                frame in idle mode [seconds]. Defaults to 1.0.
+            tick_rate (int | None, optional): Number of updates per second
+                with a fixed timestep. Each update is then given the same
+                delta, independent of the frame rate. Defaults to None
+                (one update per frame, given the frame's duration).
+            max_ticks_per_frame (int, optional): Maximum number of updates
+                run to catch up in a frame with a fixed timestep. Time which
+                could not be caught up is dropped, so the app slows down
+                instead of freezing under load. Defaults to 5.
+            clock (PkClock | None, optional): Clock measuring the time
+                between frames. Pass a `PkVirtualClock` to run as fast as
+                possible with a fixed delta. Defaults to None (real time).
+            render_interval (int, optional): Render every n-th frame, or
+                never if 0. Defaults to 1.
+            coalesce_motion (bool, optional): Whether to merge consecutive
+                MOUSEMOTION events into one, see `PkEventManager`. Disable
+                it if every intermediate mouse position matters, like for
+                drawing. Defaults to True.
+            auto_block (bool, optional): Whether to block the event types
+                which no handler is subscribed to, see
+                `PkEventManager.auto_block`. Defaults to False.
+
+        Raises:
+            ValueError: If `idle_timeout`, `tick_rate` or
+                `max_ticks_per_frame` is not positive, or `render_interval`
+                is negative.
         """
         super().__init__()
 
@@ -59,6 +113,43 @@ class PkApp(PkObject):
         self.fps_limit: int = fps_limit
         self.delta_time: float = 1
 
+        # set up dirty rendering
+        self.dirty_rendering: bool = dirty_rendering
+        self.dirty_rects: list[PkRect] = []
+        self.full_redraw: bool = True
+        self._full_redraw_requested: bool = True
+
+        # set up idle mode
+        if idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive.")
+        self.idle: bool = idle
+        self.idle_timeout: float = idle_timeout
+        self._frame_requested: bool = True
+        self._frame_deadline: float | None = None  # clock time [seconds]
+        self._waiting: bool = False
+
+        # set up fixed timestep
+        if tick_rate is not None and tick_rate <= 0:
+            raise ValueError("tick_rate must be positive.")
+        if max_ticks_per_frame <= 0:
+            raise ValueError("max_ticks_per_frame must be positive.")
+        self.tick_rate: int | None = tick_rate
+        self.max_ticks_per_frame: int = max_ticks_per_frame
+        self.alpha: float = 1.0
+        self._accumulator: float = 0.0  # [seconds]
+        # events of frames without a tick, for the next tick
+        self._undelivered_events: Sequence[PkEvent] = ()
+
+        if render_interval < 0:
+            raise ValueError("render_interval must not be negative.")
+        self.render_interval: int = render_interval
+        self.frames: int = 0
+
+        # set up frame profiler
+        self.profiler: PkFrameProfiler | None = (
+            PkFrameProfiler() if profile else None
+        )
+
         self.logger.info(f"Initializing {self.app_name} {self.app_version}...")
 
         # intialize pygame
@@ -71,7 +162,9 @@ class PkApp(PkObject):
         self.internal_screen = PkSurface(self.internal_screen_size)
 
         # set up event manager
-        self.event_manager = PkEventManager(self)
+        self.event_manager = PkEventManager(
+            self, coalesce_motion=coalesce_motion, auto_block=auto_block
+        )
 
         # set window title
         self.title: str = f"{self.app_name} {self.app_version}"
@@ -86,69 +179,320 @@ class PkApp(PkObject):
         self.scene_manager = PkSceneManager(self)
 
         # set up clock
-        self.clock = pg.time.Clock()
+        self.clock: PkClock = clock if clock is not None else PkClock()
 
         self.running: bool = False
 
-    def add_font(self, name: str, path: str | None, size: int) -> None:
+    def add_font(
+        self,
+        name: str,
+        path: str | None,
+        size: int,
+        *,
+        glyph_atlas: bool = False,
+    ) -> None:
         """Add a font to the app.
 
         Args:
             name (str): Name of the font.
             path (str | None): Path to the font file. If None, use system font.
             size (int): Size of the font (px).
+            glyph_atlas (bool, optional): Whether to compose text from a glyph
+                atlas, for text that changes every frame. Defaults to False.
         """
         self.logger.debug(f"Adding font {name}...")
-        self.fonts[name] = PkFont(path, size)
+        self.fonts[name] = PkFont(path, size, glyph_atlas=glyph_atlas)
 
-    def add_sysfont(self, name: str, size: int) -> None:
+    def add_sysfont(
+        self, name: str, size: int, *, glyph_atlas: bool = False
+    ) -> None:
         """Add a system font to the app.
 
         Args:
             name (str): Name of the system font.
             size (int): Size of the font (px).
+            glyph_atlas (bool, optional): Whether to compose text from a glyph
+                atlas, for text that changes every frame. Defaults to False.
         """
         self.logger.debug(f"Adding system font {name}...")
-        self.fonts[name] = PkSysFont(name, size)
+        self.fonts[name] = PkSysFont(name, size, glyph_atlas=glyph_atlas)
+
+    def mark_dirty(
+        self, rect: PkRect | RectValue | None = None, *, wake: bool = True
+    ) -> None:
+        """Mark a region of the internal screen as changed.
+
+        Only requests a frame unless dirty rendering is enabled.
+
+        Args:
+            rect (PkRect | RectValue | None, optional): Changed region, in
+                internal screen coordinates. Defaults to None (whole screen).
+            wake (bool, optional): Whether to request a frame to show the
+                change. Regions reported while rendering are already drawn
+                and must not request another frame. Defaults to True.
+        """
+        if wake:
+            self.request_frame()
+        if not self.dirty_rendering:
+            return
 
+        if rect is None:
+            self._full_redraw_requested = True
+        else:
+            self.dirty_rects.append(PkRect.from_value(rect))
+
+    def request_frame(self, delay: float = 0) -> None:
+        """Request a frame to be run in idle mode.
+
+        Anything changing on screen without input, like an animation, has
+        to request the frames it needs. An immediate request wakes a waiting
+        app, also from other threads.
+
+        Args:
+            delay (float, optional): Time until the frame is needed
+                [seconds]. Defaults to 0 (next frame).
+        """
+        if delay > 0:
+            deadline = self.clock.time + delay
+            if self._frame_deadline is None or deadline < self._frame_deadline:
+                self._frame_deadline = deadline
+            return
+
+        self._frame_requested = True
+        if self._waiting:
+            pg.event.post(pg.event.Event(PkEventManager.WAKE_EVENT))
+
+    def _wait_for_frame(self) -> None:
+        """Block until input arrives or a frame is requested.
+
+        The time spent waiting is added to `delta_time`.
+        """
+        self._waiting = True
+        try:
+            if self._frame_requested or pg.event.peek():
+                return
+
+            timeout = self.idle_timeout
+            if self._frame_deadline is not None:
+                timeout = min(timeout, self._frame_deadline - self.clock.time)
+            if timeout > 0:
+                self.event_manager.wait(timeout)
+                self.delta_time += self.clock.tick()
+        finally:
+            self._waiting = False
+
+    @trace()
     def update(self, delta_time: float) -> None:
-        """Run update hooks."""
+        """Run update hooks.
+
+        Processes the events of the frame, then updates the current scene.
+
+        Args:
+            delta_time (float): Time since the previous update [seconds].
+        """
+        self.update_events(delta_time)
+        self.update_scene(delta_time)
+
+    def update_events(self, delta_time: float) -> None:
+        """Process the events of the frame.
+
+        Builds the input of the frame and passes it to the scene manager.
+
+        Args:
+            delta_time (float): Time since the previous frame [seconds].
+        """
         pg.display.set_caption(
             f"{self.title} - {round(self.clock.get_fps(), 2)} FPS"
         )
         self.event_manager.update(delta_time)
-        self.scene_manager.input(
-            self.event_manager.events,
-            pg.key.get_pressed(),
-            pg.mouse.get_pos(),
-            pg.mouse.get_pressed(),
-        )
+        if self.profiler is not None:
+            self.profiler.lap("events")
+
+    @trace()
+    def update_scene(self, delta_time: float) -> None:
+        """Update the current scene.
+
+        Args:
+            delta_time (float): Time since the previous update [seconds].
+        """
         self.scene_manager.current_scene.update(delta_time)
+        if self.profiler is not None:
+            self.profiler.lap("update")
+
+    def tick(self, delta_time: float) -> None:
+        """Run the updates due after `delta_time` with a fixed timestep.
+
+        The events are processed once per frame, even if no update is due.
+        Every update of the frame gets the frame's input; its events only go
+        to the first update, or to the first one of a later frame if none is
+        due.
 
-    def render(self) -> None:
-        """Render the app."""
-        self.internal_screen.fill(PkBasicPalette.WHITE)
+        Sets `alpha` to the fraction of a tick left over, for render
+        interpolation.
+
+        Args:
+            delta_time (float): Time since the previous frame [seconds].
+        """
+        if self.tick_rate is None:
+            self.update(delta_time)
+            self.alpha = 1.0
+            return
+
+        self.update_events(delta_time)
+        frame_input = self.event_manager.frame_input
+        if self._undelivered_events:
+            frame_input = frame_input._replace(
+                events=[*self._undelivered_events, *frame_input.events]
+            )
+            self._undelivered_events = ()
+
+        step = 1 / self.tick_rate
+        self._accumulator += delta_time
+        ticks = 0
+        # tolerate rounding errors, so whole ticks are never lost
+        while self._accumulator >= step - self.TICK_TOLERANCE:
+            if ticks == self.max_ticks_per_frame:
+                # drop the backlog instead of falling further behind
+                self._accumulator %= step
+                break
+            self.scene_manager.input(frame_input)
+            self.update_scene(step)
+            if frame_input.events:
+                frame_input = frame_input._replace(events=())
+            self._accumulator -= step
+            ticks += 1
+        self.alpha = max(0.0, self._accumulator / step)
+
+        if frame_input.events:
+            self._undelivered_events = frame_input.events
+            # wake up for the next tick in idle mode
+            self.request_frame(step - self._accumulator)
+
+    @trace()
+    def render(self, alpha: float = 1.0) -> None:
+        """Render the app.
+
+        Args:
+            alpha (float, optional): How far the app is between the
+                previous and the next update with a fixed timestep, from 0
+                to 1, for interpolating movement. Stored in `alpha` for the
+                scenes. Defaults to 1.0.
+        """
+        self.alpha = alpha
+        if self.dirty_rendering:
+            self.full_redraw = self._full_redraw_requested
+            self._full_redraw_requested = False
+
+        if self.full_redraw:
+            self.internal_screen.fill(PkBasicPalette.WHITE)
         self.scene_manager.current_scene.render(self.internal_screen)
+        if self.profiler is not None:
+            self.profiler.lap("render")
+
+        if self.full_redraw or self._full_redraw_requested:
+            self._present_full()
+        else:
+            self._present_dirty()
+        self.dirty_rects.clear()
 
+    def _present_full(self) -> None:
+        """Rescale the whole internal screen and flip the display."""
         scaled = pg.transform.scale(
             self.internal_screen.internal_surface, self.display_size.tuple
         )
         self.display.blit(scaled, (0, 0))
+        if self.profiler is not None:
+            self.profiler.lap("scale")
         pg.display.flip()
+        if self.profiler is not None:
+            self.profiler.lap("flip")
+
+    def _present_dirty(self) -> None:
+        """Rescale and present only the regions marked as dirty."""
+        if not self.dirty_rects:
+            return
+
+        scale_x = self.display_size.width / self.internal_screen_size.width
+        scale_y = self.display_size.height / self.internal_screen_size.height
+        screen_rect = self.internal_screen.internal_surface.get_rect()
+
+        presented: set[tuple[int, int, int, int]] = set()
+        display_rects: list[pg.Rect] = []
+        for rect in self.dirty_rects:
+            area = rect.to_pygame().clip(screen_rect)
+            if area.w == 0 or area.h == 0 or tuple(area) in presented:
+                continue
+            presented.add(tuple(area))
+
+            dest_left = round(area.left * scale_x)
+            dest_top = round(area.top * scale_y)
+            dest = pg.Rect(
+                dest_left,
+                dest_top,
+                max(1, round(area.right * scale_x) - dest_left),
+                max(1, round(area.bottom * scale_y) - dest_top),
+            )
+            scaled = pg.transform.scale(
+                self.internal_screen.internal_surface.subsurface(area),
+                dest.size,
+            )
+            self.display.blit(scaled, dest)
+            display_rects.append(dest)
+
+        if self.profiler is not None:
+            self.profiler.lap("scale")
+        pg.display.update(display_rects)
+        if self.profiler is not None:
+            self.profiler.lap("flip")
+
+    def run(
+        self, *, run_once: bool = False, duration: float | None = None
+    ) -> None:
+        """Run the app.
 
-    def run(self, *, run_once: bool = False) -> None:
-        """Run the app."""
+        Args:
+            run_once (bool, optional): Whether to run a single frame.
+                Defaults to False.
+            duration (float | None, optional): Time to run for, measured by
+                `clock`, before quitting [seconds]. Defaults to None (until
+                `quit` is called).
+        """
         self.logger.info("Running app...")
         self.running = True
+        if not self.clock.REALTIME:
+            # a virtual clock's first frame also lasts one tick
+            self.delta_time = self.clock.tick()
+        end = None if duration is None else self.clock.time + duration
+        if self.tick_rate is not None:
+            # start with one update instead of catching up on startup
+            self._accumulator = 0.0
+            self.delta_time = 1 / self.tick_rate
 
         while self.running:
             if run_once:
                 self.quit()
-            self.update(self.delta_time)
-            self.render()
-            self.delta_time = (
-                self.clock.tick(self.fps_limit) / 1000
-            )  # [seconds]
+            if self.idle and self.clock.REALTIME:
+                self._wait_for_frame()
+            self._frame_requested = False
+            if (
+                self._frame_deadline is not None
+                and self._frame_deadline <= self.clock.time
+            ):
+                self._frame_deadline = None
+            if self.profiler is not None:
+                self.profiler.start_frame()
+            self.tick(self.delta_time)
+            if (
+                self.render_interval
+                and self.frames % self.render_interval == 0
+            ):
+                self.render(self.alpha)
+            if self.profiler is not None:
+                self.profiler.end_frame()
+            self.frames += 1
+            self.delta_time = self.clock.tick(self.fps_limit)  # [seconds]
+            if end is not None and self.clock.time >= end:
+                self.quit()
 
         pg.quit()
 
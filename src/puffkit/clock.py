@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Clock module for puffkit."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+import pygame as pg
+
+from puffkit.object import PkObject
+
+
+class PkClock(PkObject):
+    """Clock class.
+
+    Measures the time between frames for the app and caps the frame rate,
+    using the real time.
+    """
+
+    REALTIME: ClassVar[bool] = True
+    """Whether the clock follows the real time, so the app can wait for it."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        super().__init__(suppress_init_log=True)
+
+        self._clock = pg.time.Clock()
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.class_name} ({self.time:.3f} s)"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<{self.class_name} time={self.time}>"
+
+    @property
+    def time(self) -> float:
+        """Time since pygame was initialized [seconds]."""
+        return pg.time.get_ticks() / 1000
+
+    def tick(self, framerate: float = 0) -> float:
+        """Mark the end of a frame.
+
+        Args:
+            framerate (float, optional): Frame rate cap; waits to keep the
+                frames from running faster. Defaults to 0 (no cap).
+
+        Returns:
+            float: Time since the previous tick [seconds].
+        """
+        return self._clock.tick(framerate) / 1000
+
+    def get_fps(self) -> float:
+        """Get the average frame rate of the last ten ticks.
+
+        Returns:
+            float: The frame rate.
+        """
+        return self._clock.get_fps()
+
+
+class PkVirtualClock(PkClock):
+    """Virtual clock class.
+
+    Every tick advances the time by a fixed step, without waiting, so the
+    app runs as fast as possible while time-based logic stays deterministic.
+    Useful for simulating or replaying thousands of seconds in tests.
+    """
+
+    REALTIME: ClassVar[bool] = False
+
+    def __init__(self, step: float = 1 / 60, start: float = 0.0) -> None:
+        """Initialize the virtual clock.
+
+        Args:
+            step (float, optional): Time each tick advances the clock by
+                [seconds]. Defaults to 1/60.
+            start (float, optional): Initial time [seconds]. Defaults to 0.
+
+        Raises:
+            ValueError: If `step` is not positive.
+        """
+        super().__init__()
+
+        if step <= 0:
+            raise ValueError("step must be positive.")
+
+        self.step: float = step
+        self._time: float = start
+
+    @property
+    def time(self) -> float:
+        """Virtual time [seconds]."""
+        return self._time
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward.
+
+        Args:
+            seconds (float): Time to add [seconds].
+        """
+        self._time += seconds
+
+    def tick(self, framerate: float = 0) -> float:
+        """Advance the clock by one step.
+
+        Args:
+            framerate (float, optional): Ignored; a virtual clock never
+                waits. Defaults to 0.
+
+        Returns:
+            float: The step [seconds].
+        """
+        self._time += self.step
+        return self.step
+
+    def get_fps(self) -> float:
+        """Get the frame rate in virtual time.
+
+        Returns:
+            float: The frame rate.
+        """
+        return 1 / self.step
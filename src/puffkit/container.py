@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import random as rnd
 
+import pygame as pg
+
 from puffkit import PkObject, PkSurface
 from puffkit.color import PkBasicPalette
+from puffkit.decorators.timing import trace
 from puffkit.geometry import PkRect, RectValue
 
 if TYPE_CHECKING:  # pragma: no cover
     from puffkit import PkApp
+    from puffkit.event import PkEvent
+    from puffkit.scene import PkFocusManager
     from puffkit.widget import PkWidget
 
 
@@ -19,8 +24,25 @@ class PkContainer(PkObject):
     """Class to represent a container for widgets.
 
     The class is used to group widgets together and manage their layout.
+
+    The container keeps its composited surface between frames and only
+    recomposites the regions of widgets that changed since the last render.
+
+    Mouse events are routed through a uniform grid of the widgets' areas,
+    only to the widgets under the mouse and those it just left, pressed or
+    focused. Keyboard events only go to the focused widget, as tracked by
+    the focus manager of the scene. Other events are not dispatched.
     """
 
+    MAX_DIRTY_RECTS: Final[int] = 64
+    HIT_CELL_SIZE: Final[int] = 64
+    POINTER_EVENTS: Final[frozenset[str]] = frozenset(
+        {"MOUSEMOTION", "MOUSEBUTTONDOWN", "MOUSEBUTTONUP"}
+    )
+    KEYBOARD_EVENTS: Final[frozenset[str]] = frozenset(
+        {"KEYDOWN", "KEYUP", "TEXTINPUT", "TEXTEDITING"}
+    )
+
     def __init__(
         self,
         app: PkApp,
@@ -29,6 +51,8 @@ class PkContainer(PkObject):
         rect: PkRect | RectValue,
         *,
         draw_outline: bool = False,
+        parent_widget: PkWidget | None = None,
+        focus_manager: PkFocusManager | None = None,
     ):
         """Initialize the container.
 
@@ -38,12 +62,30 @@ class PkContainer(PkObject):
             id_ (str): The ID of the container.
             rect (PkRect | RectValue): The rectangle that the container occupies.
             draw_outline (bool): Whether to draw an outline around the container.
+            parent_widget (PkWidget | None): The widget whose surface the
+                container draws on, if any. Changes inside the container are
+                reported to that widget instead of the app.
+            focus_manager (PkFocusManager | None): The focus manager of the
+                scene the container belongs to. Defaults to None (the one of
+                the parent widget's container, else of the scene being
+                loaded, else of the current scene).
         """
         super().__init__()
         self.app: PkApp = app
         self.id: str = id_
         self.draw_outline: bool = draw_outline
         self.parent_surface: PkSurface = parent_surface
+        self.parent_widget: PkWidget | None = parent_widget
+        if focus_manager is None:
+            if parent_widget is not None:
+                focus_manager = parent_widget.container.focus_manager
+            else:
+                scene_manager = app.scene_manager
+                scene = (
+                    scene_manager.loading_scene or scene_manager.current_scene
+                )
+                focus_manager = scene.focus_manager
+        self.focus_manager: PkFocusManager = focus_manager
 
         self.widgets: dict[str, PkWidget] = {}
 
@@ -77,6 +119,18 @@ class PkContainer(PkObject):
 
         self.surface: PkSurface = PkSurface(self.rect.size, transparent=True)
 
+        self._dirty_rects: list[PkRect] = []
+        self._full_dirty: bool = True
+        # what the parent surface looks like under the container
+        self._background: pg.Surface | None = None
+
+        # grid cell -> widgets overlapping it, built on first use
+        self._hit_grid: dict[tuple[int, int], list[PkWidget]] | None = None
+        # widgets hit by the previous mouse motion
+        self._hovered: list[PkWidget] = []
+        # widgets hit by the previous mouse button press
+        self._pressed: list[PkWidget] = []
+
         # create an outline surface if needed (for debugging)
         if self.draw_outline:
             self.outline_surface: PkSurface = PkSurface(
@@ -121,6 +175,8 @@ class PkContainer(PkObject):
                 f"Widget with ID '{widget.id}' already exists in the container."
             )
         self.widgets[widget.id] = widget
+        self._hit_grid = None
+        widget.mark_dirty()
 
     def remove_widget(self, id_: str) -> None:
         """Remove a widget from the container.
@@ -133,7 +189,13 @@ class PkContainer(PkObject):
             raise ValueError(
                 f"Widget with ID '{id_}' does not exist in the container."
             )
-        del self.widgets[id_]
+        widget = self.widgets.pop(id_)
+        self._hit_grid = None
+        self._hovered = [w for w in self._hovered if w is not widget]
+        self._pressed = [w for w in self._pressed if w is not widget]
+        if self.focus_manager.focused is widget:
+            self.focus_manager.unfocus()
+        self.mark_dirty()
 
     def get_widget(self, id_: str) -> PkWidget:
         """Get a widget from the container.
@@ -150,23 +212,169 @@ class PkContainer(PkObject):
             )
         return self.widgets[id_]
 
+    def mark_dirty(self, rect: PkRect | RectValue | None = None) -> None:
+        """Mark a region of the container for recompositing.
+
+        The region is reported to the parent widget right away, or to the app
+        once it has been recomposited and drawn on the parent surface. A frame
+        is requested from the app, so the change is shown in idle mode.
+
+        Args:
+            rect (PkRect | RectValue | None): The changed region, relative to
+                the container. Defaults to None (whole container).
+        """
+        if rect is None or len(self._dirty_rects) >= self.MAX_DIRTY_RECTS:
+            self._full_dirty = True
+            self._dirty_rects.clear()
+        elif not self._full_dirty:
+            self._dirty_rects.append(PkRect.from_value(rect))
+
+        if self.parent_widget is not None:
+            self.parent_widget.mark_dirty()
+        self.app.request_frame()
+
+    def invalidate_hit_index(self) -> None:
+        """Rebuild the hit-testing grid before the next mouse event.
+
+        Call this after moving or resizing widgets.
+        """
+        self._hit_grid = None
+
+    def hit_test(self, pos: tuple[float, float]) -> list[PkWidget]:
+        """Get the widgets at a position.
+
+        Args:
+            pos (tuple[float, float]): The position, in the coordinates of
+                the widgets' `abs_rect`.
+
+        Returns:
+            list[PkWidget]: The widgets whose `abs_rect` contains the
+                position, in the order they were added.
+        """
+        grid = self._hit_grid
+        if grid is None:
+            grid = self._hit_grid = self._build_hit_grid()
+
+        size = self.HIT_CELL_SIZE
+        candidates = grid.get((int(pos[0] // size), int(pos[1] // size)))
+        if not candidates:
+            return []
+        return [w for w in candidates if w.abs_rect.collidepoint(pos)]
+
+    def _build_hit_grid(self) -> dict[tuple[int, int], list[PkWidget]]:
+        """Sort the widgets into the cells of the hit-testing grid.
+
+        Returns:
+            dict[tuple[int, int], list[PkWidget]]: The widgets overlapping
+                each grid cell.
+        """
+        size = self.HIT_CELL_SIZE
+        grid: dict[tuple[int, int], list[PkWidget]] = {}
+        for widget in self.widgets.values():
+            rect = widget.abs_rect
+            for x in range(
+                int(rect.left // size), int(rect.right // size) + 1
+            ):
+                for y in range(
+                    int(rect.top // size), int(rect.bottom // size) + 1
+                ):
+                    grid.setdefault((x, y), []).append(widget)
+        return grid
+
+    def _route_pointer_event(self, event: PkEvent) -> None:
+        """Dispatch a mouse event to the widgets it concerns.
+
+        Widgets which the mouse left, and the pressed and focused widgets
+        not under the mouse, get the event as a miss; the widgets under the
+        mouse get it as a hit.
+
+        Args:
+            event (PkEvent): The mouse event.
+        """
+        hits = self.hit_test(event.pos)
+
+        name = event.name
+        if name == "MOUSEMOTION":
+            missed = self._hovered
+            self._hovered = hits
+        else:
+            missed = self._pressed
+            self._pressed = hits if name == "MOUSEBUTTONDOWN" else []
+            focused = self.focus_manager.focused
+            if (
+                name == "MOUSEBUTTONDOWN"
+                and focused is not None
+                and focused.container is self
+                and focused not in missed
+            ):
+                missed = [*missed, focused]
+
+        for widget in missed:
+            if widget not in hits:
+                widget.handle_event(event, False)
+        for widget in hits:
+            widget.handle_event(event, True)
+
+    @trace()
     def update(self, delta: float) -> None:
         """Update the container.
 
+        Dispatches the input events to the widgets, then updates them.
+        Keyboard events only go to the focused widget. Other events are not
+        dispatched, since `PkWidget.handle_event` ignores them; the widgets
+        still get them through their input.
+
         Args:
             delta (float): The time delta.
         """
-        for widget in self.widgets.values():
-            widget.input(
-                self._input["events"],
-                self._input["keys"],
-                self._input["mouse_pos"],
-                self._input["mouse_buttons"],
-            )
-            widget.update(delta)
+        frame_input = self._input
+        events = frame_input.events
+        widgets = self.widgets.values()
+        for widget in widgets:
+            widget.input(frame_input)
+
+        for event in events:
+            if event.name in self.POINTER_EVENTS:
+                self._route_pointer_event(event)
+            elif event.name in self.KEYBOARD_EVENTS:
+                # a click may have moved the focus since the previous event
+                focused = self.focus_manager.focused
+                if focused is not None and focused.container is self:
+                    focused.handle_event(event)
+
+        for widget in widgets:
+            widget.update(delta, dispatch=False)
 
     def render(self) -> None:
-        """Render the container."""
+        """Render the container.
+
+        Only the regions marked dirty are recomposited. The container is then
+        drawn on the parent surface: whole, or only the recomposited regions
+        when the parent surface kept the previous frame (dirty rendering).
+        """
+        if self._full_dirty:
+            regions = self._composite_all()
+        else:
+            regions = self._composite_dirty()
+
+        if (
+            self.parent_widget is not None
+            or self._background is None
+            or self.app.full_redraw
+        ):
+            self._draw_all()
+        else:
+            self._draw_regions(regions)
+
+    def _composite_all(self) -> list[pg.Rect]:
+        """Recomposite the whole container surface.
+
+        Returns:
+            list[pg.Rect]: The recomposited region (the whole container).
+        """
+        self._full_dirty = False
+        self._dirty_rects.clear()
+
         self.surface.fill(PkBasicPalette.TRANSPARENT)
 
         if self.draw_outline:
@@ -175,4 +383,65 @@ class PkContainer(PkObject):
         for widget in self.widgets.values():
             widget.render()
 
+        return [self.surface.internal_surface.get_rect()]
+
+    def _composite_dirty(self) -> list[pg.Rect]:
+        """Recomposite the regions marked dirty since the last render.
+
+        Returns:
+            list[pg.Rect]: The recomposited regions, relative to the
+                container.
+        """
+        bounds = self.surface.internal_surface.get_rect()
+        regions: list[pg.Rect] = []
+        for rect in self._dirty_rects:
+            region = rect.to_pygame().clip(bounds)
+            if region.w and region.h and region not in regions:
+                regions.append(region)
+        # widgets marked dirty while rendering are handled next frame
+        self._dirty_rects = []
+
+        for region in regions:
+            self.surface.set_clip(region)
+            self.surface.fill(PkBasicPalette.TRANSPARENT, region)
+
+            if self.draw_outline:
+                self.surface.blit(self.outline_surface, (0, 0))
+
+            for widget in self.widgets.values():
+                if region.colliderect(widget.rect.inflate(2, 2).to_pygame()):
+                    widget.render()
+        self.surface.set_clip(None)
+
+        return regions
+
+    def _draw_all(self) -> None:
+        """Draw the whole container on the parent surface."""
+        if self.parent_widget is None:
+            if self.app.dirty_rendering:
+                self._background = (
+                    self.parent_surface.internal_surface.subsurface(
+                        self.rect.to_pygame()
+                    ).copy()
+                )
+            self.app.mark_dirty(self.rect, wake=False)
+
         self.parent_surface.blit(self.surface, self.rect.pos)
+
+    def _draw_regions(self, regions: list[pg.Rect]) -> None:
+        """Draw regions of the container on the parent surface.
+
+        The parent surface is restored from the background captured by
+        `_draw_all` first, since the container is transparent.
+
+        Args:
+            regions (list[pg.Rect]): The regions to draw, relative to the
+                container.
+        """
+        for region in regions:
+            dest = (self.rect.x + region.x, self.rect.y + region.y)
+            self.parent_surface.internal_surface.blit(
+                self._background, dest, region
+            )
+            self.parent_surface.blit(self.surface, dest, region)
+            self.app.mark_dirty((*dest, region.w, region.h), wake=False)
@@ -3,10 +3,310 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
 import logging as lg
+import os
+import queue
+import random
+import threading
 import time as t
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Final, TextIO
+
+
+class PkTimingStat:
+    """Timing statistics of a single name.
+
+    Durations are counted in a log-linear (HDR-style) histogram: exact below
+    `2 ** SUB_BUCKET_BITS` nanoseconds, then `2 ** (SUB_BUCKET_BITS - 1)`
+    buckets per power of two, so percentiles are within about 2% of the
+    recorded values while memory stays bounded.
+    """
+
+    SUB_BUCKET_BITS: Final[int] = 6
+
+    def __init__(self, name: str) -> None:
+        """Initialize the statistics.
+
+        Args:
+            name (str): The name the durations are recorded under.
+        """
+        self.name: str = name
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.min_ns: int = 0
+        self.max_ns: int = 0
+        # bucket index -> count
+        self.buckets: dict[int, int] = {}
+
+    def record(self, duration_ns: int) -> None:
+        """Record a duration.
+
+        Args:
+            duration_ns (int): The duration [ns].
+        """
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.count += 1
+        self.total_ns += duration_ns
+
+        index = self._bucket_index(duration_ns)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentile(self, percentile: float) -> int:
+        """Get a percentile of the recorded durations.
+
+        Args:
+            percentile (float): The percentile, between 0 and 100.
+
+        Returns:
+            int: The duration at the percentile [ns], 0 if nothing was
+                recorded.
+        """
+        if self.count == 0:
+            return 0
+
+        rank = max(1, -(-percentile * self.count // 100))
+        if rank >= self.count:
+            return self.max_ns
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(
+                    max(self._bucket_value(index), self.min_ns), self.max_ns
+                )
+        return self.max_ns  # pragma: no cover
+
+    def snapshot(self) -> dict[str, float]:
+        """Get the statistics in seconds.
+
+        Returns:
+            dict[str, float]: The "count", "total", "mean", "min", "max",
+                "p50", "p95" and "p99" of the recorded durations.
+        """
+        return {
+            "count": self.count,
+            "total": self.total_ns / 1e9,
+            "mean": self.total_ns / self.count / 1e9 if self.count else 0.0,
+            "min": self.min_ns / 1e9,
+            "max": self.max_ns / 1e9,
+            "p50": self.percentile(50) / 1e9,
+            "p95": self.percentile(95) / 1e9,
+            "p99": self.percentile(99) / 1e9,
+        }
+
+    @classmethod
+    def _bucket_index(cls, value: int) -> int:
+        """Get the histogram bucket of a duration.
+
+        Args:
+            value (int): The duration [ns].
+
+        Returns:
+            int: Index of the bucket.
+        """
+        linear = 1 << cls.SUB_BUCKET_BITS
+        if value < linear:
+            return max(value, 0)
+
+        half = linear >> 1
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        return linear + (shift - 1) * half + (value >> shift) - half
+
+    @classmethod
+    def _bucket_value(cls, index: int) -> int:
+        """Get the duration in the middle of a histogram bucket.
+
+        Args:
+            index (int): Index of the bucket.
+
+        Returns:
+            int: The duration [ns].
+        """
+        linear = 1 << cls.SUB_BUCKET_BITS
+        if index < linear:
+            return index
+
+        half = linear >> 1
+        shift, sub_bucket = divmod(index - linear, half)
+        shift += 1
+        return ((half + sub_bucket) << shift) + (1 << shift) // 2
+
+
+class PkTimingRegistry:
+    """Timing registry class.
+
+    Aggregates durations recorded under names into `PkTimingStat`s instead of
+    logging every call, so timing hot functions is cheap enough to leave on.
+    The registry can be fed from several threads; recording takes a lock,
+    which is uncontended unless other threads record at the same time.
+
+    When `flush_interval` is set, the statistics are flushed every
+    `flush_interval` seconds: passed to `on_flush` (or logged if not set) and
+    then reset, so each flush covers one interval.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float | None = None,
+        on_flush: Callable[[dict[str, dict[str, float]]], None] | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            flush_interval (float | None, optional): Seconds between flushes.
+                Defaults to None (never flushed automatically).
+            on_flush (Callable[[dict[str, dict[str, float]]], None] | None,
+                optional): Called with the snapshot on each flush.
+                Defaults to None (the report is logged).
+        """
+        self.logger = lg.getLogger(f"{__name__}.{type(self).__name__}")
+
+        self.flush_interval: float | None = flush_interval
+        self.on_flush = on_flush
+        self.stats: dict[str, PkTimingStat] = {}
+        self._last_flush_ns: int = t.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def record(
+        self, name: str, duration_ns: int, now_ns: int | None = None
+    ) -> None:
+        """Record a duration under a name.
+
+        Args:
+            name (str): The name.
+            duration_ns (int): The duration [ns].
+            now_ns (int | None, optional): The current `time.perf_counter_ns`,
+                if known. Used to check if a flush is due.
+        """
+        with self._lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                stat = self.stats[name] = PkTimingStat(name)
+            stat.record(duration_ns)
+
+            if self.flush_interval is None:
+                return
+            if now_ns is None:
+                now_ns = t.perf_counter_ns()
+            if now_ns - self._last_flush_ns < self.flush_interval * 1e9:
+                return
+            stats = self._swap(now_ns)
+        self._pass_on(stats)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Get the statistics of all names.
+
+        Returns:
+            dict[str, dict[str, float]]: Statistics of each name, see
+                `PkTimingStat.snapshot`.
+        """
+        with self._lock:
+            return self._snapshot(self.stats)
+
+    @staticmethod
+    def _snapshot(
+        stats: dict[str, PkTimingStat],
+    ) -> dict[str, dict[str, float]]:
+        """Get the statistics of all names of a set of stats.
+
+        Args:
+            stats (dict[str, PkTimingStat]): The stats.
+
+        Returns:
+            dict[str, dict[str, float]]: Statistics of each name.
+        """
+        return {name: stat.snapshot() for name, stat in stats.items()}
+
+    def report(self) -> str:
+        """Format the statistics of all names as a table.
+
+        Returns:
+            str: The report, slowest total time first.
+        """
+        return self._format(self.snapshot())
+
+    @staticmethod
+    def _format(snapshot: dict[str, dict[str, float]]) -> str:
+        """Format statistics as a table.
+
+        Args:
+            snapshot (dict[str, dict[str, float]]): Statistics of each name.
+
+        Returns:
+            str: The table, slowest total time first.
+        """
+        lines = [
+            (
+                f"{'name':<48} {'count':>8} {'total':>10} {'mean':>10}"
+                f" {'p50':>10} {'p95':>10} {'p99':>10} {'max':>10}"
+            )
+        ]
+        for name, stats in sorted(
+            snapshot.items(), key=lambda item: -item[1]["total"]
+        ):
+            lines.append(
+                f"{name:<48} {stats['count']:>8}"
+                + "".join(
+                    f" {stats[key] * 1000:>8.3f}ms"
+                    for key in ("total", "mean", "p50", "p95", "p99", "max")
+                )
+            )
+        return "\n".join(lines)
+
+    def flush(self, now_ns: int | None = None) -> None:
+        """Pass the statistics on and start a new interval.
+
+        Args:
+            now_ns (int | None, optional): The current `time.perf_counter_ns`,
+                if known.
+        """
+        with self._lock:
+            stats = self._swap(
+                now_ns if now_ns is not None else t.perf_counter_ns()
+            )
+        self._pass_on(stats)
+
+    def _swap(self, now_ns: int) -> dict[str, PkTimingStat]:
+        """Start a new interval. Called with the lock held.
+
+        Args:
+            now_ns (int): The current `time.perf_counter_ns`.
+
+        Returns:
+            dict[str, PkTimingStat]: The stats of the finished interval.
+        """
+        stats = self.stats
+        self.stats = {}
+        self._last_flush_ns = now_ns
+        return stats
+
+    def _pass_on(self, stats: dict[str, PkTimingStat]) -> None:
+        """Pass the stats of a finished interval to `on_flush`, or log them.
+
+        Called without the lock, so `on_flush` may record durations.
+
+        Args:
+            stats (dict[str, PkTimingStat]): The stats.
+        """
+        snapshot = self._snapshot(stats)
+        if self.on_flush is not None:
+            self.on_flush(snapshot)
+        else:
+            self.logger.debug(f"Timings:\n{self._format(snapshot)}")
+
+    def reset(self) -> None:
+        """Forget all recorded durations."""
+        with self._lock:
+            self.stats = {}
+
+
+timing_registry = PkTimingRegistry()
+"""Default timing registry, fed by `measure_execution_time` and named `Timer`
+blocks."""
 
 
 def measure_execution_time(
@@ -14,29 +314,225 @@ def measure_execution_time(
 ) -> Callable[..., object]:
     """Measure the execution time of a function.
 
+    The durations are recorded in `timing_registry` under the qualified name
+    of the function.
+
     Args:
         func (Callable[..., object]): The function to measure.
 
     Returns:
         Callable[..., object]: The wrapped function.
     """
-    logger = lg.getLogger(f"{__name__}.{func.__name__}")
+    name = func.__qualname__
 
     @wraps(func)
     def wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
         """Wrap the function."""
-        start = t.perf_counter()
-        result = func(*args, **kwargs)
-        end = t.perf_counter()
-        logger.debug(f"{func.__name__} took {end - start} seconds to run.")
-        return result
+        start = t.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = t.perf_counter_ns()
+            timing_registry.record(name, end - start, end)
 
     return wrapper
 
 
+class PkTracer:
+    """Tracer class.
+
+    Records nested spans of execution and streams them to a file in the
+    Chrome Trace Event format, viewable in `chrome://tracing` or Perfetto.
+    Events are written by a background thread, so recording a span only
+    costs a queue put.
+
+    Top-level spans are sampled with `sample_rate`; nested spans follow the
+    decision of their top-level span, so sampled traces are complete.
+
+    Usage:
+    ```python
+    tracer.start("trace.json", sample_rate=0.1)
+    ...
+    tracer.stop()
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.logger = lg.getLogger(f"{__name__}.{type(self).__name__}")
+
+        self.active: bool = False
+        self.sample_rate: float = 1.0
+        self.path: str | None = None
+
+        self._queue: queue.SimpleQueue[dict[str, Any] | None] = (
+            queue.SimpleQueue()
+        )
+        self._thread: threading.Thread | None = None
+        self._local = threading.local()
+        self._pid: int = os.getpid()
+
+    def start(self, path: str, *, sample_rate: float = 1.0) -> None:
+        """Start recording spans to a file.
+
+        Args:
+            path (str): Path of the trace file. Overwritten if it exists.
+            sample_rate (float, optional): Fraction of top-level spans to
+                record. Defaults to 1.0 (all).
+
+        Raises:
+            RuntimeError: If tracing is already started.
+            ValueError: If `sample_rate` is not between 0 and 1.
+        """
+        if self.active:
+            raise RuntimeError("Tracing is already started.")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1.")
+
+        self.logger.info(f"Tracing to {path}...")
+        with contextlib.ExitStack() as stack:
+            # closed here if the writer thread fails to start
+            file = stack.enter_context(open(path, "w", encoding="utf-8"))
+            file.write("[\n")
+
+            events: queue.SimpleQueue[dict[str, Any] | None] = (
+                queue.SimpleQueue()
+            )
+            thread = threading.Thread(
+                target=self._write,
+                args=(file, events),
+                name="puffkit-tracer",
+                daemon=True,
+            )
+            thread.start()
+            # the writer thread owns the file from now on
+            stack.pop_all()
+
+        self.path = path
+        self.sample_rate = sample_rate
+        self._queue = events
+        self._thread = thread
+        self.active = True
+
+    def stop(self) -> None:
+        """Stop recording and finish writing the trace file."""
+        if not self.active:
+            return
+
+        self.active = False
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self.logger.info(f"Trace written to {self.path}.")
+
+    def enter(self) -> bool:
+        """Enter a span on the current thread.
+
+        Returns:
+            bool: Whether the span is sampled and should be recorded.
+        """
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth == 0:
+            local.sampled = (
+                self.sample_rate >= 1 or random.random() < self.sample_rate
+            )
+        local.depth = depth + 1
+        return local.sampled
+
+    def exit(
+        self, name: str, category: str, start: int, end: int, sampled: bool
+    ) -> None:
+        """Exit a span on the current thread and record it if sampled.
+
+        Args:
+            name (str): Name of the span.
+            category (str): Category of the span.
+            start (int): Start time from `time.perf_counter_ns` [ns].
+            end (int): End time from `time.perf_counter_ns` [ns].
+            sampled (bool): The value returned by `enter` for the span.
+        """
+        self._local.depth -= 1
+        if sampled and self.active:
+            self._queue.put(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": start / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": self._pid,
+                    "tid": threading.get_ident(),
+                }
+            )
+
+    @staticmethod
+    def _write(
+        file: TextIO, events: queue.SimpleQueue[dict[str, Any] | None]
+    ) -> None:
+        """Write queued events to the trace file until stopped.
+
+        Args:
+            file (TextIO): The trace file, closed when writing stops.
+            events (queue.SimpleQueue[dict[str, Any] | None]): The event
+                queue. None stops writing.
+        """
+        with file:
+            separator = ""
+            while (event := events.get()) is not None:
+                file.write(separator + json.dumps(event))
+                separator = ",\n"
+            file.write("\n]\n")
+
+
+tracer = PkTracer()
+"""Default tracer, used by `trace` and named `Timer` blocks."""
+
+
+def trace(
+    name: str | None = None, category: str = "puffkit"
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Record calls of a function as spans while tracing is started.
+
+    Args:
+        name (str | None, optional): Name of the span. Defaults to the
+            qualified name of the function.
+        category (str, optional): Category of the span.
+            Defaults to "puffkit".
+
+    Returns:
+        Callable[[Callable[..., Any]], Callable[..., Any]]: The decorator.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name if name is not None else func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Wrap the function."""
+            if not tracer.active:
+                return func(*args, **kwargs)
+
+            sampled = tracer.enter()
+            start = t.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.exit(
+                    span_name, category, start, t.perf_counter_ns(), sampled
+                )
+
+        return wrapper
+
+    return decorator
+
+
 class Timer:
     """Timer context class.
 
+    The duration of a named timer is recorded in `timing_registry`, and the
+    timer is recorded as a span while tracing is started.
+
     Usage:
     ```python
     with Timer() as t:
@@ -45,16 +541,37 @@ class Timer:
     ```
     """
 
-    def __init__(self) -> None:
-        """Initialize the timer."""
-        pass
+    def __init__(
+        self, name: str | None = None, category: str = "puffkit"
+    ) -> None:
+        """Initialize the timer.
+
+        Args:
+            name (str | None, optional): Name to record the duration and
+                span under. Defaults to None (not recorded).
+            category (str, optional): Category of the span.
+                Defaults to "puffkit".
+        """
+        self.name = name
+        self.category = category
 
     def __enter__(self) -> Timer:
         """Enter the context."""
-        self.start = t.perf_counter()
+        self._traced = self.name is not None and tracer.active
+        if self._traced:
+            self._sampled = tracer.enter()
+        self._start_ns = t.perf_counter_ns()
+        self.start = self._start_ns / 1e9
         return self
 
     def __exit__(self, *args: tuple[Any]) -> None:
         """Exit the context."""
-        self.end = t.perf_counter()
-        self.elapsed = self.end - self.start
+        end_ns = t.perf_counter_ns()
+        self.end = end_ns / 1e9
+        self.elapsed = (end_ns - self._start_ns) / 1e9
+        if self.name is not None:
+            timing_registry.record(self.name, end_ns - self._start_ns, end_ns)
+        if self._traced:
+            tracer.exit(
+                self.name, self.category, self._start_ns, end_ns, self._sampled
+            )
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from .event import PkEvent
-from .event_manager import PkEventManager
+from .event import PkEvent, PkKeyEvent, PkMouseEvent, PkTextEvent
+from .event_manager import PkEventManager, PkEventSubscription
 
 __all__ = [
     "PkEvent",
+    "PkKeyEvent",
+    "PkMouseEvent",
+    "PkTextEvent",
     "PkEventManager",
+    "PkEventSubscription",
 ]
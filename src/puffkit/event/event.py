@@ -3,43 +3,90 @@
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from typing import Any, ClassVar
 
 import pygame as pg
 
+# event type -> interned upper case name
+_event_names: dict[int, str] = {}
+
+
+def event_name(type_: int) -> str:
+    """Get the interned upper case name of an event type.
+
+    Args:
+        type_ (int): The event type.
+
+    Returns:
+        str: The name, e.g. "MOUSEMOTION".
+    """
+    name = _event_names.get(type_)
+    if name is None:
+        name = _event_names[type_] = sys.intern(
+            pg.event.event_name(type_).upper()
+        )
+    return name
+
 
 class PkEvent:
     """Event class for puffkit.
 
-    Represents an event in the event queue.
+    Represents an event in the event queue. The values of the event
+    dictionary can be read and written as attributes; the dictionary is
+    their only storage.
     """
 
-    def __init__(self, name: str, dict: dict[str, Any], **kwargs: Any) -> None:
+    __slots__ = ("dict", "name", "type")
+
+    dict: dict[str, Any]
+    """The event dictionary."""
+    name: str
+    """The upper case name of the event type."""
+    type: int
+    """The pygame event type."""
+
+    # event type -> event class, see `from_pygame`
+    classes: ClassVar[dict[int, type[PkEvent]]] = {}
+
+    def __init__(
+        self,
+        name: str,
+        dict: dict[str, Any],
+        *,
+        type_: int = pg.NOEVENT,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the event class.
 
         Args:
             name (str): The name of the event.
             dict (dict[str, Any]): The event dictionary.
-            **kwargs (Any): Additional arguments.
+            type_ (int, optional): The pygame event type. Defaults to
+                pg.NOEVENT.
+            **kwargs (Any): Additional values, added to the dictionary.
         """
-        self.name = name
-        self.dict = dict
-        self.__dict__.update(dict)
-
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        # slots are set directly, bypassing `__setattr__`
+        _set_name(self, sys.intern(name))
+        _set_type(self, type_)
+        _set_dict(self, {**dict, **kwargs} if kwargs else dict)
 
     @classmethod
     def from_pygame(cls, event: Any) -> PkEvent:
         """Create a PkEvent from a Pygame event.
 
+        Called on `PkEvent`, the event class registered for the event type
+        in `classes` is used.
+
         Args:
             event (Any): The Pygame event.
 
         Returns:
             PkEvent: The PkEvent.
         """
-        return cls(pg.event.event_name(event.type).upper(), event.dict)
+        type_ = event.type
+        event_class = cls.classes.get(type_, cls) if cls is PkEvent else cls
+        return event_class(event_name(type_), event.dict, type_=type_)
 
     def __str__(self) -> str:  # pragma: no cover
         """Return the string representation of the event.
@@ -47,7 +94,7 @@ class PkEvent:
         Returns:
             str: The string representation of the event.
         """
-        return f"<PkEvent name={self.name} dict={self.dict}>"
+        return f"<{type(self).__name__} name={self.name} dict={self.dict}>"
 
     def __repr__(self) -> str:  # pragma: no cover
         """Return the string representation of the event.
@@ -55,35 +102,62 @@ class PkEvent:
         Returns:
             str: The string representation of the event.
         """
-        return f"<PkEvent name={self.name} dict={self.dict}>"
+        return f"<{type(self).__name__} name={self.name} dict={self.dict}>"
 
-    def __getattribute__(self, name: str) -> Any:
-        """Get an attribute from the event.
+    def __getattr__(self, name: str) -> Any:
+        """Get a value of the event dictionary.
+
+        Only called for names which are not attributes of the event.
 
         Args:
-            name (str): The name of the attribute to get.
+            name (str): The name of the value to get.
+
+        Raises:
+            AttributeError: If the event has no such value.
 
         Returns:
-            any: The attribute value.
+            Any: The value.
         """
-        return super().__getattribute__(name)
+        if name in PkEvent.__slots__:
+            # not initialized yet
+            raise AttributeError(name)
+        try:
+            return self.dict[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__} {self.name} has no attribute {name!r}"
+            ) from None
 
     def __setattr__(self, name: str, value: Any) -> None:
-        """Set an attribute in the event.
+        """Set a value of the event dictionary.
 
         Args:
-            name (str): The name of the attribute to set.
-            value (any): The value to set the attribute to.
+            name (str): The name of the value to set.
+            value (Any): The value.
         """
-        super().__setattr__(name, value)
+        if name in PkEvent.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            self.dict[name] = value
 
     def __delattr__(self, name: str) -> None:
-        """Delete an attribute from the event.
+        """Delete a value of the event dictionary.
 
         Args:
-            name (str): The name of the attribute to delete.
+            name (str): The name of the value to delete.
+
+        Raises:
+            AttributeError: If the event has no such value.
         """
-        super().__delattr__(name)
+        if name in PkEvent.__slots__:
+            object.__delattr__(self, name)
+            return
+        try:
+            del self.dict[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__} {self.name} has no attribute {name!r}"
+            ) from None
 
     def __bool__(self) -> bool:
         """Return whether the event is truthy.
@@ -92,3 +166,92 @@ class PkEvent:
             bool: Whether the event is truthy.
         """
         return True
+
+
+class PkKeyEvent(PkEvent):
+    """Key event class for puffkit.
+
+    Represents a KEYDOWN or KEYUP event.
+    """
+
+    __slots__ = ()
+
+    @property
+    def key(self) -> Any:
+        """The key, its name once converted by the event manager."""
+        return self.dict.get("key")
+
+    @property
+    def mod(self) -> int:
+        """The pressed modifier keys."""
+        return self.dict.get("mod", 0)
+
+    @property
+    def unicode(self) -> str:
+        """The typed character, if any."""
+        return self.dict.get("unicode", "")
+
+    @property
+    def scancode(self) -> int:
+        """The physical key code."""
+        return self.dict.get("scancode", 0)
+
+
+class PkMouseEvent(PkEvent):
+    """Mouse event class for puffkit.
+
+    Represents a MOUSEMOTION, MOUSEBUTTONDOWN or MOUSEBUTTONUP event.
+    """
+
+    __slots__ = ()
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        """The mouse position."""
+        return self.dict.get("pos", (0, 0))
+
+    @property
+    def rel(self) -> tuple[float, float]:
+        """The relative motion."""
+        return self.dict.get("rel", (0, 0))
+
+    @property
+    def buttons(self) -> tuple[int, ...]:
+        """The pressed state of the mouse buttons."""
+        return self.dict.get("buttons", (0, 0, 0))
+
+    @property
+    def button(self) -> int:
+        """The pressed or released button."""
+        return self.dict.get("button", 0)
+
+
+class PkTextEvent(PkEvent):
+    """Text event class for puffkit.
+
+    Represents a TEXTINPUT or TEXTEDITING event.
+    """
+
+    __slots__ = ()
+
+    @property
+    def text(self) -> str:
+        """The text."""
+        return self.dict.get("text", "")
+
+
+_set_name = PkEvent.name.__set__  # type: ignore[attr-defined]
+_set_type = PkEvent.type.__set__  # type: ignore[attr-defined]
+_set_dict = PkEvent.dict.__set__  # type: ignore[attr-defined]
+
+PkEvent.classes.update(
+    {
+        pg.KEYDOWN: PkKeyEvent,
+        pg.KEYUP: PkKeyEvent,
+        pg.MOUSEMOTION: PkMouseEvent,
+        pg.MOUSEBUTTONDOWN: PkMouseEvent,
+        pg.MOUSEBUTTONUP: PkMouseEvent,
+        pg.TEXTINPUT: PkTextEvent,
+        pg.TEXTEDITING: PkTextEvent,
+    }
+)
@@ -6,29 +6,182 @@ from __future__ import annotations
 import logging as lg
 import pygame as pg
 
-from typing import TYPE_CHECKING, Any
+from bisect import insort
+from collections.abc import Callable
+from itertools import count
+from typing import TYPE_CHECKING, Any, ClassVar, Final
 
 from puffkit.event import PkEvent
+from puffkit.frame_input import EMPTY_FRAME_INPUT, PkFrameInput
 
 if TYPE_CHECKING:  # pragma: no cover
     from puffkit.app import PkApp
 
 
+type EventHandler = Callable[[PkEvent], Any]
+
+
+class PkEventSubscription:
+    """Subscription of a handler to an event type.
+
+    Returned by `PkEventManager.subscribe`, and used to unsubscribe.
+    """
+
+    __slots__ = ("active", "event_type", "handler", "once", "priority", "seq")
+
+    def __init__(
+        self,
+        event_type: int | None,
+        handler: EventHandler,
+        priority: int,
+        once: bool,
+        seq: int,
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+            event_type (int | None): The pygame event type, or None for all
+                events.
+            handler (EventHandler): The handler.
+            priority (int): The priority; higher priorities run first.
+            once (bool): Whether to unsubscribe after the first event.
+            seq (int): Order of subscribing, for equal priorities.
+        """
+        self.event_type = event_type
+        self.handler = handler
+        self.priority = priority
+        self.once = once
+        self.seq = seq
+        self.active: bool = True
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"<PkEventSubscription event_type={self.event_type}"
+            f" handler={self.handler} priority={self.priority}"
+            f" once={self.once} active={self.active}>"
+        )
+
+    def sort_key(self) -> tuple[int, int]:
+        """Get the key ordering subscriptions by dispatch order.
+
+        Returns:
+            tuple[int, int]: The key.
+        """
+        return (-self.priority, self.seq)
+
+
 class PkEventManager:
     """Event manager class for puffkit.
 
     The event manager is responsible for managing the events in the app.
+    Handlers subscribe to pygame event types with `subscribe`; every event
+    type has its list of subscriptions, including the wildcard ones, sorted
+    by priority, so dispatching an event is a single dictionary lookup.
     """
 
-    def __init__(self, app: PkApp) -> None:
-        """Initialize the event manager class."""
+    WAKE_EVENT: Final[int] = pg.event.custom_type()
+    """Event type posted to wake the app from `wait`; never dispatched."""
+
+    INPUT_EVENTS: Final[frozenset[int]] = frozenset(
+        {
+            pg.KEYDOWN,
+            pg.KEYUP,
+            pg.MOUSEMOTION,
+            pg.MOUSEBUTTONDOWN,
+            pg.MOUSEBUTTONUP,
+            pg.MOUSEWHEEL,
+            pg.TEXTINPUT,
+            pg.TEXTEDITING,
+        }
+    )
+    """Event types the widgets handle, never blocked by `auto_block`."""
+
+    # pygame's own event types, see `_update_blocked`
+    _builtin_events: ClassVar[frozenset[int] | None] = None
+
+    def __init__(
+        self,
+        app: PkApp,
+        *,
+        coalesce_motion: bool = True,
+        auto_block: bool = False,
+    ) -> None:
+        """Initialize the event manager class.
+
+        Args:
+            app (PkApp): The app.
+            coalesce_motion (bool, optional): Whether to merge consecutive
+                MOUSEMOTION events into one, keeping the last position and
+                the sum of the relative motions. Defaults to True.
+            auto_block (bool, optional): Whether to block the event types
+                which no handler is subscribed to, see `auto_block`.
+                Defaults to False.
+        """
         self.logger = lg.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.logger.debug("Initializing event manager...")
 
         self.app = app
 
         self.events: list[PkEvent] = []
+        # the input of the current frame, shared with the scenes
+        self.frame_input: PkFrameInput = EMPTY_FRAME_INPUT
         self.handlers: dict[str, Any] = {}
+        # event type -> subscriptions, including wildcards, in dispatch order
+        self._dispatch: dict[int, list[PkEventSubscription]] = {}
+        self._wildcards: list[PkEventSubscription] = []
+        self._seq = count()
+        # events received by `wait`, handled in the next update
+        self._pending: list[pg.event.Event] = []
+
+        self.coalesce_motion: bool = coalesce_motion
+        self._blocked: set[int] = set()
+        self._auto_block: bool = False
+        self.auto_block = auto_block
+
+    @property
+    def auto_block(self) -> bool:
+        """Whether event types no handler is subscribed to are blocked.
+
+        Blocked events are dropped by pygame before reaching the queue. The
+        `INPUT_EVENTS` types are never blocked, and nothing is blocked while
+        a handler is subscribed to all events. Custom event types are not
+        blocked either.
+        """
+        return self._auto_block
+
+    @auto_block.setter
+    def auto_block(self, value: bool) -> None:
+        self._auto_block = value
+        self._update_blocked()
+
+    def _update_blocked(self) -> None:
+        """Block or allow event types according to the handlers."""
+        blocked: set[int] = set()
+        if self._auto_block and not self._wildcards:
+            builtin_events = PkEventManager._builtin_events
+            if builtin_events is None:
+                builtin_events = PkEventManager._builtin_events = frozenset(
+                    t
+                    for t in range(pg.NOEVENT + 1, pg.USEREVENT)
+                    if pg.event.event_name(t) != "Unknown"
+                )
+            handled = {
+                event_type
+                for event_type, subscriptions in self._dispatch.items()
+                if subscriptions
+            }
+            for event_name in self.handlers:
+                event_type = getattr(pg, event_name, None)
+                if isinstance(event_type, int):
+                    handled.add(event_type)
+            blocked = builtin_events - self.INPUT_EVENTS - handled
+
+        # only change the types which changed; blocking a type flushes it
+        if blocked - self._blocked:
+            pg.event.set_blocked(list(blocked - self._blocked))
+        if self._blocked - blocked:
+            pg.event.set_allowed(list(self._blocked - blocked))
+        self._blocked = blocked
 
     def add_handler(self, event_name: str, handler: Any) -> None:
         """Add (or overwrite) a handler to the event manager.
@@ -43,6 +196,7 @@ class PkEventManager:
                 f"Overwriting handler for event type {event_name}..."
             )
         self.handlers[event_name] = handler
+        self._update_blocked()
 
     def remove_handler(self, event_name: str) -> None:
         """Remove a handler from the event manager.
@@ -52,29 +206,173 @@ class PkEventManager:
         """
         if event_name in self.handlers:
             del self.handlers[event_name]
+            self._update_blocked()
             self.logger.info(f"Removed handler for event type {event_name}.")
         else:
             self.logger.warning(
                 f"No handler found for event type {event_name}."
             )
 
+    def subscribe(
+        self,
+        event_type: int | None,
+        handler: EventHandler,
+        *,
+        priority: int = 0,
+        once: bool = False,
+    ) -> PkEventSubscription:
+        """Subscribe a handler to an event type.
+
+        Any number of handlers can subscribe to the same event type. They are
+        called in order of priority, then in order of subscribing.
+
+        Args:
+            event_type (int | None): The pygame event type, e.g.
+                `pg.KEYDOWN`, or None to receive all events.
+            handler (EventHandler): The handler to call with each event.
+            priority (int, optional): Higher priorities are called first.
+                Defaults to 0.
+            once (bool, optional): Whether to unsubscribe the handler after
+                the first event. Defaults to False.
+
+        Returns:
+            PkEventSubscription: The subscription, for `unsubscribe`.
+        """
+        subscription = PkEventSubscription(
+            event_type, handler, priority, once, next(self._seq)
+        )
+        key = PkEventSubscription.sort_key
+        if event_type is None:
+            insort(self._wildcards, subscription, key=key)
+            for subscriptions in self._dispatch.values():
+                insort(subscriptions, subscription, key=key)
+        else:
+            subscriptions = self._dispatch.get(event_type)
+            if subscriptions is None:
+                subscriptions = self._dispatch[event_type] = list(
+                    self._wildcards
+                )
+            insort(subscriptions, subscription, key=key)
+        self._update_blocked()
+        return subscription
+
+    def unsubscribe(self, subscription: PkEventSubscription) -> None:
+        """Remove a subscription.
+
+        Args:
+            subscription (PkEventSubscription): The subscription returned
+                by `subscribe`.
+        """
+        if not subscription.active:
+            self.logger.warning(f"{subscription} is not subscribed.")
+            return
+        subscription.active = False
+
+        if subscription.event_type is None:
+            self._wildcards.remove(subscription)
+            lists = self._dispatch.values()
+        else:
+            lists = [self._dispatch[subscription.event_type]]
+        for subscriptions in lists:
+            subscriptions.remove(subscription)
+        self._update_blocked()
+
     def handle_events(self, event_list: list[PkEvent]) -> None:
         """Handle the events in the event manager.
 
+        Calls the subscribed handlers, then the handlers added with
+        `add_handler`.
+
         Args:
             event_list (list[PkEvent]): The list of events to handle.
         """
+        dispatch = self._dispatch
+        handlers = self.handlers
         for event in event_list:
-            if event.name in self.handlers:
-                self.handlers[event.name](event)
+            subscriptions = dispatch.get(event.type, self._wildcards)
+            if subscriptions:
+                # copied, as handlers may (un)subscribe
+                for subscription in tuple(subscriptions):
+                    if not subscription.active:
+                        continue
+                    if subscription.once:
+                        self.unsubscribe(subscription)
+                    subscription.handler(event)
+            if handlers and event.name in handlers:
+                handlers[event.name](event)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until an event arrives or the timeout passes.
+
+        The received event is kept for the next update.
+
+        Args:
+            timeout (float): Maximum time to wait [seconds].
+
+        Returns:
+            bool: Whether an event arrived.
+        """
+        event = pg.event.wait(max(1, round(timeout * 1000)))
+        if event.type == pg.NOEVENT:
+            return False
+        self._pending.append(event)
+        return True
+
+    @staticmethod
+    def _coalesce_motion(
+        events: list[pg.event.Event],
+    ) -> list[pg.event.Event]:
+        """Merge consecutive mouse motion events with the same buttons held.
+
+        Args:
+            events (list[pg.event.Event]): The events.
+
+        Returns:
+            list[pg.event.Event]: The events, with each run of motion events
+                replaced by one with the last position and the summed
+                relative motion.
+        """
+        coalesced: list[pg.event.Event] = []
+        previous: pg.event.Event | None = None
+        for event in events:
+            if event.type != pg.MOUSEMOTION:
+                coalesced.append(event)
+                previous = None
+                continue
+
+            motion = event.dict
+            if previous is not None and motion.get(
+                "buttons"
+            ) == previous.dict.get("buttons"):
+                rel = previous.dict.get("rel", (0, 0))
+                event_rel = motion.get("rel", (0, 0))
+                previous = coalesced[-1] = pg.event.Event(
+                    pg.MOUSEMOTION,
+                    motion,
+                    rel=(rel[0] + event_rel[0], rel[1] + event_rel[1]),
+                )
+            else:
+                previous = event
+                coalesced.append(event)
+        return coalesced
 
     def update(self, dt: float) -> None:
         """Update the event manager.
 
+        Builds the input of the frame, passes it to the scene manager and
+        handles the events.
+
         Args:
             dt (float): The time since the last update.
         """
-        pygame_events: list[pg.event.Event] = pg.event.get()
+        pygame_events: list[pg.event.Event] = [
+            e
+            for e in (*self._pending, *pg.event.get())
+            if e.type != self.WAKE_EVENT
+        ]
+        self._pending.clear()
+        if self.coalesce_motion:
+            pygame_events = self._coalesce_motion(pygame_events)
         # scale mouse position to internal screen size
         for e in pygame_events:
             if e.type in (
@@ -94,10 +392,11 @@ class PkEventManager:
                 e.key = pg.key.name(e.key)
 
         self.events = [PkEvent.from_pygame(e) for e in pygame_events]
-        self.app.scene_manager.input(
-            events=self.events,
-            keys=pg.key.get_pressed(),
-            mouse_pos=pg.mouse.get_pos(),
-            mouse_buttons=pg.mouse.get_pressed(),
+        self.frame_input = PkFrameInput(
+            self.events,
+            pg.key.get_pressed(),
+            pg.mouse.get_pos(),
+            pg.mouse.get_pressed(),
         )
+        self.app.scene_manager.input(self.frame_input)
         self.handle_events(self.events)
@@ -1,7 +1,9 @@
 from .font import PkFont
+from .glyph_atlas import PkGlyphAtlas
 from .sysfont import PkSysFont
 
 __all__ = [
     "PkFont",
+    "PkGlyphAtlas",
     "PkSysFont",
 ]
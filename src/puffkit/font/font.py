@@ -2,15 +2,18 @@
 """Font module for puffkit."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Final
 
 import pygame as pg
 
 from puffkit.color.color import PkColor
+from puffkit.font.glyph_atlas import PkGlyphAtlas
 from puffkit.object import PkObject
 
 if TYPE_CHECKING:  # pragma: no cover
-    # PkSurface is still called, imported in PkFont.render()
+    # imported at runtime in `render`, to avoid a circular import
     from puffkit import PkSurface
 
 
@@ -18,22 +21,60 @@ class PkFont(PkObject):
     """Font class.
 
     A font is a typeface and its size. It is used to render text on a surface.
+
+    Rendered text is kept in a least-recently-used cache, bounded by the
+    total size of the cached surfaces in bytes.
+
+    In glyph atlas mode, single-line text is instead composed from glyphs
+    rasterized once into a `PkGlyphAtlas`, which suits text that changes
+    every frame, such as counters and timers.
     """
 
-    def __init__(self, path: str | None, size: int) -> None:
+    DEFAULT_CACHE_MAX_BYTES: Final[int] = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        path: str | None,
+        size: int,
+        *,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        glyph_atlas: bool = False,
+    ) -> None:
         """Initialize the font.
 
         Args:
             path (str | None): Path to the font file. If None, use the default font.
             size (int): Size of the font.
+            cache_max_bytes (int, optional): Maximum size of the rendered text
+                cache in bytes. 0 disables the cache. Defaults to 4 MiB.
+            glyph_atlas (bool, optional): Whether to compose text from a glyph
+                atlas instead of rendering whole strings. Defaults to False.
+
+        Raises:
+            ValueError: If `cache_max_bytes` is negative.
         """
         super().__init__()
 
+        if cache_max_bytes < 0:
+            raise ValueError("cache_max_bytes must not be negative.")
+
         self.path: str = path
         self.size: int = size
 
         self.font = pg.font.Font(self.path, self.size)
 
+        self.cache_max_bytes: int = cache_max_bytes
+        self.cache_bytes: int = 0
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self.cache_evictions: int = 0
+        # key -> (rendered surface, size in bytes)
+        self._cache: OrderedDict[tuple, tuple[PkSurface, int]] = OrderedDict()
+
+        self.glyph_atlas: bool = glyph_atlas
+        self._atlases: dict[tuple, PkGlyphAtlas] = {}
+        self._kerning: dict[tuple[str, str], int] = {}
+
     @property
     def label(self) -> str:
         """Get the font label."""
@@ -58,10 +99,11 @@ class PkFont(PkObject):
         max_width: int | None = None,
         align: int = 0,
     ) -> PkSurface:
-        from puffkit.surface import PkSurface
-
         """Render text to a surface.
 
+        The returned surface may be shared with other callers through the
+        cache and must not be modified.
+
         Args:
             text (str): Text to render.
             antialias (bool): Whether to use antialiasing.
@@ -73,17 +115,160 @@ class PkFont(PkObject):
         Returns:
             PkSurface: Surface with the rendered text.
         """
+        from puffkit.surface import PkSurface
 
         max_width = max_width if max_width is not None else 0
+        color = tuple(color)
+        bgcolor = tuple(bgcolor) if bgcolor is not None else None
+
+        if self.glyph_atlas and text and "\n" not in text:
+            text_surface = self._render_glyphs(
+                text, antialias, color, bgcolor, max_width, align
+            )
+            if text_surface is not None:
+                return PkSurface.from_pygame(text_surface)
+
+        key = (text, antialias, color, bgcolor, max_width, align)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached[0]
+        self.cache_misses += 1
 
         self.align = align
         text_surface = self.font.render(
-            text,
-            antialias,
-            tuple(color),
-            tuple(bgcolor) if bgcolor is not None else None,
-            max_width,
+            text, antialias, color, bgcolor, max_width
         )
         self.align = pg.FONT_LEFT
 
-        return PkSurface.from_pygame(text_surface)
+        surface = PkSurface.from_pygame(text_surface)
+
+        size = text_surface.get_pitch() * text_surface.get_height()
+        if size <= self.cache_max_bytes:
+            while self.cache_bytes + size > self.cache_max_bytes:
+                _, (_, evicted_size) = self._cache.popitem(last=False)
+                self.cache_bytes -= evicted_size
+                self.cache_evictions += 1
+            self._cache[key] = (surface, size)
+            self.cache_bytes += size
+
+        return surface
+
+    def clear_cache(self) -> None:
+        """Remove all rendered text from the cache."""
+        self._cache.clear()
+        self.cache_bytes = 0
+
+    def get_atlas(
+        self, antialias: bool, color: tuple[int, ...]
+    ) -> PkGlyphAtlas:
+        """Get the glyph atlas for the given rendering options.
+
+        Args:
+            antialias (bool): Whether to use antialiasing.
+            color (tuple[int, ...]): Text color.
+
+        Returns:
+            PkGlyphAtlas: The glyph atlas.
+        """
+        key = (antialias, color)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = PkGlyphAtlas(
+                self.font, antialias, color
+            )
+        return atlas
+
+    def get_kerning(self, left: str, right: str) -> int:
+        """Get the kerning between two characters.
+
+        Args:
+            left (str): The left character.
+            right (str): The right character.
+
+        Returns:
+            int: Offset to add to the pen position between the characters.
+        """
+        kerning = self._kerning.get((left, right))
+        if kerning is None:
+            # the size of a string is the pen position of its last glyph plus
+            # the width of that glyph
+            advance = self.font.metrics(left)[0]
+            kerning = self._kerning[(left, right)] = (
+                self.font.size(left + right)[0]
+                - (
+                    advance[4]
+                    if advance is not None
+                    else self.font.size(left)[0]
+                )
+                - self.font.size(right)[0]
+            )
+        return kerning
+
+    def _render_glyphs(
+        self,
+        text: str,
+        antialias: bool,
+        color: tuple[int, ...],
+        bgcolor: tuple[int, ...] | None,
+        max_width: int,
+        align: int,
+    ) -> pg.Surface | None:
+        """Compose single-line text from the glyph atlas.
+
+        Args:
+            text (str): Text to render, without newlines.
+            antialias (bool): Whether to use antialiasing.
+            color (tuple[int, ...]): Text color.
+            bgcolor (tuple[int, ...] | None): Background color.
+            max_width (int): Maximum width of the text, 0 for no limit.
+            align (int): Text alignment.
+
+        Returns:
+            pg.Surface | None: Surface with the rendered text, or None if the
+                text has to be wrapped.
+        """
+        atlas = self.get_atlas(antialias, color)
+        areas = [atlas.glyph(char) for char in text]
+
+        positions: list[int] = []
+        x = 0
+        previous = None
+        for char in text:
+            if previous is not None:
+                x += atlas.advances[previous] + self.get_kerning(
+                    previous, char
+                )
+            positions.append(x)
+            previous = char
+        x += areas[-1].width
+
+        if max_width and x > max_width:
+            return None
+
+        # centered and right-aligned wrapped text is as wide as the wrap width
+        width = x
+        offset = 0
+        if max_width and align == pg.FONT_CENTER:
+            width = max_width
+            offset = (max_width - x) // 2
+        elif max_width and align == pg.FONT_RIGHT:
+            width = max_width
+            offset = max_width - x
+
+        height = max(area.height for area in areas)
+        if bgcolor is None:
+            text_surface = pg.Surface((width, height), pg.SRCALPHA)
+        else:
+            text_surface = pg.Surface((width, height))
+            text_surface.fill(bgcolor)
+
+        text_surface.blits(
+            [
+                (atlas.surface, (offset + pos, 0), area)
+                for pos, area in zip(positions, areas)
+            ],
+            doreturn=False,
+        )
+        return text_surface
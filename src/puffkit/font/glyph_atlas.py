@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Glyph atlas module for puffkit."""
+
+from __future__ import annotations
+
+import pygame as pg
+
+from puffkit.object import PkObject
+
+
+class PkGlyphAtlas(PkObject):
+    """Glyph atlas class.
+
+    A glyph atlas holds every glyph of a font rendered so far in one color,
+    laid out side by side on a single surface. Each glyph is rasterized once;
+    strings are then composed by blitting areas of the atlas.
+    """
+
+    def __init__(
+        self, font: pg.font.Font, antialias: bool, color: tuple[int, ...]
+    ) -> None:
+        """Initialize the glyph atlas.
+
+        Args:
+            font (pg.font.Font): The font to rasterize glyphs with.
+            antialias (bool): Whether to use antialiasing.
+            color (tuple[int, ...]): Color of the glyphs.
+        """
+        super().__init__(suppress_init_log=True)
+
+        self.font = font
+        self.antialias = antialias
+        self.color = color
+
+        self.surface = pg.Surface((0, 0), pg.SRCALPHA)
+        self.glyphs: dict[str, pg.Rect] = {}
+        self.advances: dict[str, int] = {}
+        self._used_width: int = 0
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.class_name} ({len(self.glyphs)} glyphs)"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"<{self.class_name} antialias={self.antialias}"
+            f" color={self.color} glyphs={len(self.glyphs)}>"
+        )
+
+    def glyph(self, char: str) -> pg.Rect:
+        """Get the area of a glyph on the atlas surface.
+
+        The glyph is rasterized and added to the atlas on first use.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            pg.Rect: Area of the glyph on `surface`.
+        """
+        area = self.glyphs.get(char)
+        if area is None:
+            area = self._add_glyph(char)
+        return area
+
+    def _add_glyph(self, char: str) -> pg.Rect:
+        """Rasterize a glyph and add it to the atlas.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            pg.Rect: Area of the glyph on `surface`.
+        """
+        glyph = self.font.render(char, self.antialias, self.color)
+        width, height = glyph.get_size()
+
+        atlas_width, atlas_height = self.surface.get_size()
+        if self._used_width + width > atlas_width or height > atlas_height:
+            # grow geometrically, so adding glyphs stays cheap
+            surface = pg.Surface(
+                (
+                    max(self._used_width + width, atlas_width * 2),
+                    max(height, atlas_height),
+                ),
+                pg.SRCALPHA,
+            )
+            surface.blit(self.surface, (0, 0))
+            self.surface = surface
+
+        area = pg.Rect(self._used_width, 0, width, height)
+        self.surface.blit(glyph, area)
+        self._used_width += width
+
+        metrics = self.font.metrics(char)[0]
+        self.advances[char] = metrics[4] if metrics is not None else width
+
+        self.glyphs[char] = area
+        return area
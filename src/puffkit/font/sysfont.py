@@ -15,14 +15,30 @@ class PkSysFont(PkFont):
     text on a surface.
     """
 
-    def __init__(self, name: str, size: int) -> None:
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        *,
+        cache_max_bytes: int = PkFont.DEFAULT_CACHE_MAX_BYTES,
+        glyph_atlas: bool = False,
+    ) -> None:
         """Initialize the system font.
 
         Args:
             name (str): Name of the system font.
             size (int): Size of the font.
+            cache_max_bytes (int, optional): Maximum size of the rendered text
+                cache in bytes. 0 disables the cache. Defaults to 4 MiB.
+            glyph_atlas (bool, optional): Whether to compose text from a glyph
+                atlas instead of rendering whole strings. Defaults to False.
         """
-        super().__init__(None, size)
+        super().__init__(
+            None,
+            size,
+            cache_max_bytes=cache_max_bytes,
+            glyph_atlas=glyph_atlas,
+        )
 
         self.name: str = name
         self.size: int = size
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Frame input module for puffkit."""
+
+from __future__ import annotations
+
+from collections.abc import KeysView, Sequence
+from typing import Any, NamedTuple
+
+# mapping key -> field index, for code written against the old input dicts
+_KEYS: dict[str, int] = {
+    "events": 0,
+    "keys": 1,
+    "mouse_pos": 2,
+    "mouse_buttons": 3,
+}
+
+
+class PkFrameInput(NamedTuple):
+    """Input state of a frame.
+
+    Built once per frame by the event manager and passed by reference
+    through the scenes, containers and widgets, which must not modify it.
+
+    For compatibility with the input dictionaries of earlier versions, the
+    values can also be read by their old keys (`frame_input["keys"]` is
+    `frame_input.pressed_keys`) and the object unpacked with `**` into an
+    `input` call.
+    """
+
+    events: Sequence[Any] = ()
+    """The events of the frame."""
+    pressed_keys: Sequence[bool] = ()
+    """Pressed state of the keys, as returned by `pygame.key.get_pressed`."""
+    mouse_pos: tuple[int, int] = (0, 0)
+    """The mouse position."""
+    mouse_buttons: tuple[bool, ...] = (False, False, False)
+    """Pressed state of the mouse buttons."""
+
+    def __getitem__(self, key: Any) -> Any:  # type: ignore[override]
+        """Get a value by field index or by its old dictionary key.
+
+        Args:
+            key (Any): The index, slice or key.
+
+        Raises:
+            KeyError: If the key is not an input key.
+
+        Returns:
+            Any: The value.
+        """
+        if isinstance(key, str):
+            return tuple.__getitem__(self, _KEYS[key])
+        return tuple.__getitem__(self, key)
+
+    def keys(self) -> KeysView[str]:
+        """Get the old dictionary keys, so the input can be unpacked.
+
+        Returns:
+            KeysView[str]: The keys.
+        """
+        return _KEYS.keys()
+
+
+EMPTY_FRAME_INPUT: PkFrameInput = PkFrameInput()
+"""Input of a frame without any input, shared by all objects before their
+first frame."""
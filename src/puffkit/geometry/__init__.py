@@ -1,12 +1,15 @@
-from .coordinate import PkCoordinate, CoordinateValue
-from .size import PkSize, SizeValue
-from .rect import PkRect, RectValue
+from .coordinate import PkCoordinate, PkFrozenCoordinate, CoordinateValue
+from .size import PkSize, PkFrozenSize, SizeValue
+from .rect import PkRect, PkFrozenRect, RectValue
 
 __all__ = [
     "PkCoordinate",
+    "PkFrozenCoordinate",
     "CoordinateValue",
     "PkSize",
+    "PkFrozenSize",
     "SizeValue",
     "PkRect",
+    "PkFrozenRect",
     "RectValue",
 ]
@@ -8,7 +8,7 @@ represent positions of objects on the screen.
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable
 
 
 type CoordinateValue = tuple[float, float]
@@ -18,8 +18,11 @@ class PkCoordinate:
     """Class to represent a coordinate in a 2D space.
 
     The class is used to represent positions of objects on the screen.
+    Use `freeze` to get an immutable, hashable copy.
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float) -> None:
         """Initialize the coordinate.
 
@@ -127,6 +130,14 @@ class PkCoordinate:
     def __getitem__(self, index: int) -> float:
         return (self.x, self.y)[index]
 
+    def freeze(self) -> PkFrozenCoordinate:
+        """Get an immutable, hashable copy of the coordinate.
+
+        Returns:
+            PkFrozenCoordinate: The frozen coordinate.
+        """
+        return PkFrozenCoordinate(self.x, self.y)
+
     @classmethod
     def from_tuple(cls, coord: CoordinateValue) -> PkCoordinate:
         """Create a `PkCoordinate` from a tuple.
@@ -138,3 +149,42 @@ class PkCoordinate:
             PkCoordinate: The created coordinate.
         """
         return cls(coord[0], coord[1])
+
+
+class PkFrozenCoordinate(PkCoordinate):
+    """Immutable, hashable coordinate.
+
+    Equal coordinates, and tuples of the same values, have the same hash.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, x: float, y: float) -> None:
+        """Initialize the coordinate.
+
+        Args:
+            x (float): X coordinate.
+            y (float): Y coordinate.
+        """
+        object.__setattr__(self, "x", float(x))
+        object.__setattr__(self, "y", float(y))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __reduce__(self) -> tuple[type, CoordinateValue]:
+        return (type(self), (self.x, self.y))
+
+    def freeze(self) -> PkFrozenCoordinate:
+        """Get the coordinate itself, as it is already immutable.
+
+        Returns:
+            PkFrozenCoordinate: The coordinate.
+        """
+        return self
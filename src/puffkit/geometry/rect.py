@@ -3,7 +3,8 @@
 
 from __future__ import annotations
 
-import logging as lg
+import math
+from typing import Any
 
 import pygame
 
@@ -17,9 +18,17 @@ class PkRect:
     represent the position and size of entities, tiles, etc.
 
     Compatible with `pygame.Rect`, but with no limitation on the coordinates
-    and size units.
+    and size units. Use `freeze` to get an immutable, hashable copy.
+
+    The values are kept as double precision floats, unlike `pygame.FRect`,
+    which rounds them to single precision. A rectangle can be passed to
+    pygame functions taking a rectangle as is, and the methods taking
+    rectangles accept `RectValue` tuples and pygame rectangles without
+    converting them.
     """
 
+    __slots__ = ("h", "w", "x", "y")
+
     def __init__(
         self,
         x: float,
@@ -35,10 +44,6 @@ class PkRect:
             w (float): The width of the rectangle.
             h (float): The height of the rectangle.
         """
-        self.logger: lg.Logger = lg.getLogger(
-            f"{__name__}.{self.__class__.__name__}"
-        )
-
         self.x: float = float(x)
         self.y: float = float(y)
         self.w: float = float(w)
@@ -79,6 +84,9 @@ class PkRect:
     def __getitem__(self, index: int) -> float:
         return (self.x, self.y, self.w, self.h)[index]
 
+    def __len__(self) -> int:
+        return 4
+
     def __repr__(self) -> str:  # pragma: no cover
         return f"PkRect({self.x}, {self.y}, {self.w}, {self.h})"
 
@@ -86,19 +94,39 @@ class PkRect:
         return f"PkRect(x={self.x}, y={self.y}, w={self.w}, h={self.h})"
 
     def __eq__(self, other: PkRect | RectValue) -> bool:
-        if not isinstance(other, PkRect):
-            other = PkRect(*other)
-        return (
-            self.x == other.x
-            and self.y == other.y
-            and self.w == other.w
-            and self.h == other.h
-        )
+        if isinstance(other, PkRect):
+            x, y, w, h = other.x, other.y, other.w, other.h
+        else:
+            x, y, w, h = other
+        return self.x == x and self.y == y and self.w == w and self.h == h
 
     @classmethod
-    def from_pygame(cls, rect: pygame.Rect) -> PkRect:
+    def from_pygame(cls, rect: pygame.Rect | pygame.FRect) -> PkRect:
         return cls(rect.x, rect.y, rect.w, rect.h)
 
+    def to_frect(self) -> pygame.FRect:
+        """Convert the rectangle to a `pygame.FRect`.
+
+        Returns:
+            pygame.FRect: The rectangle, in single precision.
+        """
+        return pygame.FRect(self.x, self.y, self.w, self.h)
+
+    def to_pygame(self) -> pygame.Rect:
+        """Convert the rectangle to the smallest `pygame.Rect` covering it.
+
+        Returns:
+            pygame.Rect: The rectangle snapped outwards to whole pixels.
+        """
+        left = math.floor(self.x)
+        top = math.floor(self.y)
+        return pygame.Rect(
+            left,
+            top,
+            math.ceil(self.x + self.w) - left,
+            math.ceil(self.y + self.h) - top,
+        )
+
     @property
     def pos(self) -> tuple[float, float]:
         return (self.x, self.y)
@@ -236,21 +264,149 @@ class PkRect:
         self.x, self.y = value[0] - self.w, value[1] - self.h
 
     def collidepoint(self, point: tuple[float, float]) -> bool:
+        """Test whether a point is inside the rectangle.
+
+        Like `pygame.Rect`, the left and top edges are inside the rectangle,
+        the right and bottom edges are not.
+
+        Args:
+            point (tuple[float, float]): The point.
+
+        Returns:
+            bool: Whether the point is inside.
+        """
         x, y = point
+        left = self.x
+        top = self.y
+        return left <= x < left + self.w and top <= y < top + self.h
+
+    def colliderect(self, rect: PkRect | RectValue) -> bool:
+        """Test whether two rectangles overlap.
+
+        Args:
+            rect (PkRect | RectValue): The other rectangle.
 
-        return self.left < x < self.right and self.top < y < self.bottom
+        Returns:
+            bool: Whether the rectangles overlap.
+        """
+        if isinstance(rect, PkRect):
+            x, y, w, h = rect.x, rect.y, rect.w, rect.h
+        else:
+            x, y, w, h = rect
+        left = self.x
+        top = self.y
+        return (
+            left < x + w
+            and left + self.w > x
+            and top < y + h
+            and top + self.h > y
+        )
+
+    def contains(self, rect: PkRect | RectValue) -> bool:
+        """Test whether another rectangle is completely inside this one.
 
-    def colliderect(self, rect: PkRect) -> bool:
+        Args:
+            rect (PkRect | RectValue): The other rectangle.
+
+        Returns:
+            bool: Whether the other rectangle is inside.
+        """
+        if isinstance(rect, PkRect):
+            x, y, w, h = rect.x, rect.y, rect.w, rect.h
+        else:
+            x, y, w, h = rect
         return (
-            self.left < rect.right
-            and self.right > rect.left
-            and self.top < rect.bottom
-            and self.bottom > rect.top
+            self.x <= x
+            and self.y <= y
+            and x + w <= self.x + self.w
+            and y + h <= self.y + self.h
         )
 
+    def move(self, dx: float, dy: float) -> PkRect:
+        """Move the rectangle.
+
+        Args:
+            dx (float): The distance to move along the x-axis.
+            dy (float): The distance to move along the y-axis.
+
+        Returns:
+            PkRect: The moved rectangle.
+        """
+        return PkRect(self.x + dx, self.y + dy, self.w, self.h)
+
+    def move_ip(self, dx: float, dy: float) -> None:
+        """Move the rectangle in place.
+
+        Args:
+            dx (float): The distance to move along the x-axis.
+            dy (float): The distance to move along the y-axis.
+        """
+        self.x += dx
+        self.y += dy
+
+    def union(self, rect: PkRect | RectValue) -> PkRect:
+        """Get the smallest rectangle containing both rectangles.
+
+        Args:
+            rect (PkRect | RectValue): The other rectangle.
+
+        Returns:
+            PkRect: The union of the rectangles.
+        """
+        if isinstance(rect, PkRect):
+            x, y, w, h = rect.x, rect.y, rect.w, rect.h
+        else:
+            x, y, w, h = rect
+        left = min(self.x, x)
+        top = min(self.y, y)
+        return PkRect(
+            left,
+            top,
+            max(self.x + self.w, x + w) - left,
+            max(self.y + self.h, y + h) - top,
+        )
+
+    def union_ip(self, rect: PkRect | RectValue) -> None:
+        """Grow the rectangle to contain another one.
+
+        Args:
+            rect (PkRect | RectValue): The other rectangle.
+        """
+        self.x, self.y, self.w, self.h = self.union(rect)
+
+    def clip(self, rect: PkRect | RectValue) -> PkRect:
+        """Get the part of the rectangle inside another one.
+
+        Args:
+            rect (PkRect | RectValue): The other rectangle.
+
+        Returns:
+            PkRect: The overlapping area, or an empty rectangle at the
+                position of this one if the rectangles do not overlap.
+        """
+        if isinstance(rect, PkRect):
+            x, y, w, h = rect.x, rect.y, rect.w, rect.h
+        else:
+            x, y, w, h = rect
+        left = max(self.x, x)
+        top = max(self.y, y)
+        right = min(self.x + self.w, x + w)
+        bottom = min(self.y + self.h, y + h)
+        if right <= left or bottom <= top:
+            return PkRect(self.x, self.y, 0, 0)
+        return PkRect(left, top, right - left, bottom - top)
+
     def copy(self) -> PkRect:
         return PkRect(self.x, self.y, self.w, self.h)
 
+    def freeze(self) -> PkFrozenRect:
+        """Get an immutable, hashable copy of the rectangle.
+
+        Returns:
+            PkFrozenRect: The frozen rectangle.
+        """
+        return PkFrozenRect(self.x, self.y, self.w, self.h)
+
     def inflate(self, dx: float, dy: float) -> PkRect:
         """Inflate the rectangle by the given amount.
 
@@ -276,3 +432,54 @@ class PkRect:
         self.y -= dy / 2
         self.w += dx
         self.h += dy
+
+
+class PkFrozenRect(PkRect):
+    """Immutable, hashable rectangle.
+
+    Equal rectangles, and tuples of the same values, have the same hash.
+    The setters and in-place methods raise `AttributeError`; `copy` returns
+    a mutable rectangle.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+    ) -> None:
+        """Initialize the rectangle.
+
+        Args:
+            x (float): The x-coordinate of the rectangle.
+            y (float): The y-coordinate of the rectangle.
+            w (float): The width of the rectangle.
+            h (float): The height of the rectangle.
+        """
+        object.__setattr__(self, "x", float(x))
+        object.__setattr__(self, "y", float(y))
+        object.__setattr__(self, "w", float(w))
+        object.__setattr__(self, "h", float(h))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.w, self.h))
+
+    def __reduce__(self) -> tuple[type, RectValue]:
+        return (type(self), (self.x, self.y, self.w, self.h))
+
+    def freeze(self) -> PkFrozenRect:
+        """Get the rectangle itself, as it is already immutable.
+
+        Returns:
+            PkFrozenRect: The rectangle.
+        """
+        return self
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""Rect array module for puffkit.
+
+This module contains the `PkRectArray` class, a collection of rectangles
+stored in a NumPy array, for collision queries over many rectangles at once.
+
+Requires NumPy, installed with the `numpy` extra of puffkit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Final
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "PkRectArray requires NumPy. Install it with the `numpy` extra: "
+        '"puffkit[numpy]".'
+    ) from e
+
+from puffkit.geometry.rect import PkRect, RectValue
+
+
+class PkRectArray:
+    """Array of rectangles.
+
+    The rectangles are stored in one contiguous (n, 4) array of x, y, width
+    and height, and every query tests all of them with a few array
+    operations instead of a Python loop. Point and rectangle tests follow
+    the semantics of `PkRect.collidepoint` and `PkRect.colliderect`.
+
+    Usage:
+    ```python
+    entities = PkRectArray(entity.rect for entity in entities)
+    hit = entities.collidepoint(mouse_pos)  # bool mask
+    for i, j in entities.collide_pairs():
+        ...
+    ```
+    """
+
+    __slots__ = ("_data",)
+
+    PAIR_CHUNK_SIZE: Final[int] = 1024
+    """Rows tested at once by `collide_pairs`, to limit memory use."""
+
+    def __init__(self, rects: Iterable[PkRect | RectValue] = ()) -> None:
+        """Initialize the rect array.
+
+        Args:
+            rects (Iterable[PkRect | RectValue], optional): The rectangles.
+                Defaults to () (empty).
+        """
+        self._data: np.ndarray = np.array(
+            [tuple(rect) for rect in rects], dtype=np.float64
+        ).reshape(-1, 4)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> PkRectArray:
+        """Create a rect array from an array of rectangles.
+
+        Args:
+            array (np.ndarray): Array of shape (n, 4) holding the x, y,
+                width and height of each rectangle. Copied if it is not a
+                contiguous float64 array.
+
+        Raises:
+            ValueError: If the array does not have the shape (n, 4).
+
+        Returns:
+            PkRectArray: The rect array.
+        """
+        data = np.ascontiguousarray(array, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError(
+                f"Expected an array of shape (n, 4), got {data.shape}."
+            )
+        instance = cls.__new__(cls)
+        instance._data = data
+        return instance
+
+    def to_rects(self) -> list[PkRect]:
+        """Convert the array to a list of rectangles.
+
+        Returns:
+            list[PkRect]: The rectangles.
+        """
+        return [PkRect(x, y, w, h) for x, y, w, h in self._data.tolist()]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"PkRectArray({len(self)} rects)"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"PkRectArray({self.to_rects()!r})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[PkRect]:
+        return iter(self.to_rects())
+
+    def __getitem__(self, index: int) -> PkRect:
+        x, y, w, h = self._data[index].tolist()
+        return PkRect(x, y, w, h)
+
+    def __setitem__(self, index: int, rect: PkRect | RectValue) -> None:
+        self._data[index] = (rect[0], rect[1], rect[2], rect[3])
+
+    @property
+    def array(self) -> np.ndarray:
+        """The (n, 4) array of x, y, width and height; changes write
+        through to the rectangles."""
+        return self._data
+
+    @property
+    def x(self) -> np.ndarray:
+        """The x-coordinates of the rectangles (a view)."""
+        return self._data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """The y-coordinates of the rectangles (a view)."""
+        return self._data[:, 1]
+
+    @property
+    def w(self) -> np.ndarray:
+        """The widths of the rectangles (a view)."""
+        return self._data[:, 2]
+
+    @property
+    def h(self) -> np.ndarray:
+        """The heights of the rectangles (a view)."""
+        return self._data[:, 3]
+
+    @property
+    def right(self) -> np.ndarray:
+        """The right edges of the rectangles."""
+        return self._data[:, 0] + self._data[:, 2]
+
+    @property
+    def bottom(self) -> np.ndarray:
+        """The bottom edges of the rectangles."""
+        return self._data[:, 1] + self._data[:, 3]
+
+    def move_ip(self, dx: float, dy: float) -> None:
+        """Move all rectangles in place.
+
+        Args:
+            dx (float): The distance to move along the x-axis.
+            dy (float): The distance to move along the y-axis.
+        """
+        self._data[:, 0] += dx
+        self._data[:, 1] += dy
+
+    def collidepoint(self, point: tuple[float, float]) -> np.ndarray:
+        """Test which rectangles contain a point.
+
+        Args:
+            point (tuple[float, float]): The point.
+
+        Returns:
+            np.ndarray: Boolean mask of the rectangles containing the point.
+        """
+        px, py = point
+        x, y, w, h = self._data.T
+        return (x <= px) & (px < x + w) & (y <= py) & (py < y + h)
+
+    def collidepoints(
+        self, points: Iterable[tuple[float, float]]
+    ) -> np.ndarray:
+        """Test which rectangles contain each of several points.
+
+        Args:
+            points (Iterable[tuple[float, float]]): The points.
+
+        Returns:
+            np.ndarray: Boolean matrix of shape (points, rects).
+        """
+        p = np.asarray(list(points), dtype=np.float64).reshape(-1, 2)
+        px = p[:, 0, np.newaxis]
+        py = p[:, 1, np.newaxis]
+        x, y, w, h = self._data.T
+        return (x <= px) & (px < x + w) & (y <= py) & (py < y + h)
+
+    def colliderect(self, rect: PkRect | RectValue) -> np.ndarray:
+        """Test which rectangles overlap a rectangle.
+
+        Args:
+            rect (PkRect | RectValue): The rectangle.
+
+        Returns:
+            np.ndarray: Boolean mask of the overlapping rectangles.
+        """
+        rx, ry, rw, rh = rect[0], rect[1], rect[2], rect[3]
+        x, y, w, h = self._data.T
+        return (x < rx + rw) & (x + w > rx) & (y < ry + rh) & (y + h > ry)
+
+    def collide_pairs(self, other: PkRectArray | None = None) -> np.ndarray:
+        """Find the overlapping pairs of rectangles.
+
+        Args:
+            other (PkRectArray | None, optional): The rectangles to test
+                against. Defaults to None (the pairs within this array).
+
+        Returns:
+            np.ndarray: Array of shape (pairs, 2) of the indices of the
+                overlapping rectangles, in this array and in `other`. Within
+                one array, every pair is listed once, with i < j.
+        """
+        data = self._data
+        targets = data if other is None else other._data
+        tx, ty, tw, th = targets.T
+        tr = tx + tw
+        tb = ty + th
+
+        pairs = []
+        for start in range(0, len(data), self.PAIR_CHUNK_SIZE):
+            chunk = data[start : start + self.PAIR_CHUNK_SIZE]
+            x = chunk[:, 0, np.newaxis]
+            y = chunk[:, 1, np.newaxis]
+            r = x + chunk[:, 2, np.newaxis]
+            b = y + chunk[:, 3, np.newaxis]
+            hits = (x < tr) & (r > tx) & (y < tb) & (b > ty)
+            i, j = np.nonzero(hits)
+            i += start
+            if other is None:
+                keep = i < j
+                i, j = i[keep], j[keep]
+            pairs.append(np.stack((i, j), axis=1))
+
+        if not pairs:
+            return np.empty((0, 2), dtype=np.intp)
+        return np.concatenate(pairs)
+
+    def union(self) -> PkRect:
+        """Get the smallest rectangle containing all rectangles.
+
+        Raises:
+            ValueError: If the array is empty.
+
+        Returns:
+            PkRect: The bounding rectangle.
+        """
+        if not len(self._data):
+            raise ValueError("Cannot get the union of an empty PkRectArray.")
+        left = float(self.x.min())
+        top = float(self.y.min())
+        return PkRect(
+            left,
+            top,
+            float(self.right.max()) - left,
+            float(self.bottom.max()) - top,
+        )
+
+    def distances(self, point: tuple[float, float]) -> np.ndarray:
+        """Get the distances from a point to the rectangles.
+
+        Args:
+            point (tuple[float, float]): The point.
+
+        Returns:
+            np.ndarray: The distance to the nearest edge of each rectangle,
+                0 for rectangles containing the point.
+        """
+        px, py = point
+        x, y, w, h = self._data.T
+        dx = np.maximum(np.maximum(x - px, px - (x + w)), 0)
+        dy = np.maximum(np.maximum(y - py, py - (y + h)), 0)
+        return np.hypot(dx, dy)
+
+    def nearest(self, point: tuple[float, float]) -> int:
+        """Find the rectangle nearest to a point.
+
+        Args:
+            point (tuple[float, float]): The point.
+
+        Raises:
+            ValueError: If the array is empty.
+
+        Returns:
+            int: The index of the nearest rectangle; the first one if
+                several are equally near.
+        """
+        if not len(self._data):
+            raise ValueError(
+                "Cannot find the nearest rect of an empty PkRectArray."
+            )
+        return int(np.argmin(self.distances(point)))
@@ -8,7 +8,7 @@ objects on the screen.
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable
 
 
 type SizeValue = tuple[float, float]
@@ -18,8 +18,11 @@ class PkSize:
     """Class to represent a size in a 2D space.
 
     The class is used to represent the size of objects on the screen.
+    Use `freeze` to get an immutable, hashable copy.
     """
 
+    __slots__ = ("h", "w")
+
     def __init__(self, w: float, h: float) -> None:
         """Initialize the size.
 
@@ -43,6 +46,14 @@ class PkSize:
         """
         return cls(*size)
 
+    def freeze(self) -> PkFrozenSize:
+        """Get an immutable, hashable copy of the size.
+
+        Returns:
+            PkFrozenSize: The frozen size.
+        """
+        return PkFrozenSize(self.w, self.h)
+
     @property
     def width(self) -> float:
         """Return the width of the size."""
@@ -142,3 +153,42 @@ class PkSize:
     def __getitem__(self, index: int) -> float:
         """Return the size component at the given index."""
         return (self.w, self.h)[index]
+
+
+class PkFrozenSize(PkSize):
+    """Immutable, hashable size.
+
+    Equal sizes, and tuples of the same values, have the same hash.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, w: float, h: float) -> None:
+        """Initialize the size.
+
+        Args:
+            w (float): Width of the size.
+            h (float): Height of the size.
+        """
+        object.__setattr__(self, "w", float(w))
+        object.__setattr__(self, "h", float(h))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __hash__(self) -> int:
+        return hash((self.w, self.h))
+
+    def __reduce__(self) -> tuple[type, SizeValue]:
+        return (type(self), (self.w, self.h))
+
+    def freeze(self) -> PkFrozenSize:
+        """Get the size itself, as it is already immutable.
+
+        Returns:
+            PkFrozenSize: The size.
+        """
+        return self
@@ -4,8 +4,11 @@
 from __future__ import annotations
 
 import logging as lg
+from collections.abc import Sequence
 from typing import Any
 
+from puffkit.frame_input import EMPTY_FRAME_INPUT, PkFrameInput
+
 
 class PkObject:
     """Object class.
@@ -27,27 +30,32 @@ class PkObject:
         if not suppress_init_log:
             self.logger.debug(f"Initializing object {self.class_name}...")
 
-        self._input: dict[str, Any] = {
-            "events": [],
-            "keys": {},
-            "mouse_pos": (0, 0),
-            "mouse_buttons": (False, False, False),
-        }
+        self._input: PkFrameInput = EMPTY_FRAME_INPUT
 
     def input(
         self,
-        events: list[Any],
-        keys: dict[str, bool],
-        mouse_pos: tuple[int, int],
-        mouse_buttons: tuple[bool, bool, bool],
+        events: PkFrameInput | Sequence[Any],
+        keys: Sequence[bool] = (),
+        mouse_pos: tuple[int, int] = (0, 0),
+        mouse_buttons: tuple[bool, ...] = (False, False, False),
     ) -> None:
-        """Update the input for the object."""
-        self._input = {
-            "events": events,
-            "keys": keys,
-            "mouse_pos": mouse_pos,
-            "mouse_buttons": mouse_buttons,
-        }
+        """Update the input for the object.
+
+        Args:
+            events (PkFrameInput | Sequence[Any]): The input of the frame,
+                kept by reference, or the events of the frame.
+            keys (Sequence[bool], optional): Pressed state of the keys, if
+                `events` are the events. Defaults to ().
+            mouse_pos (tuple[int, int], optional): The mouse position, if
+                `events` are the events. Defaults to (0, 0).
+            mouse_buttons (tuple[bool, ...], optional): Pressed state of the
+                mouse buttons, if `events` are the events. Defaults to
+                (False, False, False).
+        """
+        if isinstance(events, PkFrameInput):
+            self._input = events
+        else:
+            self._input = PkFrameInput(events, keys, mouse_pos, mouse_buttons)
 
     def update(self) -> None:
         """Update the object."""
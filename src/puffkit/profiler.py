@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Frame profiler module for puffkit."""
+
+from __future__ import annotations
+
+import time as t
+from typing import Final
+
+from puffkit.object import PkObject
+
+
+class PkFrameProfiler(PkObject):
+    """Frame profiler class.
+
+    Records how long each phase of a frame takes into a fixed-size ring
+    buffer, keeping the timings of the last `capacity` frames.
+
+    Usage:
+    ```python
+    profiler.start_frame()
+    handle_events()
+    profiler.lap("events")
+    ...
+    profiler.end_frame()
+    print(profiler.stats("events")["p95"])
+    ```
+    """
+
+    PHASES: Final[tuple[str, ...]] = (
+        "events",
+        "update",
+        "render",
+        "scale",
+        "flip",
+    )
+    PERCENTILES: Final[tuple[int, ...]] = (50, 95, 99)
+
+    def __init__(self, capacity: int = 600) -> None:
+        """Initialize the frame profiler.
+
+        Args:
+            capacity (int, optional): Number of frames to keep.
+                Defaults to 600 (10 seconds at 60 FPS).
+
+        Raises:
+            ValueError: If `capacity` is not positive.
+        """
+        super().__init__()
+
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+
+        self.capacity: int = capacity
+        self.frames: int = 0
+
+        # phase -> ring buffer of durations [seconds]; "frame" is the total
+        self._samples: dict[str, list[float]] = {
+            phase: [0.0] * capacity for phase in (*self.PHASES, "frame")
+        }
+        self._index: int = 0
+        self._frame_start: float = 0.0
+        self._lap_start: float = 0.0
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.class_name} ({len(self)}/{self.capacity} frames)"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<{self.class_name} capacity={self.capacity} frames={self.frames}>"
+
+    def __len__(self) -> int:
+        """Get the number of recorded frames in the buffer.
+
+        Returns:
+            int: Number of recorded frames, at most `capacity`.
+        """
+        return min(self.frames, self.capacity)
+
+    def start_frame(self) -> None:
+        """Start timing a frame."""
+        self._frame_start = self._lap_start = t.perf_counter()
+        for samples in self._samples.values():
+            samples[self._index] = 0.0
+
+    def lap(self, phase: str) -> None:
+        """Record the time since the previous lap as a phase of the frame.
+
+        Args:
+            phase (str): The phase, one of `PHASES`.
+        """
+        now = t.perf_counter()
+        self._samples[phase][self._index] += now - self._lap_start
+        self._lap_start = now
+
+    def end_frame(self) -> None:
+        """Finish timing the current frame."""
+        self._samples["frame"][self._index] = (
+            t.perf_counter() - self._frame_start
+        )
+        self._index = (self._index + 1) % self.capacity
+        self.frames += 1
+
+    def stats(self, phase: str = "frame") -> dict[str, float]:
+        """Get statistics of a phase over the recorded frames.
+
+        Args:
+            phase (str, optional): The phase, one of `PHASES`, or "frame" for
+                whole frames. Defaults to "frame".
+
+        Returns:
+            dict[str, float]: The "p50", "p95", "p99" and "max" durations
+                [seconds]. All zero if no frame was recorded.
+        """
+        samples = sorted(self._samples[phase][: len(self)])
+        if not samples:
+            return {**{f"p{p}": 0.0 for p in self.PERCENTILES}, "max": 0.0}
+
+        # nearest-rank percentiles
+        stats = {
+            f"p{p}": samples[max(0, (p * len(samples) + 99) // 100 - 1)]
+            for p in self.PERCENTILES
+        }
+        stats["max"] = samples[-1]
+        return stats
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Get statistics of all phases and whole frames.
+
+        Returns:
+            dict[str, dict[str, float]]: Statistics of each phase, see `stats`.
+        """
+        return {phase: self.stats(phase) for phase in self._samples}
+
+    def reset(self) -> None:
+        """Forget all recorded frames."""
+        for samples in self._samples.values():
+            samples[:] = [0.0] * self.capacity
+        self._index = 0
+        self.frames = 0
@@ -1,7 +1,9 @@
+from .focus_manager import PkFocusManager
 from .scene import PkScene
 from .scene_manager import PkSceneManager
 
 __all__ = [
+    "PkFocusManager",
     "PkScene",
     "PkSceneManager",
 ]
@@ -29,6 +29,7 @@ class PkFallbackScene(PkScene):
         """
         self.message = message
         self.on_load()
+        self.mark_dirty()
 
     def on_render(self) -> None:
         """Render the scene."""
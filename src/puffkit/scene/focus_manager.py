@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Focus manager module for puffkit."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from puffkit.object import PkObject
+
+if TYPE_CHECKING:  # pragma: no cover
+    from puffkit.event import PkEvent
+    from puffkit.widget.widget import PkWidget
+
+
+class PkFocusManager(PkObject):
+    """Focus manager class.
+
+    Every scene has a focus manager, which owns the single focused widget of
+    the scene's containers. Moving the focus only involves the widget losing
+    it and the widget gaining it, and the containers send keyboard events
+    only to the focused widget.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the focus manager."""
+        super().__init__(suppress_init_log=True)
+
+        self._focused: PkWidget | None = None
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.class_name} ({self._focused})"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<{self.class_name} focused={self._focused!r}>"
+
+    @property
+    def focused(self) -> PkWidget | None:
+        """The focused widget, if any."""
+        return self._focused
+
+    def focus(
+        self, widget: PkWidget | None, event: PkEvent | None = None
+    ) -> None:
+        """Move the focus to a widget.
+
+        The previously focused widget loses the focus. Widgets which are not
+        focusable are ignored.
+
+        Args:
+            widget (PkWidget | None): The widget to focus, None to clear the
+                focus.
+            event (PkEvent | None, optional): The event causing the change;
+                if given, it is passed to the widgets' `on_unfocus` and
+                `on_focus` hooks. Defaults to None (hooks are not called).
+        """
+        previous = self._focused
+        if widget is previous or (widget is not None and not widget.focusable):
+            return
+
+        # set first, so the widgets' `focused` setters see the change
+        self._focused = widget
+        if previous is not None:
+            if event is not None:
+                previous.on_unfocus(event)
+            previous.focused = False
+        if widget is not None:
+            if event is not None:
+                widget.on_focus(event)
+            widget.focused = True
+
+    def unfocus(self, event: PkEvent | None = None) -> None:
+        """Clear the focus.
+
+        Args:
+            event (PkEvent | None, optional): The event causing the change,
+                passed to the `on_unfocus` hook. Defaults to None.
+        """
+        self.focus(None, event)
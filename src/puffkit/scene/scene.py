@@ -5,11 +5,14 @@ from __future__ import annotations
 
 import logging as lg
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, Final
 
 from puffkit.color import PkBasicPalette
 from puffkit.geometry.coordinate import PkCoordinate
+from puffkit.geometry.rect import PkRect, RectValue
+from puffkit.geometry.size import PkSize, SizeValue
 from puffkit.object import PkObject
+from puffkit.scene.focus_manager import PkFocusManager
 from puffkit.surface import PkSurface
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -23,10 +26,26 @@ class PkScene(PkObject):
     settings menu, etc. Each scene has its own class, which inherits from this
     class. The scenes are stored in the `scenes` dict in the `PkApp` class.
     A scene takes up the whole screen (minus the topbar).
+
+    Unless disabled, a checkerboard backdrop is drawn behind the scene
+    contents. It is pre-rendered once per scene size and shared between
+    scenes.
+
+    The scene's `focus_manager` keeps track of the focused widget of its
+    containers.
     """
 
+    BACKDROP_TILE_SIZE: Final[int] = 16
+    _backdrops: ClassVar[dict[tuple[int, int], PkSurface]] = {}
+
     def __init__(
-        self, _id: str, app: PkApp, *, lazy: bool, auto_unload: bool
+        self,
+        _id: str,
+        app: PkApp,
+        *,
+        lazy: bool,
+        auto_unload: bool,
+        backdrop: bool = True,
     ) -> None:
         """Initialize the scene class.
 
@@ -35,11 +54,15 @@ class PkScene(PkObject):
             app (PkApp): The app instance.
             lazy (bool): Whether to initialize the scene lazily.
             auto_unload (bool): Whether to automatically unload the scene.
+            backdrop (bool, optional): Whether to draw the checkerboard
+                backdrop. Disable it for scenes that paint their whole area.
+                Defaults to True.
         """
         super().__init__()
         self.id = _id
         self.lazy = lazy
         self.auto_unload = auto_unload
+        self.backdrop = backdrop
 
         self.logger = lg.getLogger(f"{__name__}.{self.id}")
 
@@ -49,6 +72,7 @@ class PkScene(PkObject):
         self.pos = PkCoordinate(0, 0)
 
         self.surface = PkSurface(self.size, self.pos)
+        self.focus_manager = PkFocusManager()
 
         self.loaded: bool = False
 
@@ -81,6 +105,22 @@ class PkScene(PkObject):
         """Render hook."""
         pass
 
+    def mark_dirty(self, rect: PkRect | RectValue | None = None) -> None:
+        """Report a changed region of the scene to the app.
+
+        Args:
+            rect (PkRect | RectValue | None, optional): Changed region,
+                relative to the scene. Defaults to None (whole scene).
+        """
+        if rect is None:
+            self.app.mark_dirty()
+            return
+
+        rect = PkRect.from_value(rect)
+        self.app.mark_dirty(
+            PkRect(rect.x + self.pos.x, rect.y + self.pos.y, rect.w, rect.h)
+        )
+
     def load(self) -> None:
         """Load the scene. NOTE: The method you should override is `on_load`."""
         self.surface.fill((255, 255, 255))
@@ -95,6 +135,7 @@ class PkScene(PkObject):
         """Unload the scene. NOTE: The method you should override is `on_unload`."""
         self.logger.debug(f"Unloading scene {self.id}...")
         self.on_unload()
+        self.focus_manager.unfocus()
         self.loaded = False
 
     def update(self, delta: float) -> None:
@@ -106,26 +147,68 @@ class PkScene(PkObject):
         self.on_update(delta)
 
     def render(self, dest: PkSurface) -> None:
-        """Render the scene. NOTE: The method you should override is `on_render`."""
-        # draw a checkerboard pattern
-        _checkerboard_rect_size: int = 16
-        self.surface.fill(PkBasicPalette.WHITE)
-        for x in range(0, int(self.size.width), _checkerboard_rect_size):
-            for y in range(0, int(self.size.height), _checkerboard_rect_size):
-                if (x + y) % (_checkerboard_rect_size * 2) == 0:
-                    self.surface.fill(
-                        PkBasicPalette.DARK_GREY,
-                        (
-                            x,
-                            y,
-                            _checkerboard_rect_size,
-                            _checkerboard_rect_size,
-                        ),
-                    )
+        """Render the scene. NOTE: The method you should override is `on_render`.
+
+        With dirty rendering, the scene surface keeps the previous frame and
+        the backdrop is only redrawn when the whole screen is redrawn.
+        """
+        if self.backdrop and self.app.full_redraw:
+            self.surface.blit(self.get_backdrop(self.size), (0, 0))
 
         self.on_render()
         self.draw(dest)
 
+    @classmethod
+    def get_backdrop(cls, size: PkSize | SizeValue) -> PkSurface:
+        """Get the checkerboard backdrop for the given size.
+
+        The backdrop is built on first use and cached per size.
+
+        Args:
+            size (PkSize | SizeValue): The size of the backdrop.
+
+        Returns:
+            PkSurface: The backdrop surface.
+        """
+        key = (int(size[0]), int(size[1]))
+        backdrop = cls._backdrops.get(key)
+        if backdrop is not None:
+            return backdrop
+
+        tile_size = cls.BACKDROP_TILE_SIZE
+        tile = PkSurface((tile_size * 2, tile_size * 2))
+        tile.fill(PkBasicPalette.WHITE)
+        tile.fill(PkBasicPalette.DARK_GREY, (0, 0, tile_size, tile_size))
+        tile.fill(
+            PkBasicPalette.DARK_GREY,
+            (tile_size, tile_size, tile_size, tile_size),
+        )
+
+        backdrop = PkSurface(key)
+        backdrop.internal_surface.blits(
+            [
+                (tile.internal_surface, (x, y))
+                for x in range(0, key[0], tile_size * 2)
+                for y in range(0, key[1], tile_size * 2)
+            ],
+            doreturn=False,
+        )
+        cls._backdrops[key] = backdrop
+        return backdrop
+
     def draw(self, screen: PkSurface) -> None:
-        """Draw the scene to the screen."""
-        screen.blit(self.surface, self.surface.pos)
+        """Draw the scene to the screen.
+
+        Only the regions reported to the app are drawn, unless the whole
+        screen is being redrawn.
+        """
+        if self.app.full_redraw:
+            screen.blit(self.surface, self.surface.pos)
+            return
+
+        for rect in self.app.dirty_rects:
+            screen.blit(
+                self.surface,
+                rect.pos,
+                (rect.x - self.pos.x, rect.y - self.pos.y, rect.w, rect.h),
+            )
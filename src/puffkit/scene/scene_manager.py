@@ -11,8 +11,11 @@ from puffkit.object import PkObject
 from puffkit.decorators.timing import Timer
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
     from puffkit import PkSurface, PkApp, PkScene
     from puffkit.event import PkEvent
+    from puffkit.frame_input import PkFrameInput
 
 
 class PkSceneManager(PkObject):
@@ -32,6 +35,8 @@ class PkSceneManager(PkObject):
         super().__init__()
         self.app = app
         self.scenes: dict[str, PkScene] = {}
+        # the scene whose `on_load` is running, if any
+        self.loading_scene: PkScene | None = None
 
         from puffkit.scene.fallback_scene import PkFallbackScene
 
@@ -116,6 +121,7 @@ class PkSceneManager(PkObject):
             self.unload_scene(self.current_scene.id)
 
         self.current_scene = new_scene
+        self.app.mark_dirty()
 
     def load_scene(
         self, scene_id: str, *, suppress_error: bool = False
@@ -134,8 +140,11 @@ class PkSceneManager(PkObject):
         if scene_id not in self.scenes:
             raise ValueError(f"Scene with ID '{scene_id}' does not exist.")
 
+        # containers built by `on_load` belong to the loaded scene
+        previous_loading_scene = self.loading_scene
+        self.loading_scene = self.scenes[scene_id]
         try:
-            with Timer() as t:
+            with Timer(f"PkSceneManager.load_scene {scene_id}") as t:
                 self.scenes[scene_id].load()
         except Exception as e:
             self.logger.exception(e)
@@ -148,6 +157,8 @@ class PkSceneManager(PkObject):
             self.logger.debug(
                 f"Loaded scene {scene_id}. Took {t.elapsed} seconds."
             )
+        finally:
+            self.loading_scene = previous_loading_scene
 
     def unload_scene(self, scene_id: str) -> None:
         """Unload a scene.
@@ -187,25 +198,26 @@ class PkSceneManager(PkObject):
 
     def input(
         self,
-        events: list[PkEvent],
-        keys: dict[str, bool],
-        mouse_pos: tuple[int, int],
-        mouse_buttons: tuple[bool, bool, bool],
+        events: PkFrameInput | Sequence[PkEvent],
+        keys: Sequence[bool] = (),
+        mouse_pos: tuple[int, int] = (0, 0),
+        mouse_buttons: tuple[bool, ...] = (False, False, False),
     ) -> None:
         """Handle input for the current scene.
 
         Args:
-            events (list[PkEvent]): Current event.
-            keys (dict[str, bool]): Dictionary of keys and their states.
-            mouse_pos (tuple[int, int]): Current mouse position.
-            mouse_buttons (tuple[bool, bool, bool]): Dictionary of mouse buttons and their states.
+            events (PkFrameInput | Sequence[PkEvent]): The input of the
+                frame, or the events of the frame.
+            keys (Sequence[bool], optional): Pressed state of the keys, if
+                `events` are the events. Defaults to ().
+            mouse_pos (tuple[int, int], optional): The mouse position, if
+                `events` are the events. Defaults to (0, 0).
+            mouse_buttons (tuple[bool, ...], optional): Pressed state of the
+                mouse buttons, if `events` are the events. Defaults to
+                (False, False, False).
         """
-        self.current_scene.input(
-            events=events,
-            keys=keys,
-            mouse_pos=mouse_pos,
-            mouse_buttons=mouse_buttons,
-        )
+        super().input(events, keys, mouse_pos, mouse_buttons)
+        self.current_scene.input(self._input)
 
     def update(self, dt: float) -> None:
         """Update the current scene.
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Final, Self, TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any, ClassVar, Final, Self, TYPE_CHECKING
 
 import pygame
 
@@ -14,11 +16,45 @@ from puffkit.geometry.coordinate import PkCoordinate, CoordinateValue
 from puffkit.geometry.rect import PkRect, RectValue
 from puffkit.geometry.size import PkSize, SizeValue
 from puffkit.object import PkObject
+from puffkit.surface_pool import surface_pool
 
 if TYPE_CHECKING:
     from puffkit.subsurface import PkSubSurface
     from puffkit.font.font import PkFont
 
+type BlitSource = PkSurface | pygame.Surface
+type BlitItem = (
+    tuple[BlitSource, PkCoordinate | CoordinateValue]
+    | tuple[
+        BlitSource, PkCoordinate | CoordinateValue, PkRect | RectValue | None
+    ]
+    | tuple[
+        BlitSource,
+        PkCoordinate | CoordinateValue,
+        PkRect | RectValue | None,
+        int,
+    ]
+)
+
+
+def _unwrap_blit(blit: BlitItem) -> tuple:
+    """Convert a blit item to the types accepted by `pygame.Surface.blits`.
+
+    Args:
+        blit (BlitItem): The blit item.
+
+    Returns:
+        tuple: The blit item with pygame-compatible values.
+    """
+    source, dest, *rest = blit
+    if isinstance(source, PkSurface):
+        source = source.internal_surface
+    if isinstance(dest, PkCoordinate):
+        dest = dest.tuple
+    if rest and isinstance(rest[0], PkRect):
+        rest[0] = rest[0].tuple
+    return (source, dest, *rest)
+
 
 class PkSurface(PkObject):
     """Base class for surfaces.
@@ -27,6 +63,10 @@ class PkSurface(PkObject):
     etc.
     """
 
+    SHAPE_CACHE_SIZE: Final[int] = 64
+    # rect-sized surfaces with translucent shapes drawn by `draw_rect`
+    _shape_cache: ClassVar[OrderedDict[tuple, pygame.Surface]] = OrderedDict()
+
     def __init__(
         self,
         size: PkSize | SizeValue,
@@ -98,12 +138,12 @@ class PkSurface(PkObject):
         Returns:
             Surface: The created surface.
         """
-        instance = cls(
-            size=PkSize(*surface.get_size()),
-            flags=surface.get_flags(),
-            depth=surface.get_bitsize(),
-            masks=surface.get_masks(),
-        )
+        # wrap the surface without allocating a new one in __init__
+        instance = cls.__new__(cls)
+        PkObject.__init__(instance, suppress_init_log=True)
+        instance.transparent = bool(surface.get_flags() & pygame.SRCALPHA)
+        instance.pos = PkCoordinate(0, 0)
+        instance.masks = surface.get_masks()
         instance.internal_surface = surface
         return instance
 
@@ -123,7 +163,7 @@ class PkSurface(PkObject):
         Returns:
             int: Width of the surface.
         """
-        return self.size.w
+        return self.internal_surface.get_width()
 
     @property
     def height(self) -> int | float:
@@ -132,7 +172,7 @@ class PkSurface(PkObject):
         Returns:
             int: Height of the surface.
         """
-        return self.size.h
+        return self.internal_surface.get_height()
 
     def blit(
         self,
@@ -147,37 +187,61 @@ class PkSurface(PkObject):
             source (Surface): Surface to draw.
             dest (tuple[int, int]): Position of the surface.
         """
-        if not isinstance(dest, PkCoordinate):
-            dest = PkCoordinate(*dest)
         self.internal_surface.blit(
-            source.internal_surface, dest.tuple, area, special_flags
+            source.internal_surface,
+            dest.tuple if isinstance(dest, PkCoordinate) else dest,
+            area.tuple if isinstance(area, PkRect) else area,
+            special_flags,
         )
 
     def blits(
-        self,
-        blit_sequence: (
-            list[tuple[PkSurface, tuple[int, int]]]
-            | list[
-                tuple[PkSurface, tuple[int, int], tuple[int, int, int, int]]
-            ]
-            | list[
-                tuple[
-                    PkSurface, tuple[int, int], tuple[int, int, int, int], int
-                ]
-            ]
-        ),
-    ):
+        self, blit_sequence: Iterable[BlitItem], doreturn: bool = True
+    ) -> list[PkRect] | None:
         """Draw multiple surfaces onto this surface.
 
+        The whole sequence is drawn by a single `pygame.Surface.blits` call.
+
         Args:
-            blit_sequence (list[tuple[PkSurface, tuple[int, int]]] |
-                list[tuple[PkSurface, tuple[int, int], tuple[int, int, int, int]]] |
-                list[tuple[PkSurface, tuple[int, int], tuple[int, int, int, int], int]]):
-                Sequence of blits. Each tuple contains the surface to draw, the
-                position to draw it at, the area to draw, and special flags.
+            blit_sequence (Iterable[BlitItem]): Sequence of blits. Each tuple
+                contains the surface to draw (a `PkSurface` or a
+                `pygame.Surface`), the position to draw it at and optionally
+                the area to draw and special flags.
+            doreturn (bool, optional): Whether to return the changed areas.
+                Pass False to skip building them. Defaults to True.
+
+        Returns:
+            list[PkRect] | None: The changed areas, or None if `doreturn` is
+                False.
         """
-        for blit in blit_sequence:
-            self.blit(*blit)
+        changed = self.internal_surface.blits(
+            map(_unwrap_blit, blit_sequence), doreturn
+        )
+        if not doreturn:
+            return None
+        return [PkRect.from_pygame(rect) for rect in changed]
+
+    def fblits(
+        self,
+        blit_sequence: Iterable[
+            tuple[BlitSource, PkCoordinate | CoordinateValue]
+        ],
+        special_flags: int = 0,
+    ) -> None:
+        """Draw multiple surfaces onto this surface, as fast as possible.
+
+        Faster than `blits`, but only takes a source and a position for each
+        blit, the same special flags for all of them and returns nothing.
+
+        Args:
+            blit_sequence (Iterable[tuple[BlitSource, PkCoordinate |
+                CoordinateValue]]): Sequence of surfaces to draw and their
+                positions.
+            special_flags (int, optional): Special flags for all blits.
+                Defaults to 0.
+        """
+        self.internal_surface.fblits(
+            map(_unwrap_blit, blit_sequence), special_flags
+        )
 
     def convert(self, surface: PkSurface | None = None) -> PkSurface:
         """Convert the surface to a new format.
@@ -630,6 +694,9 @@ class PkSurface(PkObject):
     ) -> None:
         """Draw a rectangle on the surface, supporting alpha transparency.
 
+        Translucent rectangles are drawn on rect-sized surfaces, which are
+        cached and reused for rectangles of the same size and style.
+
         Args:
             rect (PkRect | RectValue): Rectangle to draw.
             color (PkColor | ColorValue): Color of the rectangle.
@@ -645,14 +712,10 @@ class PkSurface(PkObject):
 
         # handle transparency
         if color.a != 255:
-            shape_surface = PkSurface(
-                self.size,
-                transparent=True,
-            )
-            pygame.draw.rect(
-                shape_surface.internal_surface,
+            key = (
+                int(rect.w),
+                int(rect.h),
                 tuple(color),
-                (0, 0, *rect[2:]),
                 width,
                 border_radius,
                 border_top_left_radius,
@@ -660,9 +723,20 @@ class PkSurface(PkObject):
                 border_bottom_left_radius,
                 border_bottom_right_radius,
             )
+            shape_surface = self._shape_cache.get(key)
+            if shape_surface is None:
+                shape_surface = pygame.Surface(key[:2], pygame.SRCALPHA)
+                pygame.draw.rect(
+                    shape_surface, key[2], (0, 0, *key[:2]), *key[3:]
+                )
+                self._shape_cache[key] = shape_surface
+                if len(self._shape_cache) > self.SHAPE_CACHE_SIZE:
+                    self._shape_cache.popitem(last=False)
+            else:
+                self._shape_cache.move_to_end(key)
 
             # blit the shape surface to the main surface
-            self.blit(shape_surface, tuple(rect[:2]))
+            self.internal_surface.blit(shape_surface, (rect.x, rect.y))
         else:
             # draw opaque rect
             pygame.draw.rect(
@@ -722,8 +796,6 @@ class PkSurface(PkObject):
         # rect conversion
         rect = PkRect.from_value(rect)
 
-        text_surface: PkSurface = PkSurface(rect.size, transparent=True)
-
         max_width = int(rect.width) if wrap else 0
 
         # text preparation
@@ -744,17 +816,22 @@ class PkSurface(PkObject):
             align_map[text_align],
         )
 
-        # vertical alignment
-        if vertical_align == "middle":
-            y_pos = text_surface.height // 2 - rendered_text.get_height() // 2
-        elif vertical_align == "bottom":
-            y_pos = text_surface.height - rendered_text.get_height()
-        else:
-            y_pos = 0
+        with surface_pool.borrow(rect.size, transparent=True) as text_surface:
+            text_surface.fill((0, 0, 0, 0))
+
+            # vertical alignment
+            if vertical_align == "middle":
+                y_pos = (
+                    text_surface.height // 2 - rendered_text.get_height() // 2
+                )
+            elif vertical_align == "bottom":
+                y_pos = text_surface.height - rendered_text.get_height()
+            else:
+                y_pos = 0
 
-        text_surface.blit(rendered_text, (0, y_pos))
+            text_surface.blit(rendered_text, (0, y_pos))
 
-        self.blit(text_surface, rect.pos)
+            self.blit(text_surface, rect.pos)
 
     def resize(
         self, size: PkSize | SizeValue, *, smooth: bool = True
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Surface pool module for puffkit."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Final
+from weakref import WeakKeyDictionary
+
+import pygame
+
+from puffkit.geometry.coordinate import PkCoordinate
+from puffkit.geometry.size import PkSize, SizeValue
+from puffkit.object import PkObject
+
+if TYPE_CHECKING:  # pragma: no cover
+    # imported at runtime in `acquire`, to avoid a circular import
+    from puffkit.surface import PkSurface
+
+
+class PkSurfacePool(PkObject):
+    """Surface pool class.
+
+    Keeps released surfaces for reuse, keyed by size, flags and depth, so
+    temporary surfaces needed every frame don't have to be allocated again.
+    The pool is bounded by the total size of the kept surfaces in bytes;
+    the least recently released surfaces are dropped first.
+    """
+
+    DEFAULT_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the surface pool.
+
+        Args:
+            max_bytes (int, optional): Maximum size of the pooled surfaces in
+                bytes. 0 disables pooling. Defaults to 16 MiB.
+
+        Raises:
+            ValueError: If `max_bytes` is negative.
+        """
+        super().__init__()
+
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+
+        self.max_bytes: int = max_bytes
+        self.pooled_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        # (width, height, flags, depth) -> released surfaces
+        self._free: OrderedDict[tuple[int, int, int, int], list[PkSurface]] = (
+            OrderedDict()
+        )
+        # keys of the acquired surfaces
+        self._keys: WeakKeyDictionary[PkSurface, tuple[int, int, int, int]] = (
+            WeakKeyDictionary()
+        )
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.class_name} ({self.pooled_bytes}/{self.max_bytes} B)"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"<{self.class_name} max_bytes={self.max_bytes}"
+            f" pooled_bytes={self.pooled_bytes} hits={self.hits}"
+            f" misses={self.misses} evictions={self.evictions}>"
+        )
+
+    def acquire(
+        self,
+        size: PkSize | SizeValue,
+        *,
+        transparent: bool = False,
+        flags: int = 0,
+        depth: int = 32,
+    ) -> PkSurface:
+        """Take a surface from the pool, or create one if none is free.
+
+        The contents of a reused surface are left as they were; fill it
+        before use if needed. Release the surface once done with it.
+
+        Args:
+            size (PkSize | SizeValue): Size of the surface.
+            transparent (bool, optional): Whether the surface supports
+                transparency. Defaults to False.
+            flags (int, optional): Flags for the surface. Defaults to 0.
+            depth (int, optional): Depth of the surface. Defaults to 32.
+
+        Returns:
+            PkSurface: The surface.
+        """
+        from puffkit.surface import PkSurface
+
+        if transparent:
+            flags |= pygame.SRCALPHA
+        key = (int(size[0]), int(size[1]), flags, depth)
+
+        free = self._free.get(key)
+        if free:
+            surface = free.pop()
+            if not free:
+                del self._free[key]
+            self.pooled_bytes -= self._surface_bytes(surface)
+            self.hits += 1
+            self._keys[surface] = key
+            return surface
+
+        self.misses += 1
+        surface = PkSurface(
+            key[:2],
+            transparent=bool(flags & pygame.SRCALPHA),
+            flags=flags,
+            depth=depth,
+        )
+        self._keys[surface] = key
+        return surface
+
+    def release(self, surface: PkSurface) -> None:
+        """Return a surface to the pool.
+
+        Surfaces not acquired from this pool, or already released, are
+        ignored.
+
+        Args:
+            surface (PkSurface): A surface which is not used anymore.
+        """
+        key = self._keys.pop(surface, None)
+        if key is None:
+            return
+
+        surface_bytes = self._surface_bytes(surface)
+        if surface_bytes > self.max_bytes:
+            return
+
+        while self.pooled_bytes + surface_bytes > self.max_bytes:
+            oldest_key, oldest = next(iter(self._free.items()))
+            evicted = oldest.pop(0)
+            if not oldest:
+                del self._free[oldest_key]
+            self.pooled_bytes -= self._surface_bytes(evicted)
+            self.evictions += 1
+
+        surface.pos = PkCoordinate(0, 0)
+        surface.internal_surface.set_clip(None)
+        self._free.setdefault(key, []).append(surface)
+        self._free.move_to_end(key)
+        self.pooled_bytes += surface_bytes
+
+    @contextmanager
+    def borrow(
+        self,
+        size: PkSize | SizeValue,
+        *,
+        transparent: bool = False,
+        flags: int = 0,
+        depth: int = 32,
+    ) -> Iterator[PkSurface]:
+        """Acquire a surface for the duration of a `with` block.
+
+        Args:
+            size (PkSize | SizeValue): Size of the surface.
+            transparent (bool, optional): Whether the surface supports
+                transparency. Defaults to False.
+            flags (int, optional): Flags for the surface. Defaults to 0.
+            depth (int, optional): Depth of the surface. Defaults to 32.
+
+        Yields:
+            PkSurface: The surface, released when the block exits.
+        """
+        surface = self.acquire(
+            size, transparent=transparent, flags=flags, depth=depth
+        )
+        try:
+            yield surface
+        finally:
+            self.release(surface)
+
+    def clear(self) -> None:
+        """Drop all pooled surfaces."""
+        self._free.clear()
+        self.pooled_bytes = 0
+
+    @staticmethod
+    def _surface_bytes(surface: PkSurface) -> int:
+        """Get the size of a surface's pixel data in bytes.
+
+        Args:
+            surface (PkSurface): The surface.
+
+        Returns:
+            int: Size of the pixel data in bytes.
+        """
+        internal_surface = surface.internal_surface
+        return internal_surface.get_pitch() * internal_surface.get_height()
+
+
+surface_pool = PkSurfacePool()
+"""Default surface pool, used by puffkit for temporary surfaces."""
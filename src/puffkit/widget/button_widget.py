@@ -96,7 +96,7 @@ class PkButtonWidget(PkWidget):
         if not isinstance(text_color, PkColor):
             text_color = PkColor.from_value(text_color)
 
-        self.label: str = label
+        self._label: str = label
 
         self.action_on_click: (
             Callable[[PkButtonWidget, PkEvent], None] | None
@@ -108,36 +108,36 @@ class PkButtonWidget(PkWidget):
 
         self.font_id: str = font_id
 
-        self.background_color: PkColor = background_color
-        self.background_color_disabled: PkColor = background_color_disabled
-        self.background_color_pressed: PkColor = background_color_pressed
-        self.background_color_hovered: PkColor = background_color_hovered
+        self._background_color: PkColor = background_color
+        self._background_color_disabled: PkColor = background_color_disabled
+        self._background_color_pressed: PkColor = background_color_pressed
+        self._background_color_hovered: PkColor = background_color_hovered
 
-        self.text_color: PkColor = text_color
+        self._text_color: PkColor = text_color
 
-        self.text_align: str = text_align
-        self.border_radius: int = border_radius
+        self._text_align: str = text_align
+        self._border_radius: int = border_radius
 
         self.inner_container: PkContainer = PkContainer(
             self.container.app,
             self.surface,
             "pkbutton_inner_container",
             PkRect(0, 0, self.rect.width, self.rect.height),
+            parent_widget=self,
         )
 
-        self.inner_container.add_widget(
-            PkLabelWidget(
-                "label",
-                self.inner_container,
-                self.label,
-                PkRect(0, 0, self.rect.width, self.rect.height),
-                font_id=self.font_id,
-                text_color=self.text_color,
-                background_color=None,
-                text_align=self.text_align,
-                vertical_align="middle",
-            ),
+        self._label_widget: PkLabelWidget = PkLabelWidget(
+            "label",
+            self.inner_container,
+            self._label,
+            PkRect(0, 0, self.rect.width, self.rect.height),
+            font_id=self.font_id,
+            text_color=self._text_color,
+            background_color=None,
+            text_align=self._text_align,
+            vertical_align="middle",
         )
+        self.inner_container.add_widget(self._label_widget)
 
     def __str__(self) -> str:  # pragma: no cover
         return (
@@ -153,6 +153,84 @@ class PkButtonWidget(PkWidget):
             f"on_click={self.action_on_click}, on_hover={self.action_on_hover})"
         )
 
+    @property
+    def label(self) -> str:
+        return self._label
+
+    @label.setter
+    def label(self, value: str) -> None:
+        # the label widget marks itself, and through it the button, dirty
+        self._label_widget.set_text(value)
+        self._label = value
+
+    @property
+    def background_color(self) -> PkColor:
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, value: PkColor) -> None:
+        if value != self._background_color:
+            self.mark_dirty()
+        self._background_color = value
+
+    @property
+    def background_color_disabled(self) -> PkColor:
+        return self._background_color_disabled
+
+    @background_color_disabled.setter
+    def background_color_disabled(self, value: PkColor) -> None:
+        if value != self._background_color_disabled:
+            self.mark_dirty()
+        self._background_color_disabled = value
+
+    @property
+    def background_color_pressed(self) -> PkColor:
+        return self._background_color_pressed
+
+    @background_color_pressed.setter
+    def background_color_pressed(self, value: PkColor) -> None:
+        if value != self._background_color_pressed:
+            self.mark_dirty()
+        self._background_color_pressed = value
+
+    @property
+    def background_color_hovered(self) -> PkColor:
+        return self._background_color_hovered
+
+    @background_color_hovered.setter
+    def background_color_hovered(self, value: PkColor) -> None:
+        if value != self._background_color_hovered:
+            self.mark_dirty()
+        self._background_color_hovered = value
+
+    @property
+    def text_color(self) -> PkColor:
+        return self._text_color
+
+    @text_color.setter
+    def text_color(self, value: PkColor) -> None:
+        self._label_widget.text_color = value
+        self._text_color = value
+
+    @property
+    def text_align(self) -> str:
+        return self._text_align
+
+    @text_align.setter
+    def text_align(self, value: str) -> None:
+        self._label_widget.text_align = value
+        self._text_align = value
+
+    @property
+    def border_radius(self) -> int:
+        return self._border_radius
+
+    @border_radius.setter
+    def border_radius(self, value: int) -> None:
+        if value != self._border_radius:
+            self.mark_dirty()
+        self._border_radius = value
+
     def on_update(self, delta: float) -> None:
         self.inner_container.update(delta)
 
@@ -53,11 +53,7 @@ class PkImageWidget(PkWidget):
                 of the widget. Defaults to transparent.
             border_radius (int, optional): The border radius of the widget. Defaults to 0.
         """
-        if resize_mode not in self.RESIZE_MODES:
-            raise ValueError(
-                f"Invalid resize mode: {resize_mode}. "
-                + f"Valid options are: {self.RESIZE_MODES}",
-            )
+        self._check_resize_mode(resize_mode)
         super().__init__(id_, container, rect, focusable=False)
 
         self._image: PkImage = image
@@ -72,9 +68,9 @@ class PkImageWidget(PkWidget):
 
         self.background_color: PkColor = PkColor.from_value(background_color)
         self.border_radius: int = border_radius
-        self.resize_mode: str | None = resize_mode
+        self._resize_mode: str | None = resize_mode
 
-        self.resized_image: PkImage = self._resize_image(self.resize_mode)
+        self.resized_image: PkImage = self._resize_image(self._resize_mode)
 
     @property
     def image(self) -> PkImage:  # pragma: no cover
@@ -86,6 +82,21 @@ class PkImageWidget(PkWidget):
         """Set a new image for the widget and update the resized image."""
         self._image = new_image
         self.resized_image = self._resize_image(self.resize_mode)
+        self.mark_dirty()
+
+    @property
+    def resize_mode(self) -> str | None:
+        """The resize mode of the image."""
+        return self._resize_mode
+
+    @resize_mode.setter
+    def resize_mode(self, value: str | None) -> None:
+        """Set the resize mode and update the resized image."""
+        self._check_resize_mode(value)
+        if value != self._resize_mode:
+            self._resize_mode = value
+            self.resized_image = self._resize_image(value)
+            self.mark_dirty()
 
     @override
     def __str__(self) -> str:  # pragma: no cover
@@ -101,6 +112,22 @@ class PkImageWidget(PkWidget):
             f"image={self.image}, resize_mode={self.resize_mode})"
         )
 
+    @classmethod
+    def _check_resize_mode(cls, resize_mode: str | None) -> None:
+        """Check that a resize mode is valid.
+
+        Args:
+            resize_mode (str | None): The resize mode.
+
+        Raises:
+            ValueError: If the resize mode is not one of `RESIZE_MODES`.
+        """
+        if resize_mode not in cls.RESIZE_MODES:
+            raise ValueError(
+                f"Invalid resize mode: {resize_mode}. "
+                + f"Valid options are: {cls.RESIZE_MODES}",
+            )
+
     def _resize_image(self, resize_mode: str | None = None) -> PkImage:
         """Resize the image according to the resize mode.
 
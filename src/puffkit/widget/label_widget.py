@@ -71,19 +71,17 @@ class PkLabelWidget(PkWidget):
         self._text: str = text
 
         self.font_id: str = font_id
-        self.text_color: PkColor = text_color
+        self._text_color: PkColor = text_color
 
-        self.font: PkFont = self._find_font(font_id)
+        self._font: PkFont = self._find_font(font_id)
 
-        self.background_color: PkColor = (
+        self._background_color: PkColor = (
             background_color or PkBasicPalette.TRANSPARENT
         )
 
-        self.text_wrap: bool = text_wrap
-        self.text_align: str = text_align
-        self.vertical_align: str = vertical_align
-
-        self.needs_redraw: bool = True
+        self._text_wrap: bool = text_wrap
+        self._text_align: str = text_align
+        self._vertical_align: str = vertical_align
 
     def __str__(self) -> str:  # pragma: no cover
         """Return a string representation of the label widget.
@@ -111,6 +109,78 @@ class PkLabelWidget(PkWidget):
             f" text_align={self.text_align})"
         )
 
+    @property
+    def needs_redraw(self) -> bool:
+        """Alias of `dirty`, kept for compatibility."""
+        return self._dirty
+
+    @needs_redraw.setter
+    def needs_redraw(self, value: bool) -> None:
+        if value:
+            self.mark_dirty()
+        else:
+            self._dirty = False
+
+    @property
+    def text_color(self) -> PkColor:
+        return self._text_color
+
+    @text_color.setter
+    def text_color(self, value: PkColor) -> None:
+        if value != self._text_color:
+            self.mark_dirty()
+        self._text_color = value
+
+    @property
+    def background_color(self) -> PkColor:
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, value: PkColor) -> None:
+        if value != self._background_color:
+            self.mark_dirty()
+        self._background_color = value
+
+    @property
+    def font(self) -> PkFont:
+        return self._font
+
+    @font.setter
+    def font(self, value: PkFont) -> None:
+        if value is not self._font:
+            self.mark_dirty()
+        self._font = value
+
+    @property
+    def text_wrap(self) -> bool:
+        return self._text_wrap
+
+    @text_wrap.setter
+    def text_wrap(self, value: bool) -> None:
+        if value != self._text_wrap:
+            self.mark_dirty()
+        self._text_wrap = value
+
+    @property
+    def text_align(self) -> str:
+        return self._text_align
+
+    @text_align.setter
+    def text_align(self, value: str) -> None:
+        if value != self._text_align:
+            self.mark_dirty()
+        self._text_align = value
+
+    @property
+    def vertical_align(self) -> str:
+        return self._vertical_align
+
+    @vertical_align.setter
+    def vertical_align(self, value: str) -> None:
+        if value != self._vertical_align:
+            self.mark_dirty()
+        self._vertical_align = value
+
     def _find_font(self, font_name: str) -> PkFont:
         """Find a font by its name. If the font is not found in the app's fonts,
         try to find a system font with the given name. If that fails, use the
@@ -144,15 +214,12 @@ class PkLabelWidget(PkWidget):
         Args:
             text (str): The text to set.
         """
+        if text != self._text:
+            self.mark_dirty()
         self._text = text
-        self.needs_redraw = True
 
     def on_render(self) -> None:
         """Render the label widget."""
-        # redraw all labels every frame
-        # if not self.needs_redraw:
-        #     return
-
         self.surface.fill(self.background_color)
 
         self.surface.blit_text(
@@ -164,5 +231,3 @@ class PkLabelWidget(PkWidget):
             vertical_align=self.vertical_align,
             wrap=self.text_wrap,
         )
-
-        self.needs_redraw = False
@@ -165,6 +165,7 @@ class PkTextInputWidget(PkWidget):
             self.surface,
             f"{self.id}_inner_container",
             inner_container_rect,
+            parent_widget=self,
         )
 
         self._inner_container.add_widget(
@@ -204,6 +205,7 @@ class PkTextInputWidget(PkWidget):
         if self.max_length == 0 or len(text) <= self.max_length:
             self.text = text
             self.cursor = len(self.text)
+            self.mark_dirty()
             if self.on_change_hook and not suppress_hook:
                 self.on_change_hook(self)
 
@@ -244,6 +246,7 @@ class PkTextInputWidget(PkWidget):
                         + self.text[self.cursor :]
                     )
                     self.cursor += 1
+        self.mark_dirty()
         if self.on_change_hook:
             self.on_change_hook(self)
 
@@ -283,6 +286,7 @@ class PkTextInputWidget(PkWidget):
             delta (float): The time since the last update.
         """
         if self.disabled:
+            self._sync_inner_widgets()
             return
 
         if self.focused:
@@ -290,54 +294,71 @@ class PkTextInputWidget(PkWidget):
             if self.cursor_blink_timer >= self.cursor_blink_interval:
                 self.cursor_blink_timer = 0
 
-    def on_render(self) -> None:
-        """Render the text box widget.
+            # wake an idle app when the cursor blinks next
+            phase = self.cursor_blink_interval / len(self.cursor_chars)
+            self.container.app.request_frame(
+                phase - self.cursor_blink_timer % phase
+            )
 
-        This method is called to render the widget on the screen. It updates
-        the background color, draws the text, and handles placeholder visibility.
+        # a blink phase change updates the text label, marking this widget
+        self._sync_inner_widgets()
+
+    def _cursor_index(self) -> int:
+        """Get the index of the cursor character to display.
+
+        Returns:
+            int: The index in `cursor_chars` for the current blink phase.
         """
+        return int(
+            self.cursor_blink_timer
+            // (self.cursor_blink_interval / len(self.cursor_chars))
+        ) % len(self.cursor_chars)
+
+    def _sync_inner_widgets(self) -> None:
+        """Update the inner text and placeholder labels to the widget state.
+
+        The labels only redraw (and mark this widget dirty) if their text,
+        color or visibility actually changed.
+        """
+        text_label = self._inner_container.get_widget(f"{self.id}_text")
+        placeholder_label = self._inner_container.get_widget(
+            f"{self.id}_placeholder"
+        )
+
         if self.disabled:
-            self.surface.fill(self.background_color_disabled)
-            self._inner_container.get_widget(
-                f"{self.id}_placeholder"
-            ).surface.fill(self.placeholder_color_disabled)
+            placeholder_label.text_color = self.placeholder_color_disabled
+        elif self.focused:
+            placeholder_label.text_color = self.placeholder_color_focused
         else:
-            self.surface.fill(self.background_color)
-            self._inner_container.get_widget(
-                f"{self.id}_placeholder"
-            ).surface.fill(self.placeholder_color)
+            placeholder_label.text_color = self.placeholder_color
 
         text_with_cursor = self.text
 
         if self.focused:
-            # self.surface.fill(self.background_color_focused)
-            self._inner_container.get_widget(
-                f"{self.id}_placeholder"
-            ).surface.fill(self.placeholder_color_focused)
-            cursor = self.cursor_chars[
-                int(
-                    self.cursor_blink_timer
-                    // (self.cursor_blink_interval / len(self.cursor_chars))
-                )
-                % len(self.cursor_chars)
-            ]
+            cursor = self.cursor_chars[self._cursor_index()]
             text_with_cursor = (
                 self.text[: self.cursor] + cursor + self.text[self.cursor :]
             )
 
         if self.text != "" or self.focused:
-            self._inner_container.get_widget(f"{self.id}_text").set_text(
-                text_with_cursor
-            )
-            self._inner_container.get_widget(f"{self.id}_text").visible = True
-            self._inner_container.get_widget(
-                f"{self.id}_placeholder"
-            ).visible = False
+            text_label.set_text(text_with_cursor)
+            text_label.visible = True
+            placeholder_label.visible = False
         else:
-            self._inner_container.get_widget(f"{self.id}_text").set_text("")
-            self._inner_container.get_widget(f"{self.id}_text").visible = False
-            self._inner_container.get_widget(
-                f"{self.id}_placeholder"
-            ).visible = True
+            text_label.set_text("")
+            text_label.visible = False
+            placeholder_label.visible = True
+
+    def on_render(self) -> None:
+        """Render the text box widget.
+
+        This method is called to render the widget on the screen. It updates
+        the background color, draws the text, and handles placeholder visibility.
+        """
+        if self.disabled:
+            self.surface.fill(self.background_color_disabled)
+        else:
+            self.surface.fill(self.background_color)
 
+        self._sync_inner_widgets()
         self._inner_container.render()
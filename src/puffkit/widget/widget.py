@@ -7,11 +7,13 @@ from typing import TYPE_CHECKING
 
 from puffkit import PkObject, PkSurface
 from puffkit.color import PkBasicPalette
+from puffkit.decorators.timing import trace
 from puffkit.geometry import PkRect, RectValue
 
 if TYPE_CHECKING:  # pragma: no cover
     from puffkit.container import PkContainer
     from puffkit.event import PkEvent
+    from puffkit.scene import PkFocusManager
 
 
 class PkWidget(PkObject):
@@ -86,8 +88,6 @@ class PkWidget(PkObject):
 
         self.surface: PkSurface = PkSurface(self.rect.size, transparent=True)
 
-        self._last_mouse_pos: tuple[int, int] = (0, 0)
-
         self._visible: bool = True
         self._focusable: bool = focusable
         self._disabled: bool = False
@@ -95,12 +95,16 @@ class PkWidget(PkObject):
         self._pressed: bool = False
         self._focused: bool = False
 
+        self._dirty: bool = True
+
     @property
     def visible(self) -> bool:
         return self._visible
 
     @visible.setter
     def visible(self, value: bool) -> None:
+        if value != self._visible:
+            self.mark_dirty()
         self._visible = value
 
     @property
@@ -111,9 +115,13 @@ class PkWidget(PkObject):
     def focusable(self, value: bool) -> None:
         self._focusable = value
         if not value:
+            if self._focused or self._pressed or self._hovered:
+                self.mark_dirty()
             self._focused = False
             self._pressed = False
             self._hovered = False
+            if self.focus_manager.focused is self:
+                self.focus_manager.unfocus()
 
     @property
     def disabled(self) -> bool:
@@ -121,6 +129,8 @@ class PkWidget(PkObject):
 
     @disabled.setter
     def disabled(self, value: bool) -> None:
+        if value != self._disabled or self._hovered or self._pressed:
+            self.mark_dirty()
         self._disabled = value
         self._hovered = False
         self._pressed = False
@@ -131,6 +141,8 @@ class PkWidget(PkObject):
 
     @hovered.setter
     def hovered(self, value: bool) -> None:
+        if value != self._hovered:
+            self.mark_dirty()
         self._hovered = value
 
     @property
@@ -139,6 +151,8 @@ class PkWidget(PkObject):
 
     @pressed.setter
     def pressed(self, value: bool) -> None:
+        if value != self._pressed:
+            self.mark_dirty()
         self._pressed = value
 
     @property
@@ -148,7 +162,37 @@ class PkWidget(PkObject):
     @focused.setter
     def focused(self, value: bool) -> None:
         # if the widget is not focusable, set the focused state to False
-        self._focused = value and self.focusable
+        value = value and self.focusable
+        if value != self._focused:
+            self.mark_dirty()
+        self._focused = value
+
+        # keep the focus manager in sync
+        focus_manager = self.focus_manager
+        if value:
+            focus_manager.focus(self)
+        elif focus_manager.focused is self:
+            focus_manager.unfocus()
+
+    @property
+    def focus_manager(self) -> PkFocusManager:
+        """The focus manager of the widget's container."""
+        return self.container.focus_manager
+
+    @property
+    def dirty(self) -> bool:
+        """Whether `on_render` has to run before the widget is drawn again."""
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Mark the widget for redrawing.
+
+        The widget is redrawn (`on_render` is called) the next time it is
+        rendered, and its area (including its focus outline) is reported as
+        changed to the container.
+        """
+        self._dirty = True
+        self.container.mark_dirty(self.rect.inflate(2, 2))
 
     def on_key_down(self, event: PkEvent) -> None:
         """Handle the key down event.
@@ -286,79 +330,105 @@ class PkWidget(PkObject):
     def on_render(self) -> None:
         """Render the widget.
 
-        This method is called every frame to render the widget.
+        This method is called to redraw the widget's surface when the widget
+        is dirty. Otherwise, the surface drawn previously is reused.
+        Call `mark_dirty` whenever the widget's appearance should change.
         """
         pass
 
-    def update(self, delta: float) -> None:
-        """Update the widget.
+    def handle_event(self, event: PkEvent, hit: bool | None = None) -> None:
+        """Dispatch an event to the `on_*` methods.
 
-        This internal method is called every frame to update the widget.
-        NOTE: Do not override this method. Instead, override `on_update`.
+        NOTE: Do not override this method. Instead, override the `on_*`
+        methods.
 
         Args:
-            delta (float): The time in seconds since the last frame.
+            event (PkEvent): The event.
+            hit (bool | None, optional): Whether the mouse of a mouse event
+                is over the widget, as found by the container. Defaults to
+                None (test `abs_rect`).
         """
-        events: list[PkEvent] = self._input["events"]
-
-        for event in events:
-            if event.name == "KEYDOWN":
-                self.on_key_down(event)
-                if event.key == "escape":
-                    self.on_unfocus(event)
-                    self.focused = False
-            elif event.name == "KEYUP":
-                self.on_key_up(event)
-            elif event.name == "MOUSEMOTION":
+        name = event.name
+        if name == "KEYDOWN":
+            self.on_key_down(event)
+            if event.key == "escape" and self.focus_manager.focused is self:
+                self.focus_manager.unfocus(event)
+        elif name == "KEYUP":
+            self.on_key_up(event)
+        elif name in ("MOUSEMOTION", "MOUSEBUTTONDOWN", "MOUSEBUTTONUP"):
+            if hit is None:
+                hit = self.abs_rect.collidepoint(event.pos)
+
+            if name == "MOUSEMOTION":
                 self.on_mouse_motion(event)
-                if self.abs_rect.collidepoint(event.pos):
-                    if not self.abs_rect.collidepoint(self._last_mouse_pos):
+                # the widget is hovered if the previous motion hit it
+                if hit:
+                    if not self.hovered:
                         self.on_mouse_enter(event)
                     self.hovered = True
                     self.on_hover(event)
                 else:
-                    if self.abs_rect.collidepoint(self._last_mouse_pos):
+                    if self.hovered:
                         self.on_mouse_leave(event)
                     self.hovered = False
-                self._last_mouse_pos = event.pos
-            elif event.name == "MOUSEBUTTONDOWN":
-                if self.abs_rect.collidepoint(event.pos):
+            elif name == "MOUSEBUTTONDOWN":
+                if hit:
                     self.on_mouse_down(event)
-                    self.on_focus(event)
-                    self.focused = True
+                    self.focus_manager.focus(self, event)
                     self.pressed = True
                 else:
-                    self.on_unfocus(event)
-                    self.focused = False
-                    self.pressed = False
-            elif event.name == "MOUSEBUTTONUP":
-                if self.abs_rect.collidepoint(event.pos):
-                    self.on_mouse_up(event)
-                    if self.pressed:
-                        self.on_click(event)
-                    self.pressed = False
-                else:
+                    if self.focus_manager.focused is self:
+                        self.focus_manager.unfocus(event)
                     self.pressed = False
+            elif hit:
+                self.on_mouse_up(event)
+                if self.pressed:
+                    self.on_click(event)
+                self.pressed = False
+            else:
+                self.pressed = False
+
+    def update(self, delta: float, *, dispatch: bool = True) -> None:
+        """Update the widget.
+
+        This internal method is called every frame to update the widget.
+        NOTE: Do not override this method. Instead, override `on_update`.
+
+        Args:
+            delta (float): The time in seconds since the last frame.
+            dispatch (bool, optional): Whether to dispatch the input events
+                with `handle_event` first. The container dispatches them
+                itself. Defaults to True.
+        """
+        if dispatch:
+            for event in self._input.events:
+                self.handle_event(event)
 
         self.on_update(delta)
 
+    @trace()
     def render(self) -> None:
         """Render the widget.
 
         This internal method is called every frame to render the widget.
+        `on_render` is only called if the widget is dirty.
         NOTE: Do not override this method. Instead, override `on_render`.
         """
         if not self.visible:
             return
 
-        self.on_render()
+        if self._dirty:
+            self._dirty = False
+            self.on_render()
+            if self.focused:
+                self.surface.draw_rect(
+                    (0, 0, self.rect.w, self.rect.h),
+                    self.inner_outline,
+                    width=1,
+                )
+
         # if focused, draw outline
         if self.focused:
-            self.surface.draw_rect(
-                (0, 0, self.rect.w, self.rect.h),
-                self.inner_outline,
-                width=1,
-            )
             outline_rect = self.rect.inflate(2, 2)
             self.container.surface.draw_rect(
                 outline_rect,
@@ -1,7 +1,16 @@
+import json
 import pytest
+import threading
 import time as t
 from unittest import mock
-from puffkit.decorators.timing import measure_execution_time, Timer
+from puffkit.decorators.timing import (
+    PkTimingRegistry,
+    PkTimingStat,
+    measure_execution_time,
+    Timer,
+    trace,
+    tracer,
+)
 
 
 @measure_execution_time
@@ -30,3 +39,283 @@ def test_timer_context_edge_case() -> None:
     with Timer() as timer:
         pass
     assert timer.elapsed < 0.01
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    """Start tracing to a temporary file, stopping afterwards."""
+    path = tmp_path / "trace.json"
+    tracer.start(str(path))
+    yield path
+    tracer.stop()
+
+
+def _events(path) -> list[dict]:
+    tracer.stop()
+    return json.loads(path.read_text())
+
+
+@trace()
+def traced_function(depth: int) -> int:
+    """Sample function recursing into itself to record nested spans."""
+    if depth:
+        traced_function(depth - 1)
+    return depth
+
+
+def test_trace_disabled() -> None:
+    """Test that traced functions run normally while tracing is stopped."""
+    assert tracer.active is False
+    assert traced_function(1) == 1
+
+
+def test_trace(trace_path) -> None:
+    """Test that nested calls are written as Chrome trace events."""
+    assert traced_function(1) == 1
+    events = _events(trace_path)
+    assert [event["name"] for event in events] == [
+        "traced_function",
+        "traced_function",
+    ]
+    inner, outer = events
+    assert outer["ph"] == "X"
+    assert outer["cat"] == "puffkit"
+    assert outer["ts"] <= inner["ts"]
+    assert outer["ts"] + outer["dur"] >= inner["ts"] + inner["dur"]
+
+
+def test_trace_exception(trace_path) -> None:
+    """Test that spans are recorded when the function raises."""
+
+    @trace("failing", category="test")
+    def failing() -> None:
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        failing()
+    (event,) = _events(trace_path)
+    assert event["name"] == "failing"
+    assert event["cat"] == "test"
+
+
+def test_trace_sampling(tmp_path) -> None:
+    """Test that nested spans follow the sampling of their top-level span."""
+    path = tmp_path / "trace.json"
+    tracer.start(str(path), sample_rate=0.5)
+    with mock.patch("puffkit.decorators.timing.random.random") as random:
+        random.side_effect = [0.9, 0.1]
+        traced_function(2)
+        traced_function(1)
+    assert len(_events(path)) == 2
+
+
+def test_tracer_start_twice(trace_path) -> None:
+    """Test that tracing can't be started twice."""
+    with pytest.raises(RuntimeError):
+        tracer.start(str(trace_path))
+
+
+def test_tracer_start_thread_error(tmp_path) -> None:
+    """Test that the trace file is closed if the writer thread can't start."""
+    path = tmp_path / "trace.json"
+    with mock.patch(
+        "puffkit.decorators.timing.threading.Thread.start",
+        side_effect=RuntimeError("can't start new thread"),
+    ):
+        with pytest.raises(RuntimeError):
+            tracer.start(str(path))
+    assert tracer.active is False
+    # written out by closing the file
+    assert path.read_text() == "[\n"
+
+
+@pytest.mark.parametrize("sample_rate", [-0.1, 1.1])
+def test_tracer_invalid_sample_rate(tmp_path, sample_rate: float) -> None:
+    """Test that an invalid sample rate is rejected."""
+    with pytest.raises(ValueError):
+        tracer.start(str(tmp_path / "trace.json"), sample_rate=sample_rate)
+    assert tracer.active is False
+
+
+def test_tracer_stop_inactive() -> None:
+    """Test that stopping a stopped tracer does nothing."""
+    tracer.stop()
+    assert tracer.active is False
+
+
+def test_timer_trace(trace_path) -> None:
+    """Test that named timers are recorded as spans."""
+    with Timer("named"):
+        pass
+    with Timer():
+        pass
+    (event,) = _events(trace_path)
+    assert event["name"] == "named"
+
+
+@pytest.fixture
+def registry() -> PkTimingRegistry:
+    return PkTimingRegistry()
+
+
+def test_measure_execution_time_records(monkeypatch, registry) -> None:
+    """Test that measured functions feed the timing registry."""
+    monkeypatch.setattr("puffkit.decorators.timing.timing_registry", registry)
+    sample_function(0)
+    sample_function(0)
+    assert registry.stats["sample_function"].count == 2
+
+
+def test_timer_records(monkeypatch, registry) -> None:
+    """Test that named timers feed the timing registry."""
+    monkeypatch.setattr("puffkit.decorators.timing.timing_registry", registry)
+    with Timer("block") as timer:
+        pass
+    with Timer():
+        pass
+    assert list(registry.stats) == ["block"]
+    assert registry.stats["block"].total_ns == pytest.approx(
+        timer.elapsed * 1e9, abs=1
+    )
+
+
+def test_timing_stat_empty() -> None:
+    """Test statistics without recorded durations."""
+    stat = PkTimingStat("empty")
+    assert stat.percentile(50) == 0
+    assert stat.snapshot() == {
+        "count": 0,
+        "total": 0.0,
+        "mean": 0.0,
+        "min": 0.0,
+        "max": 0.0,
+        "p50": 0.0,
+        "p95": 0.0,
+        "p99": 0.0,
+    }
+
+
+def test_timing_stat_small_values() -> None:
+    """Test that small durations are counted exactly."""
+    stat = PkTimingStat("small")
+    for value in (3, 1, 2):
+        stat.record(value)
+    assert (stat.min_ns, stat.max_ns, stat.total_ns) == (1, 3, 6)
+    assert [stat.percentile(p) for p in (0, 50, 100)] == [1, 2, 3]
+
+
+def test_timing_stat_percentiles() -> None:
+    """Test that percentiles are within the histogram precision."""
+    stat = PkTimingStat("large")
+    for value in range(1, 100_001):
+        stat.record(value * 1000)
+    for percentile in (50, 95, 99):
+        assert stat.percentile(percentile) == pytest.approx(
+            percentile * 1_000_000, rel=0.02
+        )
+    assert stat.percentile(100) == 100_000_000
+    snapshot = stat.snapshot()
+    assert snapshot["count"] == 100_000
+    assert snapshot["mean"] == pytest.approx(0.05, rel=0.001)
+    assert snapshot["max"] == 0.1
+    assert len(stat.buckets) <= 32 * 17
+
+
+def test_timing_registry_snapshot(registry) -> None:
+    """Test getting the statistics of all names."""
+    registry.record("a", 1000)
+    registry.record("a", 3000)
+    registry.record("b", 10)
+    snapshot = registry.snapshot()
+    assert set(snapshot) == {"a", "b"}
+    assert snapshot["a"]["count"] == 2
+    assert snapshot["a"]["total"] == 4e-6
+
+
+def test_timing_registry_report(registry) -> None:
+    """Test formatting the statistics as a table."""
+    registry.record("fast", 10)
+    registry.record("slow", 10_000_000)
+    lines = registry.report().splitlines()
+    assert lines[0].split() == [
+        "name",
+        "count",
+        "total",
+        "mean",
+        "p50",
+        "p95",
+        "p99",
+        "max",
+    ]
+    assert lines[1].startswith("slow")
+    assert "10.000ms" in lines[1]
+    assert lines[2].startswith("fast")
+
+
+def test_timing_registry_flush() -> None:
+    """Test that statistics are flushed every interval."""
+    on_flush = mock.Mock()
+    registry = PkTimingRegistry(flush_interval=1.0, on_flush=on_flush)
+    start = registry._last_flush_ns
+    registry.record("a", 10, start + 500_000_000)
+    on_flush.assert_not_called()
+
+    registry.record("a", 20, start + 1_000_000_000)
+    (snapshot,), _ = on_flush.call_args
+    assert snapshot["a"]["count"] == 2
+    assert registry.stats == {}
+    assert registry._last_flush_ns == start + 1_000_000_000
+
+
+def test_timing_registry_flush_logged(caplog) -> None:
+    """Test that flushed statistics are logged without a callback."""
+    registry = PkTimingRegistry(flush_interval=0)
+    with caplog.at_level("DEBUG"):
+        registry.record("logged", 10)
+    assert "logged" in caplog.text
+    assert registry.stats == {}
+
+
+def test_timing_registry_reset(registry) -> None:
+    """Test forgetting recorded durations."""
+    registry.record("a", 10)
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_timing_registry_flush_manual() -> None:
+    """Test flushing on demand, with a callback recording durations."""
+    registry = PkTimingRegistry()
+    snapshots = []
+
+    def on_flush(snapshot: dict) -> None:
+        snapshots.append(snapshot)
+        # called without the lock held
+        registry.record("flush", 10)
+
+    registry.on_flush = on_flush
+    registry.record("a", 10)
+    registry.flush()
+    assert list(snapshots[0]) == ["a"]
+    assert list(registry.stats) == ["flush"]
+
+
+def test_timing_registry_threads() -> None:
+    """Test that no durations are lost when recording from many threads."""
+    registry = PkTimingRegistry(flush_interval=0.001, on_flush=mock.Mock())
+    counts = []
+    registry.on_flush.side_effect = lambda snapshot: counts.extend(
+        stats["count"] for stats in snapshot.values()
+    )
+
+    def record() -> None:
+        for i in range(1000):
+            registry.record(f"name{i % 10}", 10)
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    registry.flush()
+    assert sum(counts) == 8 * 1000
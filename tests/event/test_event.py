@@ -1,7 +1,13 @@
 import pytest
 from unittest import mock
 import pygame as pg
-from puffkit.event.event import PkEvent
+from puffkit.event.event import (
+    PkEvent,
+    PkKeyEvent,
+    PkMouseEvent,
+    PkTextEvent,
+    event_name,
+)
 
 
 @pytest.mark.parametrize(
@@ -15,7 +21,9 @@ def test_pk_event_initialization(name: str, event_dict: dict, kwargs: dict) -> N
     """Test the initialization of PkEvent."""
     event = PkEvent(name, event_dict, **kwargs)
     assert event.name == name
-    assert event.dict == event_dict
+    assert event.dict == {**event_dict, **kwargs}
+    for key, value in event_dict.items():
+        assert getattr(event, key) == value
     for key, value in kwargs.items():
         assert getattr(event, key) == value
 
@@ -41,20 +49,113 @@ def test_pk_event_getattribute() -> None:
 def test_pk_event_setattr() -> None:
     """Test setting an attribute in PkEvent."""
     event = PkEvent("test_event", {"key": "value"})
-    event.__setattr__("new_attr", "new_value")
-    assert event.new_attr == "new_value"
+    event.__setattr__("name", "new_value")
+    assert event.name == "new_value"
+
+    # other names are stored in the event dictionary
+    event.handled = True
+    assert event.handled is True
+    assert event.dict["handled"] is True
+
+    key_event = PkKeyEvent("KEYDOWN", {"key": "a"})
+    key_event.handled = True
+    assert key_event.dict == {"key": "a", "handled": True}
 
 
 def test_pk_event_delattr() -> None:
     """Test deleting an attribute from PkEvent."""
     event = PkEvent("test_event", {"key": "value"})
-    event.__setattr__("new_attr", "new_value")
-    event.__delattr__("new_attr")
+    event.__delattr__("name")
+    with pytest.raises(AttributeError):
+        getattr(event, "name")
     with pytest.raises(AttributeError):
-        getattr(event, "new_attr")
+        getattr(event, "missing")
+
+    event = PkEvent("test_event", {"key": "value"})
+    del event.key
+    assert event.dict == {}
+    with pytest.raises(AttributeError, match="has no attribute 'key'"):
+        del event.key
 
 
 def test_pk_event_bool() -> None:
     """Test the truthiness of PkEvent."""
     event = PkEvent("test_event", {"key": "value"})
     assert bool(event) is True
+
+
+def test_event_name() -> None:
+    """Test that event names are upper case and interned."""
+    name = event_name(pg.MOUSEMOTION)
+    assert name == "MOUSEMOTION"
+    assert event_name(pg.MOUSEMOTION) is name
+    assert PkEvent("".join(["MOUSE", "MOTION"]), {}).name is name
+
+
+@pytest.mark.parametrize(
+    "pg_event, event_class, attrs",
+    [
+        (
+            pg.event.Event(pg.KEYDOWN, key="a", unicode="a", mod=1, scancode=4),
+            PkKeyEvent,
+            {"name": "KEYDOWN", "key": "a", "unicode": "a", "mod": 1, "scancode": 4},
+        ),
+        (
+            pg.event.Event(pg.KEYUP, key="a"),
+            PkKeyEvent,
+            {"name": "KEYUP", "key": "a", "unicode": "", "mod": 0, "scancode": 0},
+        ),
+        (
+            pg.event.Event(pg.MOUSEMOTION, pos=(1, 2), rel=(3, 4), buttons=(1, 0, 0)),
+            PkMouseEvent,
+            {"pos": (1, 2), "rel": (3, 4), "buttons": (1, 0, 0), "button": 0},
+        ),
+        (
+            pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(1, 2), button=3, touch=False),
+            PkMouseEvent,
+            {"pos": (1, 2), "button": 3, "touch": False},
+        ),
+        (
+            pg.event.Event(pg.TEXTINPUT, text="x"),
+            PkTextEvent,
+            {"name": "TEXTINPUT", "text": "x"},
+        ),
+        (
+            pg.event.Event(pg.QUIT),
+            PkEvent,
+            {"name": "QUIT", "type": pg.QUIT},
+        ),
+    ],
+)
+def test_pk_event_from_pygame_typed(pg_event, event_class, attrs) -> None:
+    """Test that pygame events are converted to the typed event classes."""
+    event = PkEvent.from_pygame(pg_event)
+    assert type(event) is event_class
+    assert event.type == pg_event.type
+    for key, value in attrs.items():
+        assert getattr(event, key) == value
+
+
+def test_pk_event_typed_values_in_dict() -> None:
+    """Test that typed values are stored in the event dictionary only."""
+    event = PkMouseEvent("MOUSEMOTION", {"pos": (1, 2)})
+    event.pos = (3, 4)
+    assert event.dict["pos"] == (3, 4)
+    event.dict["pos"] = (5, 6)
+    assert event.pos == (5, 6)
+    del event.pos
+    assert event.pos == (0, 0)
+
+
+def test_pk_event_typed_from_pygame() -> None:
+    """Test that from_pygame on an event class creates that class."""
+    event = PkTextEvent.from_pygame(pg.event.Event(pg.USEREVENT, text="x"))
+    assert type(event) is PkTextEvent
+    assert event.text == "x"
+
+
+def test_pk_event_slots() -> None:
+    """Test that events have no instance dictionary."""
+    for event_class in (PkEvent, PkKeyEvent, PkMouseEvent, PkTextEvent):
+        event = event_class("TEST", {})
+        assert not hasattr(event, "__dict__")
@@ -97,3 +97,203 @@ def test_update(
 
     event_manager.update(0.1)
     mock_input.assert_called_once()
+
+
+def test_wait(event_manager: PkEventManager):
+    """Test that an event received while waiting is handled in the update."""
+    pygame.event.clear()
+    assert event_manager.wait(0.01) is False
+
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, value=1))
+    assert event_manager.wait(1) is True
+    assert pygame.event.peek() is False
+
+    with patch("puffkit.scene.scene_manager.PkSceneManager.input"):
+        event_manager.update(0.1)
+    assert [event.value for event in event_manager.events] == [1]
+
+
+def test_update_skips_wake_events(event_manager: PkEventManager):
+    """Test that wake events are not dispatched."""
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(PkEventManager.WAKE_EVENT))
+    assert event_manager.wait(1) is True
+
+    with patch("puffkit.scene.scene_manager.PkSceneManager.input"):
+        event_manager.update(0.1)
+    assert event_manager.events == []
+
+
+def _event(type_: int) -> PkEvent:
+    return PkEvent.from_pygame(pygame.event.Event(type_))
+
+
+def test_subscribe_multiple_handlers(event_manager: PkEventManager):
+    """Test that every subscribed handler receives the events of its type."""
+    calls = []
+    event_manager.subscribe(pygame.KEYDOWN, lambda e: calls.append(("a", e.name)))
+    event_manager.subscribe(pygame.KEYDOWN, lambda e: calls.append(("b", e.name)))
+    event_manager.subscribe(pygame.KEYUP, lambda e: calls.append(("c", e.name)))
+
+    event_manager.handle_events([_event(pygame.KEYDOWN), _event(pygame.QUIT)])
+    assert calls == [("a", "KEYDOWN"), ("b", "KEYDOWN")]
+
+
+def test_subscribe_priority(event_manager: PkEventManager):
+    """Test that higher priorities are called first, then by subscribing order."""
+    calls = []
+    event_manager.subscribe(pygame.KEYDOWN, lambda e: calls.append(1))
+    event_manager.subscribe(None, lambda e: calls.append(2), priority=5)
+    event_manager.subscribe(pygame.KEYDOWN, lambda e: calls.append(3), priority=5)
+    event_manager.subscribe(pygame.KEYDOWN, lambda e: calls.append(4), priority=-1)
+    event_manager.subscribe(None, lambda e: calls.append(5))
+
+    event_manager.handle_events([_event(pygame.KEYDOWN)])
+    assert calls == [2, 3, 1, 5, 4]
+
+
+def test_subscribe_wildcard(event_manager: PkEventManager):
+    """Test that wildcard handlers receive events of every type."""
+    handler = Mock()
+    event_manager.subscribe(pygame.KEYUP, Mock())
+    event_manager.subscribe(None, handler)
+    event_manager.subscribe(pygame.KEYDOWN, Mock())
+
+    events = [_event(pygame.KEYUP), _event(pygame.KEYDOWN), _event(pygame.QUIT)]
+    event_manager.handle_events(events)
+    assert [c.args[0] for c in handler.call_args_list] == events
+
+
+def test_subscribe_once(event_manager: PkEventManager):
+    """Test that one-shot handlers are only called for the first event."""
+    handler = Mock()
+    wildcard = Mock()
+    subscription = event_manager.subscribe(pygame.KEYDOWN, handler, once=True)
+    event_manager.subscribe(None, wildcard, once=True)
+
+    event_manager.handle_events([_event(pygame.KEYDOWN), _event(pygame.KEYDOWN)])
+    handler.assert_called_once()
+    wildcard.assert_called_once()
+    assert subscription.active is False
+
+
+def test_unsubscribe(event_manager: PkEventManager):
+    """Test that unsubscribed handlers are not called anymore."""
+    handler = Mock()
+    wildcard = Mock()
+    subscription = event_manager.subscribe(pygame.KEYDOWN, handler)
+    wildcard_subscription = event_manager.subscribe(None, wildcard)
+    event_manager.unsubscribe(subscription)
+    event_manager.unsubscribe(wildcard_subscription)
+
+    event_manager.handle_events([_event(pygame.KEYDOWN), _event(pygame.QUIT)])
+    handler.assert_not_called()
+    wildcard.assert_not_called()
+
+    with patch.object(event_manager.logger, "warning") as warning:
+        event_manager.unsubscribe(subscription)
+    warning.assert_called_once()
+
+
+def test_unsubscribe_while_dispatching(event_manager: PkEventManager):
+    """Test that a handler unsubscribed by another one is not called."""
+    second = Mock()
+    subscriptions = []
+    event_manager.subscribe(
+        pygame.KEYDOWN, lambda e: event_manager.unsubscribe(subscriptions[0])
+    )
+    subscriptions.append(event_manager.subscribe(pygame.KEYDOWN, second))
+
+    event_manager.handle_events([_event(pygame.KEYDOWN)])
+    second.assert_not_called()
+
+
+def test_handle_events_subscribers_and_handlers(event_manager: PkEventManager):
+    """Test that name handlers are called after the subscribed handlers."""
+    calls = []
+    event_manager.add_handler("QUIT", lambda e: calls.append("handler"))
+    event_manager.subscribe(pygame.QUIT, lambda e: calls.append("subscriber"))
+
+    event_manager.handle_events([_event(pygame.QUIT)])
+    assert calls == ["subscriber", "handler"]
+
+
+def _motion(pos, rel, buttons=(0, 0, 0)) -> pygame.event.Event:
+    return pygame.event.Event(
+        pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=buttons
+    )
+
+
+def test_coalesce_motion():
+    """Test that consecutive motions with the same buttons are merged."""
+    down = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(3, 3), button=1)
+    events = PkEventManager._coalesce_motion(
+        [
+            _motion((1, 1), (1, 1)),
+            _motion((2, 3), (1, 2)),
+            _motion((3, 3), (1, 0)),
+            down,
+            _motion((4, 3), (1, 0), (1, 0, 0)),
+            _motion((6, 3), (2, 0), (1, 0, 0)),
+            _motion((7, 3), (1, 0)),
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(8, 3)),
+        ]
+    )
+
+    assert [(e.type, e.dict) for e in events] == [
+        (pygame.MOUSEMOTION, {"pos": (3, 3), "rel": (3, 3), "buttons": (0, 0, 0)}),
+        (pygame.MOUSEBUTTONDOWN, {"pos": (3, 3), "button": 1}),
+        (pygame.MOUSEMOTION, {"pos": (6, 3), "rel": (3, 0), "buttons": (1, 0, 0)}),
+        (pygame.MOUSEMOTION, {"pos": (7, 3), "rel": (1, 0), "buttons": (0, 0, 0)}),
+        (pygame.MOUSEMOTION, {"pos": (8, 3)}),
+    ]
+
+
+@pytest.mark.parametrize("coalesce_motion, count", [(True, 1), (False, 3)])
+def test_update_coalesce_motion(app, coalesce_motion: bool, count: int):
+    """Test that the update coalesces motion events if enabled."""
+    event_manager = PkEventManager(app, coalesce_motion=coalesce_motion)
+    with (
+        patch(
+            "puffkit.event.event_manager.pg.event.get",
+            return_value=[_motion((i, i), (1, 1)) for i in range(3)],
+        ),
+        patch("puffkit.scene.scene_manager.PkSceneManager.input"),
+    ):
+        event_manager.update(0.1)
+    assert len(event_manager.events) == count
+
+
+def test_auto_block(app):
+    """Test that event types no handler is subscribed to are blocked."""
+    event_manager = PkEventManager(app)
+    assert not pygame.event.get_blocked(pygame.VIDEORESIZE)
+
+    try:
+        event_manager.auto_block = True
+        assert event_manager.auto_block is True
+        assert pygame.event.get_blocked(pygame.VIDEORESIZE)
+        assert pygame.event.get_blocked(pygame.QUIT)
+        assert not pygame.event.get_blocked(pygame.KEYDOWN)
+        assert not pygame.event.get_blocked(PkEventManager.WAKE_EVENT)
+
+        subscription = event_manager.subscribe(pygame.VIDEORESIZE, Mock())
+        event_manager.add_handler("QUIT", Mock())
+        event_manager.add_handler("custom_event", Mock())
+        assert not pygame.event.get_blocked(pygame.VIDEORESIZE)
+        assert not pygame.event.get_blocked(pygame.QUIT)
+
+        event_manager.unsubscribe(subscription)
+        event_manager.remove_handler("QUIT")
+        assert pygame.event.get_blocked(pygame.VIDEORESIZE)
+        assert pygame.event.get_blocked(pygame.QUIT)
+
+        # a wildcard handler receives all events
+        wildcard = event_manager.subscribe(None, Mock())
+        assert not pygame.event.get_blocked(pygame.VIDEORESIZE)
+        event_manager.unsubscribe(wildcard)
+        assert pygame.event.get_blocked(pygame.VIDEORESIZE)
+    finally:
+        event_manager.auto_block = False
+    assert not pygame.event.get_blocked(pygame.VIDEORESIZE)
+    assert not pygame.event.get_blocked(pygame.QUIT)
@@ -49,7 +49,7 @@ def test_pkfont_render(
 ) -> None:
     """Test the render method of PkFont."""
     font = PkFont(None, 12)
-    mock_surface = mock.Mock()
+    mock_surface = pg.Surface((10, 10))
     mock_pygame_font.return_value.render.return_value = mock_surface
 
     with mock.patch(
@@ -88,3 +88,157 @@ def test_pkfont_label(mock_pygame_font) -> None:
     """Test the label property of PkFont."""
     font = PkFont(None, 12)
     assert font.label == font.font.name
+
+
+@pytest.fixture
+def font() -> PkFont:
+    pg.font.init()
+    return PkFont(None, 12)
+
+
+def test_pkfont_render_cache_hit(font: PkFont) -> None:
+    """Test that rendering the same text twice uses the cache."""
+    first = font.render("cached", color=PkColor(1, 2, 3))
+    second = font.render("cached", color=PkColor(1, 2, 3))
+    assert first is second
+    assert font.cache_hits == 1
+    assert font.cache_misses == 1
+    assert font.cache_bytes > 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"antialias": False},
+        {"color": PkColor(0, 0, 0)},
+        {"bgcolor": PkColor(0, 0, 0)},
+        {"max_width": 100},
+        {"align": pg.FONT_CENTER},
+    ],
+)
+def test_pkfont_render_cache_key(font: PkFont, kwargs: dict) -> None:
+    """Test that every render argument is part of the cache key."""
+    first = font.render("key")
+    second = font.render("key", **kwargs)
+    assert first is not second
+    assert font.cache_misses == 2
+
+
+def test_pkfont_render_cache_eviction(font: PkFont) -> None:
+    """Test that least recently used text is evicted over the byte limit."""
+    font.render("a")
+    font.cache_max_bytes = font.cache_bytes * 2
+    font.render("b")
+    font.render("a")
+    font.render("c")
+    assert font.cache_evictions == 1
+    assert font.cache_bytes <= font.cache_max_bytes
+
+    # "b" was evicted, "a" was kept
+    font.render("a")
+    assert font.cache_hits == 2
+    font.render("b")
+    assert font.cache_misses == 4
+
+
+def test_pkfont_render_cache_disabled() -> None:
+    """Test that a cache limit of 0 disables the cache."""
+    pg.font.init()
+    font = PkFont(None, 12, cache_max_bytes=0)
+    assert font.render("text") is not font.render("text")
+    assert font.cache_bytes == 0
+    assert font.cache_evictions == 0
+
+
+def test_pkfont_clear_cache(font: PkFont) -> None:
+    """Test clearing the cache."""
+    first = font.render("text")
+    font.clear_cache()
+    assert font.cache_bytes == 0
+    assert font.render("text") is not first
+
+
+def test_pkfont_negative_cache_limit() -> None:
+    """Test that a negative cache limit is rejected."""
+    pg.font.init()
+    with pytest.raises(ValueError):
+        PkFont(None, 12, cache_max_bytes=-1)
+
+
+@pytest.fixture
+def atlas_font() -> PkFont:
+    pg.font.init()
+    return PkFont(None, 20, glyph_atlas=True)
+
+
+def _alpha_columns(surface: PkSurface) -> list[int]:
+    internal_surface = surface.internal_surface
+    return [
+        sum(
+            internal_surface.get_at((x, y)).a
+            for y in range(internal_surface.get_height())
+        )
+        for x in range(internal_surface.get_width())
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, max_width, align",
+    [
+        ("12:34.56", None, pg.FONT_LEFT),
+        ("AVAW", None, pg.FONT_LEFT),
+        ("12:34", 200, pg.FONT_CENTER),
+        ("12:34", 200, pg.FONT_RIGHT),
+        ("12:34", 200, pg.FONT_LEFT),
+    ],
+)
+def test_pkfont_render_glyph_atlas(
+    atlas_font: PkFont, text: str, max_width: int | None, align: int
+) -> None:
+    """Test that text composed from the glyph atlas matches rendered text."""
+    expected = PkFont(None, 20).render(text, max_width=max_width, align=align)
+    result = atlas_font.render(text, max_width=max_width, align=align)
+    assert result.size == expected.size
+    assert _alpha_columns(result) == _alpha_columns(expected)
+    assert atlas_font.cache_misses == 0
+
+
+def test_pkfont_render_glyph_atlas_bgcolor(atlas_font: PkFont) -> None:
+    """Test composing text on a background color."""
+    result = atlas_font.render("0", bgcolor=PkColor(1, 2, 3))
+    assert result.get_at((0, 0)) == PkColor(1, 2, 3)
+    assert result.get_alpha() is None
+
+
+def test_pkfont_render_glyph_atlas_reuses_glyphs(atlas_font: PkFont) -> None:
+    """Test that glyphs are rasterized once per color."""
+    atlas_font.render("1212")
+    atlas_font.render("21", color=PkColor(0, 0, 0))
+    assert len(atlas_font._atlases) == 2
+    atlas = atlas_font.get_atlas(True, (255, 255, 255, 255))
+    assert set(atlas.glyphs) == {"1", "2"}
+
+
+@pytest.mark.parametrize(
+    "text, max_width", [("", None), ("multi\nline", None), ("wrapped text", 10)]
+)
+def test_pkfont_render_glyph_atlas_fallback(
+    atlas_font: PkFont, text: str, max_width: int | None
+) -> None:
+    """Test that text the atlas can't compose is rendered as a whole."""
+    atlas_font.render(text, max_width=max_width)
+    assert atlas_font.cache_misses == 1
+
+
+def test_pkfont_get_kerning(atlas_font: PkFont) -> None:
+    """Test that kerning between characters is measured once."""
+    kerning = atlas_font.get_kerning("A", "V")
+    assert kerning < 0
+    atlas_font.font = mock.Mock()
+    assert atlas_font.get_kerning("A", "V") == kerning
+    atlas_font.font.size.assert_not_called()
+
+
+def test_pkfont_get_kerning_unknown_glyph(atlas_font: PkFont) -> None:
+    """Test kerning with characters the font has no glyph for."""
+    assert atlas_font.get_kerning("\U0001f600", "a") == 0
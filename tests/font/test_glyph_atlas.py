@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Tests for the PkGlyphAtlas class."""
+
+import pygame as pg
+import pytest
+
+from puffkit.font.glyph_atlas import PkGlyphAtlas
+
+
+@pytest.fixture
+def atlas() -> PkGlyphAtlas:
+    pg.font.init()
+    return PkGlyphAtlas(pg.font.Font(None, 20), True, (255, 0, 0, 255))
+
+
+def test_pkglyphatlas_initialization(atlas: PkGlyphAtlas) -> None:
+    """Test the initialization of PkGlyphAtlas."""
+    assert atlas.antialias is True
+    assert atlas.color == (255, 0, 0, 255)
+    assert atlas.glyphs == {}
+    assert atlas.surface.get_size() == (0, 0)
+
+
+def test_pkglyphatlas_glyph(atlas: PkGlyphAtlas) -> None:
+    """Test that a glyph is rasterized onto the atlas once."""
+    area = atlas.glyph("A")
+    expected = atlas.font.render("A", True, (255, 0, 0))
+    assert area.size == expected.get_size()
+    assert atlas.advances["A"] == atlas.font.metrics("A")[0][4]
+    assert atlas.glyph("A") is area
+    assert len(atlas.glyphs) == 1
+
+
+def test_pkglyphatlas_layout(atlas: PkGlyphAtlas) -> None:
+    """Test that glyphs are laid out side by side as the atlas grows."""
+    areas = [atlas.glyph(char) for char in "0123456789"]
+    for previous, area in zip(areas, areas[1:]):
+        assert area.left == previous.right
+    assert atlas.surface.get_width() >= areas[-1].right
+    for area in areas:
+        assert atlas.surface.subsurface(area).get_bounding_rect().w > 0
+
+
+def test_pkglyphatlas_unknown_glyph(atlas: PkGlyphAtlas) -> None:
+    """Test that glyphs missing from the font advance by their width."""
+    area = atlas.glyph("\U0001f600")
+    assert atlas.advances["\U0001f600"] == area.width
@@ -1,6 +1,9 @@
+import copy
+import pickle
+
 import pytest
 
-from puffkit.geometry.coordinate import PkCoordinate
+from puffkit.geometry.coordinate import PkCoordinate, PkFrozenCoordinate
 
 
 
@@ -166,3 +169,30 @@ def test_from_tuple(coord_tuple: tuple[int, int], expected: PkCoordinate) -> Non
     """Test the from_tuple class method of PkCoordinate."""
     coord = PkCoordinate.from_tuple(coord_tuple)
     assert coord == expected
+
+
+def test_pkcoordinate_slots() -> None:
+    """Test that PkCoordinate has no instance dictionary."""
+    assert not hasattr(PkCoordinate(1, 2), "__dict__")
+
+
+def test_pkfrozencoordinate() -> None:
+    """Test that a frozen coordinate is immutable and hashable."""
+    value = PkCoordinate(1, 2)
+    frozen = value.freeze()
+    assert isinstance(frozen, PkFrozenCoordinate)
+    assert frozen == value
+    assert frozen.freeze() is frozen
+    assert hash(frozen) == hash((1, 2)) == hash(PkFrozenCoordinate(1, 2))
+    assert len({frozen, PkFrozenCoordinate(1, 2)}) == 1
+
+    with pytest.raises(AttributeError):
+        frozen.x = 5
+    with pytest.raises(AttributeError):
+        del frozen.x
+    assert frozen.x == 1
+
+    assert copy.copy(frozen) == frozen
+    assert copy.deepcopy(frozen) == frozen
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert type(pickle.loads(pickle.dumps(frozen))) is PkFrozenCoordinate
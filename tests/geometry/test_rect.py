@@ -1,6 +1,10 @@
+import copy
+import pickle
+
+import pygame
 import pytest
 
-from puffkit.geometry.rect import PkRect, RectValue
+from puffkit.geometry.rect import PkRect, PkFrozenRect, RectValue
 
 
 
@@ -11,6 +15,10 @@ from puffkit.geometry.rect import PkRect, RectValue
         (0, 0, 10, 10, (15, 15), False),
         (-5, -5, 15, 15, (0, 0), True),
         (-5, -5, 15, 15, (-10, -10), False),
+        # left and top edges are inside, right and bottom edges are not
+        (0, 0, 10, 10, (0, 0), True),
+        (0, 0, 10, 10, (10, 5), False),
+        (0, 0, 10, 10, (5, 10), False),
     ],
 )
 def test_pkrect_collidepoint(
@@ -50,6 +58,12 @@ def test_pkrect_colliderect(
     rect1 = PkRect(x1, y1, w1, h1)
     rect2 = PkRect(x2, y2, w2, h2)
     assert rect1.colliderect(rect2) == expected_result
+    assert rect1.colliderect((x2, y2, w2, h2)) == expected_result
+    assert rect1.colliderect(pygame.FRect(x2, y2, w2, h2)) == expected_result
+    # same as pygame
+    assert (
+        pygame.FRect(x1, y1, w1, h1).colliderect(rect2) == expected_result
+    )
 
 
 @pytest.mark.parametrize(
@@ -458,3 +472,120 @@ def test_pkrect_inflate_ip() -> None:
     assert rect == PkRect(-5, -5, 20, 20)
     rect.inflate_ip(-10, -10)
     assert rect == PkRect(0, 0, 10, 10)
+
+
+@pytest.mark.parametrize(
+    "rect, expected",
+    [
+        (PkRect(0, 0, 10, 10), pygame.Rect(0, 0, 10, 10)),
+        (PkRect(0.5, 1.5, 10, 10), pygame.Rect(0, 1, 11, 11)),
+        (PkRect(-0.5, -1.5, 1, 1), pygame.Rect(-1, -2, 2, 2)),
+    ],
+)
+def test_to_pygame(rect: PkRect, expected: pygame.Rect) -> None:
+    assert rect.to_pygame() == expected
+
+
+def test_pkrect_slots() -> None:
+    """Test that PkRect has no instance dictionary."""
+    assert not hasattr(PkRect(1, 2, 3, 4), "__dict__")
+
+
+def test_pkfrozenrect() -> None:
+    """Test that a frozen rect is immutable and hashable."""
+    value = PkRect(1, 2, 3, 4)
+    frozen = value.freeze()
+    assert isinstance(frozen, PkFrozenRect)
+    assert frozen == value
+    assert frozen.freeze() is frozen
+    assert hash(frozen) == hash((1, 2, 3, 4)) == hash(PkFrozenRect(1, 2, 3, 4))
+    assert len({frozen, PkFrozenRect(1, 2, 3, 4)}) == 1
+
+    with pytest.raises(AttributeError):
+        frozen.x = 5
+    with pytest.raises(AttributeError):
+        del frozen.x
+    assert frozen.x == 1
+
+    with pytest.raises(AttributeError):
+        frozen.center = (0, 0)
+    with pytest.raises(AttributeError):
+        frozen.inflate_ip(1, 1)
+    assert frozen.inflate(2, 2) == (0, 1, 5, 6)
+    assert type(frozen.copy()) is PkRect
+
+    assert copy.copy(frozen) == frozen
+    assert copy.deepcopy(frozen) == frozen
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert type(pickle.loads(pickle.dumps(frozen))) is PkFrozenRect
+
+
+def test_pkrect_pygame_interop() -> None:
+    """Test that rects are passed to pygame without conversion."""
+    rect = PkRect(1.5, 2, 3, 4)
+    assert len(rect) == 4
+    assert pygame.FRect(rect) == pygame.FRect(1.5, 2, 3, 4)
+    assert rect.to_frect() == pygame.FRect(1.5, 2, 3, 4)
+    assert PkRect.from_pygame(rect.to_frect()) == rect
+
+    surface = pygame.Surface((10, 10))
+    surface.fill((255, 0, 0), rect)
+    assert surface.get_at((2, 3)) == (255, 0, 0)
+
+
+def test_pkrect_precision() -> None:
+    """Test that the values keep double precision."""
+    rect = PkRect(0.1, 1e9 + 0.5, 3, 4)
+    assert rect.x == 0.1
+    assert rect.move(1e9, 0).x == 1e9 + 0.1
+    assert rect.y == 1e9 + 0.5
+
+
+def test_pkrect_contains() -> None:
+    """Test the contains method of PkRect."""
+    rect = PkRect(0, 0, 10, 10)
+    assert rect.contains(PkRect(2, 2, 8, 8))
+    assert rect.contains((0, 0, 10, 10))
+    assert not rect.contains(PkRect(2, 2, 9, 8))
+    assert not rect.contains((-1, 0, 5, 5))
+
+
+def test_pkrect_move() -> None:
+    """Test the move and move_ip methods of PkRect."""
+    rect = PkRect(0, 0, 10, 10)
+    assert rect.move(2, -3) == (2, -3, 10, 10)
+    assert rect == (0, 0, 10, 10)
+    rect.move_ip(2, -3)
+    assert rect == (2, -3, 10, 10)
+
+
+def test_pkrect_union() -> None:
+    """Test the union and union_ip methods of PkRect."""
+    rect = PkRect(0, 0, 10, 10)
+    assert rect.union(PkRect(5, -5, 10, 10)) == (0, -5, 15, 15)
+    assert rect.union((2, 2, 2, 2)) == rect
+    assert rect.union((20, 20, 5, 5)) == pygame.FRect(rect).union(
+        (20, 20, 5, 5)
+    )
+
+    rect.union_ip((-5, 0, 1, 1))
+    assert rect == (-5, 0, 15, 10)
+
+
+def test_pkrect_clip() -> None:
+    """Test the clip method of PkRect."""
+    rect = PkRect(0, 0, 10, 10)
+    assert rect.clip(PkRect(5, 5, 10, 10)) == (5, 5, 5, 5)
+    assert rect.clip((-5, 2, 8, 4)) == (0, 2, 3, 4)
+    assert rect.clip((20, 20, 5, 5)) == (0, 0, 0, 0)
+    assert rect.clip((10, 0, 5, 5)) == (0, 0, 0, 0)
+
+
+def test_pkfrozenrect_in_place() -> None:
+    """Test that frozen rects can not be moved or grown in place."""
+    frozen = PkRect(0, 0, 10, 10).freeze()
+    with pytest.raises(AttributeError):
+        frozen.move_ip(1, 1)
+    with pytest.raises(AttributeError):
+        frozen.union_ip((20, 20, 1, 1))
+    assert frozen.move(1, 1) == (1, 1, 10, 10)
@@ -0,0 +1,164 @@
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from puffkit.geometry.rect import PkRect
+from puffkit.geometry.rect_array import PkRectArray
+
+
+@pytest.fixture
+def rects() -> list[PkRect]:
+    return [
+        PkRect(0, 0, 10, 10),
+        PkRect(5, 5, 10, 10),
+        PkRect(20, 0, 5, 5),
+        PkRect(-10, 30, 4, 4),
+    ]
+
+
+@pytest.fixture
+def rect_array(rects: list[PkRect]) -> PkRectArray:
+    return PkRectArray(rects)
+
+
+def test_pkrectarray_conversion(
+    rect_array: PkRectArray, rects: list[PkRect]
+) -> None:
+    """Test converting to and from lists of rects."""
+    assert len(rect_array) == 4
+    assert rect_array.to_rects() == rects
+    assert list(rect_array) == rects
+    assert rect_array[1] == rects[1]
+    assert isinstance(rect_array[1], PkRect)
+    assert rect_array.array.shape == (4, 4)
+    assert rect_array.array.dtype == np.float64
+
+    mixed = PkRectArray([(1, 2, 3, 4), pygame.Rect(5, 6, 7, 8)])
+    assert mixed.to_rects() == [(1, 2, 3, 4), (5, 6, 7, 8)]
+
+    empty = PkRectArray()
+    assert len(empty) == 0
+    assert empty.to_rects() == []
+
+
+def test_pkrectarray_from_array() -> None:
+    """Test creating a rect array from a NumPy array."""
+    data = np.array([[1, 2, 3, 4]], dtype=np.float64)
+    rect_array = PkRectArray.from_array(data)
+    assert rect_array.array is data
+    assert PkRectArray.from_array([[1, 2, 3, 4]])[0] == (1, 2, 3, 4)
+
+    with pytest.raises(ValueError, match=r"shape \(n, 4\)"):
+        PkRectArray.from_array(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        PkRectArray.from_array(np.zeros(4))
+
+
+def test_pkrectarray_columns(rect_array: PkRectArray) -> None:
+    """Test the column views and edges."""
+    assert rect_array.x.tolist() == [0, 5, 20, -10]
+    assert rect_array.y.tolist() == [0, 5, 0, 30]
+    assert rect_array.w.tolist() == [10, 10, 5, 4]
+    assert rect_array.h.tolist() == [10, 10, 5, 4]
+    assert rect_array.right.tolist() == [10, 15, 25, -6]
+    assert rect_array.bottom.tolist() == [10, 15, 5, 34]
+
+    # views write through
+    rect_array.x[0] = 1
+    assert rect_array[0] == (1, 0, 10, 10)
+    rect_array[0] = PkRect(2, 2, 2, 2)
+    assert rect_array[0] == (2, 2, 2, 2)
+    rect_array.move_ip(1, -1)
+    assert rect_array[0] == (3, 1, 2, 2)
+    assert rect_array[3] == (-9, 29, 4, 4)
+
+
+@pytest.mark.parametrize(
+    "point", [(0, 0), (5, 5), (9.5, 9.9), (10, 5), (22, 4), (100, 100)]
+)
+def test_pkrectarray_collidepoint(
+    rect_array: PkRectArray, rects: list[PkRect], point: tuple[float, float]
+) -> None:
+    """Test that point queries match PkRect.collidepoint."""
+    expected = [rect.collidepoint(point) for rect in rects]
+    assert rect_array.collidepoint(point).tolist() == expected
+
+
+def test_pkrectarray_collidepoints(
+    rect_array: PkRectArray, rects: list[PkRect]
+) -> None:
+    """Test testing several points at once."""
+    points = [(0, 0), (12, 12), (100, 100)]
+    result = rect_array.collidepoints(points)
+    assert result.shape == (3, 4)
+    assert result.tolist() == [
+        [rect.collidepoint(point) for rect in rects] for point in points
+    ]
+
+
+@pytest.mark.parametrize(
+    "rect", [(0, 0, 1, 1), (9, 9, 20, 20), (10, 0, 10, 5), (-20, 20, 100, 100)]
+)
+def test_pkrectarray_colliderect(
+    rect_array: PkRectArray, rects: list[PkRect], rect: tuple
+) -> None:
+    """Test that rect queries match PkRect.colliderect."""
+    expected = [r.colliderect(rect) for r in rects]
+    assert rect_array.colliderect(rect).tolist() == expected
+    assert rect_array.colliderect(PkRect(*rect)).tolist() == expected
+
+
+def test_pkrectarray_collide_pairs(
+    rect_array: PkRectArray, rects: list[PkRect]
+) -> None:
+    """Test finding overlapping pairs within and between arrays."""
+    assert rect_array.collide_pairs().tolist() == [[0, 1]]
+
+    other = PkRectArray([(8, 8, 1, 1), (-100, -100, 1, 1), (21, 1, 1, 1)])
+    pairs = rect_array.collide_pairs(other).tolist()
+    assert sorted(pairs) == [[0, 0], [1, 0], [2, 2]]
+    assert sorted(pairs) == sorted(
+        [i, j]
+        for i, a in enumerate(rects)
+        for j, b in enumerate(other.to_rects())
+        if a.colliderect(b)
+    )
+
+    assert PkRectArray().collide_pairs().shape == (0, 2)
+
+
+def test_pkrectarray_collide_pairs_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that pairs are found across chunks, each pair once."""
+    rects = [PkRect(i * 5, 0, 10, 10) for i in range(10)]
+    rect_array = PkRectArray(rects)
+    expected = [
+        [i, j]
+        for i in range(10)
+        for j in range(i + 1, 10)
+        if rects[i].colliderect(rects[j])
+    ]
+    monkeypatch.setattr(PkRectArray, "PAIR_CHUNK_SIZE", 3)
+    assert rect_array.collide_pairs().tolist() == expected
+
+
+def test_pkrectarray_union(rect_array: PkRectArray) -> None:
+    """Test the bounding rectangle of all rectangles."""
+    assert rect_array.union() == (-10, 0, 35, 34)
+    with pytest.raises(ValueError):
+        PkRectArray().union()
+
+
+def test_pkrectarray_nearest(rect_array: PkRectArray) -> None:
+    """Test the distance and nearest queries."""
+    distances = rect_array.distances((12, 0))
+    assert distances.tolist() == pytest.approx([2, 5, 8, (18**2 + 30**2) ** 0.5])
+    assert rect_array.nearest((12, 0)) == 0
+    assert rect_array.nearest((30, 2)) == 2
+    assert rect_array.nearest((-8, 31)) == 3
+    # inside two rects: the first one
+    assert rect_array.nearest((6, 6)) == 0
+    with pytest.raises(ValueError):
+        PkRectArray().nearest((0, 0))
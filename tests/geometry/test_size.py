@@ -1,6 +1,9 @@
+import copy
+import pickle
+
 import pytest
 
-from puffkit.geometry.size import PkSize
+from puffkit.geometry.size import PkSize, PkFrozenSize
 
 
 def test_pksize_from_tuple() -> None:
@@ -131,3 +134,30 @@ def test_pksize_height() -> None:
     """Test the height property of PkSize."""
     size = PkSize(10, 20)
     assert size.height == 20
+
+
+def test_pksize_slots() -> None:
+    """Test that PkSize has no instance dictionary."""
+    assert not hasattr(PkSize(1, 2), "__dict__")
+
+
+def test_pkfrozensize() -> None:
+    """Test that a frozen size is immutable and hashable."""
+    value = PkSize(1, 2)
+    frozen = value.freeze()
+    assert isinstance(frozen, PkFrozenSize)
+    assert frozen == value
+    assert frozen.freeze() is frozen
+    assert hash(frozen) == hash((1, 2)) == hash(PkFrozenSize(1, 2))
+    assert len({frozen, PkFrozenSize(1, 2)}) == 1
+
+    with pytest.raises(AttributeError):
+        frozen.w = 5
+    with pytest.raises(AttributeError):
+        del frozen.w
+    assert frozen.w == 1
+
+    assert copy.copy(frozen) == frozen
+    assert copy.deepcopy(frozen) == frozen
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert type(pickle.loads(pickle.dumps(frozen))) is PkFrozenSize
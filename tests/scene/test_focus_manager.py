@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import MagicMock
+from puffkit.scene import PkFocusManager
+
+
+def _widget(focusable: bool = True) -> MagicMock:
+    """Create a mock widget."""
+    widget = MagicMock()
+    widget.focusable = focusable
+    return widget
+
+
+@pytest.fixture
+def focus_manager() -> PkFocusManager:
+    return PkFocusManager()
+
+
+def test_focus_manager_focus(focus_manager: PkFocusManager) -> None:
+    """Test that focusing a widget takes the focus from the previous one."""
+    first, second = _widget(), _widget()
+    assert focus_manager.focused is None
+
+    focus_manager.focus(first)
+    assert focus_manager.focused is first
+    assert first.focused is True
+
+    focus_manager.focus(second)
+    assert focus_manager.focused is second
+    assert first.focused is False
+    assert second.focused is True
+
+    # no hooks without an event
+    first.on_unfocus.assert_not_called()
+    second.on_focus.assert_not_called()
+
+
+def test_focus_manager_focus_event(focus_manager: PkFocusManager) -> None:
+    """Test that the hooks get the event causing the change."""
+    first, second = _widget(), _widget()
+    event = MagicMock()
+    focus_manager.focus(first, event)
+    first.on_focus.assert_called_once_with(event)
+
+    focus_manager.focus(second, event)
+    first.on_unfocus.assert_called_once_with(event)
+    second.on_focus.assert_called_once_with(event)
+
+    # focusing the focused widget again does nothing
+    focus_manager.focus(second, event)
+    second.on_focus.assert_called_once_with(event)
+
+    focus_manager.unfocus(event)
+    second.on_unfocus.assert_called_once_with(event)
+    assert focus_manager.focused is None
+
+
+def test_focus_manager_not_focusable(focus_manager: PkFocusManager) -> None:
+    """Test that widgets which are not focusable are ignored."""
+    first, label = _widget(), _widget(focusable=False)
+    focus_manager.focus(first)
+    focus_manager.focus(label, MagicMock())
+    assert focus_manager.focused is first
+    label.on_focus.assert_not_called()
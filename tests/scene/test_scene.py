@@ -1,16 +1,19 @@
 import pytest
 from unittest.mock import Mock
-from puffkit.geometry import PkSize
+from puffkit.geometry import PkRect, PkSize
 from puffkit.scene.scene import PkScene
 from puffkit.app import PkApp
 from puffkit.geometry.coordinate import PkCoordinate
 from puffkit.surface import PkSurface
+from puffkit.color import PkBasicPalette
 
 
 @pytest.fixture
 def mock_app() -> Mock:
     app = Mock(spec=PkApp)
     app.internal_screen_size = PkSize(800, 600)
+    app.full_redraw = True
+    app.dirty_rects = []
     return app
 
 
@@ -40,8 +43,12 @@ def test_scene_load(scene: PkScene) -> None:
 def test_scene_unload(scene: PkScene) -> None:
     scene.on_unload = Mock()
     scene.load()
+    widget = Mock(focusable=True)
+    scene.focus_manager.focus(widget)
     scene.unload()
     scene.on_unload.assert_called_once()
+    assert scene.focus_manager.focused is None
+    assert widget.focused is False
     assert scene.loaded is False
 
 
@@ -67,6 +74,57 @@ def test_scene_draw(scene: PkScene) -> None:
     mock_surface.blit.assert_called_once_with(scene.surface, scene.pos)
 
 
+def test_scene_render_backdrop(scene: PkScene) -> None:
+    scene.surface = Mock(spec=PkSurface)
+    scene.draw = Mock()
+    scene.render(Mock(spec=PkSurface))
+    scene.surface.blit.assert_called_once_with(
+        PkScene.get_backdrop(scene.size), (0, 0)
+    )
+
+
+def test_scene_render_without_backdrop(mock_app: Mock) -> None:
+    scene = PkScene(
+        _id="test_scene", app=mock_app, lazy=False, auto_unload=True, backdrop=False
+    )
+    scene.surface = Mock(spec=PkSurface)
+    scene.draw = Mock()
+    scene.render(Mock(spec=PkSurface))
+    scene.surface.blit.assert_not_called()
+
+
+def test_scene_get_backdrop() -> None:
+    backdrop = PkScene.get_backdrop((100, 40))
+    assert backdrop.size == (100, 40)
+    assert PkScene.get_backdrop(PkSize(100, 40)) is backdrop
+
+    tile = PkScene.BACKDROP_TILE_SIZE
+    assert backdrop.get_at((0, 0)) == PkBasicPalette.DARK_GREY
+    assert backdrop.get_at((tile, 0)) == PkBasicPalette.WHITE
+    assert backdrop.get_at((0, tile)) == PkBasicPalette.WHITE
+    assert backdrop.get_at((tile, tile)) == PkBasicPalette.DARK_GREY
+    assert backdrop.get_at((99, 39)) == PkBasicPalette.DARK_GREY
+
+
+def test_scene_render_keeps_previous_frame(scene: PkScene, mock_app: Mock) -> None:
+    mock_app.full_redraw = False
+    scene.surface = Mock(spec=PkSurface)
+    scene.on_render = Mock()
+    scene.render(Mock(spec=PkSurface))
+    scene.surface.fill.assert_not_called()
+    scene.on_render.assert_called_once()
+
+
+def test_scene_draw_dirty_rects(scene: PkScene, mock_app: Mock) -> None:
+    mock_app.full_redraw = False
+    mock_app.dirty_rects = [PkRect(10, 20, 30, 40)]
+    mock_surface = Mock(spec=PkSurface)
+    scene.draw(mock_surface)
+    mock_surface.blit.assert_called_once_with(
+        scene.surface, (10, 20), (10, 20, 30, 40)
+    )
+
+
 def test_scene_on_load(scene: PkScene) -> None:
     # this is a no-op method, so it should not raise any exceptions
     scene.on_load()
@@ -86,3 +144,12 @@ def test_scene_on_update(scene: PkScene, delta: float) -> None:
 def test_scene_on_render(scene: PkScene) -> None:
     # this is a no-op method, so it should not raise any exceptions
     scene.on_render()
+
+
+def test_scene_mark_dirty(scene: PkScene, mock_app: Mock) -> None:
+    scene.mark_dirty()
+    mock_app.mark_dirty.assert_called_once_with()
+
+    mock_app.mark_dirty.reset_mock()
+    scene.mark_dirty((5, 5, 10, 10))
+    mock_app.mark_dirty.assert_called_once_with((5, 5, 10, 10))
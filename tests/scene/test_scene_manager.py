@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock
 from puffkit import PkApp, PkScene, PkSurface
 from puffkit.event import PkEvent
+from puffkit.frame_input import PkFrameInput
 from puffkit.scene import PkSceneManager
 
 
@@ -155,9 +156,14 @@ def test_input(scene_manager: PkSceneManager, mock_scene: PkScene) -> None:
     mouse_buttons = (True, False, False)
     scene_manager.input(events, keys, mouse_pos, mouse_buttons)
     mock_scene.input.assert_called_once_with(
-        events=events, keys=keys, mouse_pos=mouse_pos, mouse_buttons=mouse_buttons
+        PkFrameInput(events, keys, mouse_pos, mouse_buttons)
     )
 
+    # a frame input is passed on by reference
+    frame_input = PkFrameInput(events, keys, mouse_pos, mouse_buttons)
+    scene_manager.input(frame_input)
+    assert mock_scene.input.call_args.args[0] is frame_input
+
 
 def test_update(scene_manager: PkSceneManager, mock_scene: PkScene) -> None:
     scene_manager.add_scene(mock_scene)
@@ -173,3 +179,47 @@ def test_render(scene_manager: PkSceneManager, mock_scene: PkScene) -> None:
     dest = Mock(spec=PkSurface)
     scene_manager.render(dest)
     mock_scene.render.assert_called_once_with(dest)
+
+
+def test_focus_in_on_load(mock_app: PkApp) -> None:
+    """Test that a widget focused in `on_load` receives keyboard input."""
+    import pygame as pg
+
+    from puffkit.container import PkContainer
+    from puffkit.event import PkKeyEvent
+    from puffkit.widget import PkTextInputWidget
+
+    class TextInputScene(PkScene):
+        def __init__(self) -> None:
+            super().__init__(
+                "text_input_scene", mock_app, lazy=True, auto_unload=True
+            )
+
+        def on_load(self) -> None:
+            self.container = PkContainer(
+                self.app, self.surface, "container", (0, 0, 10, 10)
+            )
+            self.text_input = PkTextInputWidget(
+                "text_input", self.container, (0, 0, 10, 10)
+            )
+            self.container.add_widget(self.text_input)
+            self.text_input.focused = True
+
+        def on_update(self, delta: float) -> None:
+            self.container.input(self._input)
+            self.container.update(delta)
+
+    scene_manager = mock_app.scene_manager
+    scene = TextInputScene()
+    scene_manager.add_scene(scene)
+    scene_manager.set_scene("text_input_scene")
+    assert scene_manager.loading_scene is None
+    assert scene.container.focus_manager is scene.focus_manager
+
+    key = PkKeyEvent("KEYDOWN", {"key": "a", "unicode": "a"}, type_=pg.KEYDOWN)
+    scene_manager.input([key])
+    scene_manager.update(0.016)
+    assert scene.text_input.text == "a"
+
+    scene_manager.set_scene("fallback")
+    scene_manager.remove_scene("text_input_scene")
@@ -1,16 +1,23 @@
+import json
+import threading
+import time
 from unittest import mock
 
 import pygame as pg
 import pytest
 
 from puffkit.app import PkApp
+from puffkit.clock import PkVirtualClock
+from puffkit.decorators.timing import tracer
+from puffkit.geometry import PkRect
+from puffkit.profiler import PkFrameProfiler
 from puffkit.scene import PkScene
 
 
 class PkAppSubclass(PkApp):
     """Subclass of PkApp for testing."""
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         super().__init__(
             app_name="TestApp",
             app_version="1.0",
@@ -18,6 +25,7 @@ class PkAppSubclass(PkApp):
             display_arguments={},
             internal_screen_size=(800, 600),
             fps_limit=60,
+            **kwargs,
         )
 
 
@@ -66,6 +74,12 @@ def test_pkapp_add_sysfont(MockSysFont: mock.Mock, app: PkApp):
     MockSysFont.assert_called_once()
 
 
+def test_pkapp_add_font_glyph_atlas(app: PkApp):
+    """Test adding a font which composes text from a glyph atlas."""
+    app.add_font("test_pkapp_atlas_font", None, 12, glyph_atlas=True)
+    assert app.fonts["test_pkapp_atlas_font"].glyph_atlas is True
+
+
 def test_pkapp_update(app: PkApp):
     """Test updating the app."""
     scene = mock.Mock(spec=PkScene)
@@ -118,3 +132,472 @@ def test_type_checking_imports():
         importlib.reload(app)
 
         assert PkScene
+
+
+class DirtyPkAppSubclass(PkApp):
+    """Subclass of PkApp with dirty rendering enabled for testing."""
+
+    def __init__(self):
+        super().__init__(
+            app_name="TestApp",
+            app_version="1.0",
+            display_size=(800, 600),
+            display_arguments={},
+            internal_screen_size=(400, 300),
+            fps_limit=60,
+            dirty_rendering=True,
+        )
+
+
+@pytest.fixture()
+def dirty_app() -> DirtyPkAppSubclass:
+    """Fixture for creating a PkApp instance with dirty rendering."""
+    return DirtyPkAppSubclass()
+
+
+def test_pkapp_mark_dirty_disabled(app: PkApp):
+    """Test that marking regions dirty is a no-op without dirty rendering."""
+    app.mark_dirty((0, 0, 10, 10))
+    app.mark_dirty()
+    assert app.dirty_rects == []
+    assert app.full_redraw is True
+
+
+def test_pkapp_mark_dirty(dirty_app: PkApp):
+    """Test marking regions of the internal screen dirty."""
+    dirty_app.mark_dirty((0, 0, 10, 10))
+    assert dirty_app.dirty_rects == [(0, 0, 10, 10)]
+
+
+def test_pkapp_render_dirty_full_redraw(dirty_app: PkApp):
+    """Test that the first dirty frame presents the whole screen."""
+    with (
+        mock.patch("pygame.display.flip") as mock_flip,
+        mock.patch("pygame.display.update") as mock_update,
+    ):
+        dirty_app.render()
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+    assert dirty_app.full_redraw is True
+    assert dirty_app.dirty_rects == []
+
+
+def test_pkapp_render_dirty_nothing_changed(dirty_app: PkApp):
+    """Test that nothing is presented when no region is dirty."""
+    dirty_app.render()
+    with (
+        mock.patch("pygame.display.flip") as mock_flip,
+        mock.patch("pygame.display.update") as mock_update,
+    ):
+        dirty_app.render()
+        mock_flip.assert_not_called()
+        mock_update.assert_not_called()
+    assert dirty_app.full_redraw is False
+
+
+def test_pkapp_render_dirty_rects(dirty_app: PkApp):
+    """Test that only dirty regions are rescaled and presented."""
+    dirty_app.render()
+    dirty_app.mark_dirty((10.5, 10, 20, 20))
+    dirty_app.mark_dirty((10.5, 10, 20, 20))  # duplicate
+    dirty_app.mark_dirty((-50, -50, 10, 10))  # off-screen
+    dirty_app.mark_dirty((390, 290, 20, 20))  # partially off-screen
+    with (
+        mock.patch("pygame.display.flip") as mock_flip,
+        mock.patch("pygame.display.update") as mock_update,
+    ):
+        dirty_app.render()
+        mock_flip.assert_not_called()
+        mock_update.assert_called_once_with(
+            [pg.Rect(20, 20, 42, 40), pg.Rect(780, 580, 20, 20)]
+        )
+    assert dirty_app.dirty_rects == []
+
+
+def test_pkapp_render_dirty_full_request(dirty_app: PkApp):
+    """Test that requesting a full redraw presents the whole screen."""
+    dirty_app.render()
+    dirty_app.mark_dirty((0, 0, 10, 10))
+    dirty_app.mark_dirty()
+    with (
+        mock.patch("pygame.display.flip") as mock_flip,
+        mock.patch("pygame.display.update") as mock_update,
+    ):
+        dirty_app.render()
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+    assert dirty_app.dirty_rects == []
+
+
+def test_pkapp_set_scene_marks_dirty(dirty_app: PkApp):
+    """Test that switching scenes requests a full redraw."""
+    dirty_app.render()
+    dirty_app.scene_manager.set_scene("fallback")
+    dirty_app.render()
+    assert dirty_app.full_redraw is True
+
+
+def test_pkapp_profiler_disabled(app: PkApp):
+    """Test that frames aren't profiled by default."""
+    assert app.profiler is None
+
+
+@pytest.mark.parametrize("dirty", [False, True])
+def test_pkapp_run_profiled(dirty: bool):
+    """Test that running a profiled app records every frame phase."""
+    if dirty:
+        app = DirtyPkAppSubclass()
+        app.render()
+        app.mark_dirty(PkRect(0, 0, 10, 10))
+        app.profiler = PkFrameProfiler()
+    else:
+        app = PkAppSubclass(profile=True)
+    app.run(run_once=True)
+
+    assert app.profiler.frames == 1
+    report = app.profiler.report()
+    assert set(report) == {*PkFrameProfiler.PHASES, "frame"}
+    for phase in PkFrameProfiler.PHASES:
+        assert report[phase]["max"] > 0
+    assert report["frame"]["max"] >= sum(
+        report[phase]["max"] for phase in PkFrameProfiler.PHASES
+    )
+
+
+def test_pkapp_run_traced(tmp_path):
+    """Test that frames and scene loads are recorded while tracing."""
+    path = tmp_path / "trace.json"
+    tracer.start(str(path))
+    try:
+        app = PkAppSubclass()
+        app.scene_manager.load_scene("fallback")
+        app.run(run_once=True)
+    finally:
+        tracer.stop()
+
+    names = {event["name"] for event in json.loads(path.read_text())}
+    assert {
+        "PkApp.update",
+        "PkApp.update_scene",
+        "PkApp.render",
+        "PkSceneManager.load_scene fallback",
+    } <= names
+
+
+def test_pkapp_tick_traced(tmp_path):
+    """Test that every update with a fixed timestep is recorded as a span."""
+    path = tmp_path / "trace.json"
+    tracer.start(str(path))
+    try:
+        app = PkAppSubclass(tick_rate=10)
+        app.tick(0.25)
+    finally:
+        tracer.stop()
+
+    names = [event["name"] for event in json.loads(path.read_text())]
+    assert names.count("PkApp.update_scene") == 2
+
+
+def test_pkapp_idle_timeout_invalid():
+    """Test that the idle timeout has to be positive."""
+    with pytest.raises(ValueError):
+        PkAppSubclass(idle=True, idle_timeout=0)
+
+
+def test_pkapp_mark_dirty_requests_frame(app: PkApp):
+    """Test that marking the screen dirty requests a frame."""
+    app._frame_requested = False
+    app.mark_dirty()
+    assert app._frame_requested is True
+
+
+def test_pkapp_request_frame_delay(app: PkApp):
+    """Test that delayed frame requests keep the earliest deadline."""
+    app._frame_requested = False
+    app.request_frame(1)
+    deadline = app._frame_deadline
+    assert deadline >= app.clock.time + 0.9
+    app.request_frame(2)
+    assert app._frame_deadline == deadline
+    app.request_frame(0.5)
+    assert app._frame_deadline < deadline
+    assert app._frame_requested is False
+
+
+def test_pkapp_wait_for_frame_requested():
+    """Test that the app does not wait when a frame was requested."""
+    app = PkAppSubclass(idle=True, idle_timeout=10)
+    pg.event.clear()
+    app.request_frame()
+    with mock.patch.object(app.event_manager, "wait") as wait:
+        app._wait_for_frame()
+    wait.assert_not_called()
+
+
+def test_pkapp_wait_for_frame_event():
+    """Test that the app does not wait when input is pending."""
+    app = PkAppSubclass(idle=True, idle_timeout=10)
+    app._frame_requested = False
+    pg.event.clear()
+    pg.event.post(pg.event.Event(pg.USEREVENT))
+    with mock.patch.object(app.event_manager, "wait") as wait:
+        app._wait_for_frame()
+    wait.assert_not_called()
+    pg.event.clear()
+
+
+def test_pkapp_wait_for_frame_timeout():
+    """Test that the app waits at most the idle timeout."""
+    app = PkAppSubclass(idle=True, idle_timeout=0.05)
+    app._frame_requested = False
+    app.delta_time = 0
+    pg.event.clear()
+
+    start = time.perf_counter()
+    app._wait_for_frame()
+    assert 0.04 <= time.perf_counter() - start < 1
+    assert app.delta_time >= 0.04
+    assert app._waiting is False
+
+
+def test_pkapp_wait_for_frame_deadline():
+    """Test that the app wakes for a delayed frame request."""
+    app = PkAppSubclass(idle=True, idle_timeout=10)
+    app._frame_requested = False
+    pg.event.clear()
+
+    app.request_frame(0.05)
+    start = time.perf_counter()
+    app._wait_for_frame()
+    assert time.perf_counter() - start < 1
+
+    # a deadline which has passed does not wait at all
+    app._frame_deadline = app.clock.time - 1
+    with mock.patch.object(app.event_manager, "wait") as wait:
+        app._wait_for_frame()
+    wait.assert_not_called()
+
+
+def test_pkapp_wait_for_frame_woken_by_thread():
+    """Test that a frame requested from another thread wakes the app."""
+    app = PkAppSubclass(idle=True, idle_timeout=10)
+    app._frame_requested = False
+    pg.event.clear()
+
+    timer = threading.Timer(0.05, app.request_frame)
+    timer.start()
+    start = time.perf_counter()
+    app._wait_for_frame()
+    timer.join()
+    assert time.perf_counter() - start < 5
+    assert app._frame_requested is True
+
+
+def test_pkapp_run_idle():
+    """Test that an idle app clears frame requests once they are run."""
+    app = PkAppSubclass(idle=True)
+    app._frame_deadline = app.clock.time - 1
+    with (
+        mock.patch("puffkit.app.PkApp.update"),
+        mock.patch("puffkit.app.PkApp.render"),
+    ):
+        app.run(run_once=True)
+    assert app._frame_requested is False
+    assert app._frame_deadline is None
+
+
+class ContainerScene(PkScene):
+    """Scene with a container holding a label, for integration tests."""
+
+    def __init__(self, app: PkApp) -> None:
+        super().__init__("container_scene", app, lazy=False, auto_unload=False)
+
+    def on_load(self) -> None:
+        from puffkit.container import PkContainer
+        from puffkit.widget import PkLabelWidget
+
+        self.container = PkContainer(
+            self.app, self.surface, "container", (0, 0, 200, 100)
+        )
+        self.container.add_widget(
+            PkLabelWidget("label", self.container, "x", (0, 0, 100, 20))
+        )
+
+    def on_update(self, delta: float) -> None:
+        self.container.input(self._input)
+        self.container.update(delta)
+
+    def on_render(self) -> None:
+        self.container.render()
+
+
+@pytest.mark.parametrize("dirty_rendering", [False, True])
+def test_pkapp_run_idle_container_scene(dirty_rendering: bool):
+    """Test that rendering an unchanged container lets an idle app wait."""
+    app = PkAppSubclass(
+        idle=True, idle_timeout=0.02, dirty_rendering=dirty_rendering
+    )
+    app.scene_manager.add_scene(ContainerScene(app))
+    app.scene_manager.set_scene("container_scene")
+    pg.event.clear()
+
+    with mock.patch.object(
+        app.event_manager, "wait", wraps=app.event_manager.wait
+    ) as wait:
+        app.run(duration=0.3)
+    # a few frames to show the scene, then one per idle timeout
+    assert wait.call_count >= app.frames - 3
+    assert wait.call_count > 0
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"tick_rate": 0}, {"tick_rate": 60, "max_ticks_per_frame": 0}]
+)
+def test_pkapp_fixed_timestep_invalid(kwargs: dict):
+    """Test that the tick rate and catch-up cap have to be positive."""
+    with pytest.raises(ValueError):
+        PkAppSubclass(**kwargs)
+
+
+def test_pkapp_tick_variable(app: PkApp):
+    """Test that without a tick rate the frame's delta is used."""
+    with mock.patch.object(app, "update") as update:
+        app.tick(0.123)
+    update.assert_called_once_with(0.123)
+    assert app.alpha == 1.0
+
+
+def test_pkapp_event_manager_options():
+    """Test that the event manager options are passed on."""
+    app = PkAppSubclass()
+    assert app.event_manager.coalesce_motion is True
+    assert app.event_manager.auto_block is False
+
+    app = PkAppSubclass(coalesce_motion=False, auto_block=True)
+    assert app.event_manager.coalesce_motion is False
+    assert app.event_manager.auto_block is True
+    app.event_manager.auto_block = False
+
+
+def test_pkapp_tick_fixed():
+    """Test that updates run at the tick rate and alpha is the remainder."""
+    app = PkAppSubclass(tick_rate=10)
+    with mock.patch.object(app, "update_scene") as update:
+        app.tick(0.05)
+        update.assert_not_called()
+        assert app.alpha == pytest.approx(0.5)
+
+        app.tick(0.175)
+        assert update.call_args_list == [mock.call(0.1)] * 2
+        assert app.alpha == pytest.approx(0.25)
+
+
+def test_pkapp_tick_fixed_catch_up_cap():
+    """Test that time beyond the catch-up cap is dropped."""
+    app = PkAppSubclass(tick_rate=10, max_ticks_per_frame=3)
+    with mock.patch.object(app, "update_scene") as update:
+        app.tick(1.05)
+        assert update.call_count == 3
+        assert app.alpha == pytest.approx(0.5)
+
+        app.tick(0.1)
+        assert update.call_count == 4
+
+
+def _typed(events) -> list[str]:
+    return [event.key for event in events if event.name == "KEYDOWN"]
+
+
+def test_pkapp_tick_fixed_events():
+    """Test that events are processed every frame, slower ticks or not."""
+    app = PkAppSubclass(tick_rate=10)
+    scene = app.scene_manager.current_scene
+    inputs = []
+    with (
+        mock.patch.object(
+            app.event_manager,
+            "update",
+            wraps=app.event_manager.update,
+        ) as update_events,
+        mock.patch.object(
+            scene, "update", side_effect=lambda _: inputs.append(scene._input)
+        ),
+    ):
+        # a frame without a tick still processes the events...
+        pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_a, unicode="a"))
+        app.tick(0.05)
+        assert update_events.call_count == 1
+        assert _typed(app.event_manager.events) == ["a"]
+        assert inputs == []
+        assert app._frame_deadline is not None
+
+        # ...and the next tick gets them, once
+        app.tick(0.175)
+        assert update_events.call_count == 2
+        assert len(inputs) == 2
+        assert _typed(inputs[0].events) == ["a"]
+        assert inputs[1].events == ()
+        assert inputs[1].pressed_keys is inputs[0].pressed_keys
+
+        # events of a frame with ticks go to its first tick
+        pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_a, unicode="a"))
+        app.tick(0.1)
+        assert len(inputs) == 3
+        assert _typed(inputs[2].events) == ["a"]
+
+
+def test_pkapp_render_alpha(app: PkApp):
+    """Test that the interpolation alpha is available while rendering."""
+    app.render(0.25)
+    assert app.alpha == 0.25
+
+
+def test_pkapp_run_fixed_timestep():
+    """Test that a fixed timestep app runs a single update on startup."""
+    app = PkAppSubclass(tick_rate=30)
+    with (
+        mock.patch.object(app, "update_scene") as update,
+        mock.patch.object(app, "render") as render,
+    ):
+        app.run(run_once=True)
+    update.assert_called_once_with(pytest.approx(1 / 30))
+    render.assert_called_once_with(pytest.approx(0.0, abs=1e-9))
+
+
+def test_pkapp_render_interval_invalid():
+    """Test that the render interval must not be negative."""
+    with pytest.raises(ValueError):
+        PkAppSubclass(render_interval=-1)
+
+
+@pytest.mark.parametrize("render_interval, renders", [(0, 0), (1, 10), (3, 4)])
+def test_pkapp_run_virtual_clock(render_interval: int, renders: int):
+    """Test fast-forwarding an app on a virtual clock."""
+    clock = PkVirtualClock(0.5)
+    app = PkAppSubclass(
+        clock=clock, render_interval=render_interval, idle=True
+    )
+    deltas = []
+    with (
+        mock.patch.object(app, "update", side_effect=deltas.append),
+        mock.patch.object(app, "render") as render,
+        mock.patch.object(app, "_wait_for_frame") as wait_for_frame,
+    ):
+        app.run(duration=5)
+
+    assert deltas == [0.5] * 10
+    assert render.call_count == renders
+    assert app.frames == 10
+    assert clock.time == 5.5
+    wait_for_frame.assert_not_called()
+
+
+def test_pkapp_run_virtual_clock_fixed_timestep():
+    """Test that a virtual clock drives the fixed timestep deterministically."""
+    app = PkAppSubclass(clock=PkVirtualClock(0.05), tick_rate=100)
+    with (
+        mock.patch.object(app, "update_scene") as update,
+        mock.patch.object(app, "render"),
+    ):
+        app.run(duration=1)
+    assert update.call_count == 1 + 19 * 5
@@ -0,0 +1,39 @@
+import pygame as pg
+import pytest
+
+from puffkit.clock import PkClock, PkVirtualClock
+
+
+def test_clock() -> None:
+    """Test that the clock follows the real time."""
+    pg.init()
+    clock = PkClock()
+    assert clock.REALTIME is True
+
+    clock.tick()
+    before = clock.time
+    pg.time.wait(20)
+    assert clock.tick() >= 0.015
+    assert clock.time - before >= 0.015
+    assert clock.get_fps() >= 0
+
+
+def test_virtual_clock() -> None:
+    """Test that every tick of a virtual clock advances it by one step."""
+    clock = PkVirtualClock(0.25, start=10)
+    assert clock.REALTIME is False
+    assert clock.time == 10
+
+    assert clock.tick(1) == 0.25
+    assert clock.tick() == 0.25
+    assert clock.time == 10.5
+    assert clock.get_fps() == 4
+
+    clock.advance(2)
+    assert clock.time == 12.5
+
+
+def test_virtual_clock_invalid_step() -> None:
+    """Test that the step of a virtual clock has to be positive."""
+    with pytest.raises(ValueError):
+        PkVirtualClock(0)
@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import MagicMock
-from puffkit import PkContainer
+from puffkit import PkContainer, PkSurface
 from puffkit.geometry import PkRect, RectValue
+from puffkit.frame_input import PkFrameInput
+from puffkit.scene import PkFocusManager
 
 
 @pytest.mark.parametrize(
@@ -117,14 +119,9 @@ def test_pkcontainer_update() -> None:
     container = PkContainer(mock_app, mock_surface, "update_test", (0, 0, 50, 50))
     container.add_widget(mock_widget)
 
-    container._input = {
-        "events": [],
-        "keys": [],
-        "mouse_pos": (0, 0),
-        "mouse_buttons": (False, False, False),
-    }
+    container._input = PkFrameInput()
     container.update(0.016)
-    mock_widget.input.assert_called_once()
+    mock_widget.input.assert_called_once_with(container._input)
     mock_widget.update.assert_called_once()
 
 
@@ -143,3 +140,357 @@ def test_pkcontainer_render() -> None:
     container.render()
     mock_surface.blit.assert_called()
     mock_widget.render.assert_called_once()
+
+
+def test_pkcontainer_mark_dirty() -> None:
+    """Test that changed regions are recorded until the next render."""
+    mock_app = MagicMock()
+    mock_surface = MagicMock()
+    mock_surface.get_width.return_value = 100
+    mock_surface.get_height.return_value = 100
+    container = PkContainer(mock_app, mock_surface, "dirty_test", (10, 20, 50, 50))
+
+    # the first render composites everything
+    container.mark_dirty((5, 5, 10, 10))
+    assert container._dirty_rects == []
+    container.render()
+    mock_app.mark_dirty.assert_called_once_with(container.rect, wake=False)
+
+    container.mark_dirty((5, 5, 10, 10))
+    assert container._dirty_rects == [(5, 5, 10, 10)]
+
+    container.mark_dirty()
+    assert container._dirty_rects == []
+    assert container._full_dirty
+    assert mock_app.request_frame.call_count == 3
+
+
+def test_pkcontainer_mark_dirty_limit() -> None:
+    """Test that too many changed regions recomposite the whole container."""
+    container = PkContainer(
+        MagicMock(), _parent_surface(), "dirty_limit_test", (0, 0, 50, 50)
+    )
+    container.render()
+    for _ in range(PkContainer.MAX_DIRTY_RECTS):
+        container.mark_dirty((0, 0, 1, 1))
+    assert not container._full_dirty
+    container.mark_dirty((0, 0, 1, 1))
+    assert container._full_dirty
+    assert container._dirty_rects == []
+
+
+def test_pkcontainer_mark_dirty_parent_widget() -> None:
+    """Test that changed regions are reported to the parent widget, if any."""
+    mock_app = MagicMock()
+    mock_surface = MagicMock()
+    mock_surface.get_width.return_value = 100
+    mock_surface.get_height.return_value = 100
+    mock_widget = MagicMock()
+    container = PkContainer(
+        mock_app,
+        mock_surface,
+        "dirty_parent_test",
+        (0, 0, 50, 50),
+        parent_widget=mock_widget,
+    )
+
+    container.mark_dirty((5, 5, 10, 10))
+    mock_widget.mark_dirty.assert_called_once_with()
+
+    container.render()
+    mock_app.mark_dirty.assert_not_called()
+
+
+def _parent_surface() -> PkSurface:
+    """Create a real parent surface to composite containers on."""
+    surface = PkSurface((100, 100))
+    surface.fill((255, 255, 255))
+    return surface
+
+
+def _dirty_app() -> MagicMock:
+    """Create a mock app which keeps the previous frame (dirty rendering)."""
+    mock_app = MagicMock()
+    mock_app.dirty_rendering = True
+    mock_app.full_redraw = False
+    return mock_app
+
+
+def test_pkcontainer_render_only_dirty_widgets() -> None:
+    """Test that only widgets in dirty regions are rendered again."""
+    from puffkit.widget import PkWidget
+
+    container = PkContainer(
+        _dirty_app(), _parent_surface(), "dirty_render_test", (0, 0, 100, 100)
+    )
+    static = PkWidget("static", container, (0, 0, 40, 40))
+    ticking = PkWidget("ticking", container, (50, 50, 40, 40))
+    container.add_widget(static)
+    container.add_widget(ticking)
+    container.render()
+
+    static.render = MagicMock(wraps=static.render)
+    ticking.render = MagicMock(wraps=ticking.render)
+    container.render()
+    static.render.assert_not_called()
+    ticking.render.assert_not_called()
+
+    ticking.mark_dirty()
+    container.render()
+    static.render.assert_not_called()
+    ticking.render.assert_called_once()
+
+
+def test_pkcontainer_render_regions_on_parent() -> None:
+    """Test that dirty regions are redrawn on the parent over its background."""
+    from puffkit.widget import PkWidget
+
+    mock_app = _dirty_app()
+    parent = _parent_surface()
+    container = PkContainer(
+        mock_app, parent, "dirty_parent_test", (10, 10, 80, 80), draw_outline=True
+    )
+    widget = PkWidget("widget", container, (20, 20, 20, 20))
+    widget.on_render = lambda: widget.surface.fill((255, 0, 0))
+    container.add_widget(widget)
+    container.render()
+    assert parent.get_at((35, 35)) == (255, 0, 0)
+
+    mock_app.mark_dirty.reset_mock()
+    widget.visible = False
+    container.render()
+    assert parent.get_at((35, 35)) == (255, 255, 255)
+    mock_app.mark_dirty.assert_called_once_with((29, 29, 22, 22), wake=False)
+
+    # nothing changed, nothing is drawn
+    mock_app.mark_dirty.reset_mock()
+    container.render()
+    mock_app.mark_dirty.assert_not_called()
+
+
+def test_pkcontainer_render_remove_widget() -> None:
+    """Test that removing a widget recomposites the whole container."""
+    from puffkit.widget import PkWidget
+
+    parent = _parent_surface()
+    container = PkContainer(_dirty_app(), parent, "remove_test", (0, 0, 100, 100))
+    widget = PkWidget("widget", container, (0, 0, 20, 20))
+    widget.on_render = lambda: widget.surface.fill((255, 0, 0))
+    container.add_widget(widget)
+    container.render()
+    assert parent.get_at((10, 10)) == (255, 0, 0)
+
+    container.remove_widget("widget")
+    container.render()
+    assert parent.get_at((10, 10)) == (255, 255, 255)
+
+
+def _event(name: str, **kwargs) -> MagicMock:
+    """Create a mock event."""
+    event = MagicMock(**kwargs)
+    event.name = name
+    return event
+
+
+def _routing_container() -> tuple[PkContainer, list]:
+    """Create a container with a grid of widgets for routing tests."""
+    from puffkit.widget import PkWidget
+
+    container = PkContainer(
+        MagicMock(),
+        _parent_surface(),
+        "routing_test",
+        (0, 0, 100, 100),
+        focus_manager=PkFocusManager(),
+    )
+    widgets = []
+    for i in range(4):
+        widget = PkWidget(f"w{i}", container, (i * 25, 0, 20, 20), focusable=True)
+        widget.handle_event = MagicMock(wraps=widget.handle_event)
+        container.add_widget(widget)
+        widgets.append(widget)
+    return container, widgets
+
+
+def _route(container: PkContainer, *events) -> None:
+    container.input(list(events), {}, (0, 0), (False, False, False))
+    container.update(0.016)
+
+
+def test_pkcontainer_hit_test() -> None:
+    """Test that the hit-testing grid finds the widgets at a position."""
+    from puffkit.widget import PkWidget
+
+    container, widgets = _routing_container()
+    assert container.hit_test((30, 10)) == [widgets[1]]
+    assert container.hit_test((22, 10)) == []
+    assert container.hit_test((90, 90)) == []
+
+    # the grid is rebuilt when widgets are added or moved
+    big = PkWidget("big", container, (0, 0, 100, 100))
+    container.add_widget(big)
+    assert container.hit_test((30, 10)) == [widgets[1], big]
+    assert container.hit_test((90, 90)) == [big]
+
+    widgets[1].abs_rect = PkRect(60, 60, 20, 20)
+    assert container.hit_test((70, 70)) == [big]
+    container.invalidate_hit_index()
+    assert container.hit_test((70, 70)) == [widgets[1], big]
+
+
+def test_pkcontainer_route_motion() -> None:
+    """Test that motion is routed only to the widgets entered and left."""
+    container, widgets = _routing_container()
+    for widget in widgets:
+        widget.on_mouse_enter = MagicMock()
+        widget.on_mouse_leave = MagicMock()
+
+    _route(container, _event("MOUSEMOTION", pos=(10, 10)))
+    _route(container, _event("MOUSEMOTION", pos=(12, 10)))
+    widgets[0].on_mouse_enter.assert_called_once()
+    assert widgets[0].hovered
+    for widget in widgets[1:]:
+        widget.handle_event.assert_not_called()
+
+    _route(container, _event("MOUSEMOTION", pos=(30, 10)))
+    widgets[0].on_mouse_leave.assert_called_once()
+    widgets[1].on_mouse_enter.assert_called_once()
+    assert not widgets[0].hovered
+    assert widgets[1].hovered
+    assert widgets[0].handle_event.call_count == 3
+    widgets[2].handle_event.assert_not_called()
+
+    # removed widgets are forgotten
+    container.remove_widget("w1")
+    _route(container, _event("MOUSEMOTION", pos=(90, 90)))
+    assert widgets[1].handle_event.call_count == 1
+
+
+def test_pkcontainer_route_buttons() -> None:
+    """Test that clicks reach the widget under the mouse and the focused one."""
+    container, widgets = _routing_container()
+    for widget in widgets:
+        widget.on_click = MagicMock()
+        widget.on_unfocus = MagicMock()
+
+    _route(
+        container,
+        _event("MOUSEBUTTONDOWN", pos=(10, 10)),
+        _event("MOUSEBUTTONUP", pos=(10, 10)),
+    )
+    widgets[0].on_click.assert_called_once()
+    assert widgets[0].focused
+    for widget in widgets[1:]:
+        widget.handle_event.assert_not_called()
+
+    _route(container, _event("MOUSEBUTTONDOWN", pos=(55, 10)))
+    widgets[0].on_unfocus.assert_called_once()
+    assert not widgets[0].focused
+    assert widgets[2].focused and widgets[2].pressed
+
+    # released elsewhere: no click
+    _route(container, _event("MOUSEBUTTONUP", pos=(90, 90)))
+    assert not widgets[2].pressed
+    widgets[2].on_click.assert_not_called()
+    widgets[1].handle_event.assert_not_called()
+    widgets[3].handle_event.assert_not_called()
+
+
+def test_pkcontainer_route_keyboard() -> None:
+    """Test that keyboard events only reach the focused widget."""
+    container, widgets = _routing_container()
+    key = _event("KEYUP", key="a")
+    _route(container, key)
+    for widget in widgets:
+        widget.handle_event.assert_not_called()
+
+    # focused by a click earlier in the same frame
+    click = _event("MOUSEBUTTONDOWN", pos=(30, 10))
+    _route(container, click, key)
+    widgets[1].handle_event.assert_called_with(key)
+    widgets[2].handle_event.assert_not_called()
+
+    # focused in another container
+    other, other_widgets = _routing_container()
+    container.focus_manager = other.focus_manager
+    other_widgets[3].focused = True
+    _route(container, key)
+    assert widgets[1].handle_event.call_count == 2
+
+
+def test_pkcontainer_remove_focused_widget() -> None:
+    """Test that removing the focused widget clears the focus."""
+    container, widgets = _routing_container()
+    widgets[1].focused = True
+    assert container.focus_manager.focused is widgets[1]
+    container.remove_widget("w0")
+    assert container.focus_manager.focused is widgets[1]
+    container.remove_widget("w1")
+    assert container.focus_manager.focused is None
+
+
+def test_pkcontainer_focus_manager() -> None:
+    """Test that the focus manager is found from the container's context."""
+    mock_app = MagicMock()
+    mock_app.scene_manager.loading_scene = None
+    container = PkContainer(mock_app, _parent_surface(), "scene", (0, 0, 50, 50))
+    assert (
+        container.focus_manager
+        is mock_app.scene_manager.current_scene.focus_manager
+    )
+
+    # built by the `on_load` of a scene which is not current yet
+    mock_app.scene_manager.loading_scene = MagicMock()
+    loading = PkContainer(mock_app, _parent_surface(), "load", (0, 0, 50, 50))
+    assert (
+        loading.focus_manager
+        is mock_app.scene_manager.loading_scene.focus_manager
+    )
+
+    parent_widget = MagicMock()
+    nested = PkContainer(
+        mock_app,
+        _parent_surface(),
+        "nested",
+        (0, 0, 50, 50),
+        parent_widget=parent_widget,
+    )
+    assert nested.focus_manager is parent_widget.container.focus_manager
+
+
+def test_pkcontainer_route_other_events() -> None:
+    """Test that other events are not dispatched, but are in the input."""
+    container, widgets = _routing_container()
+    custom = _event("USEREVENT")
+    _route(container, custom)
+    for widget in widgets:
+        widget.handle_event.assert_not_called()
+        assert list(widget._input.events) == [custom]
+
+
+def test_pkcontainer_hit_test_edges() -> None:
+    """Test that a widget's left and top edges hit and its right and bottom miss."""
+    container, widgets = _routing_container()
+    widget = widgets[1]  # (25, 0, 20, 20)
+    assert container.hit_test((25, 0)) == [widget]
+    assert container.hit_test((44.5, 19.5)) == [widget]
+    assert container.hit_test((45, 10)) == []
+    assert container.hit_test((30, 20)) == []
+
+    for w in widgets:
+        w.on_click = MagicMock()
+    _route(
+        container,
+        _event("MOUSEBUTTONDOWN", pos=(25, 0)),
+        _event("MOUSEBUTTONUP", pos=(25, 0)),
+    )
+    widget.on_click.assert_called_once()
+    widgets[0].handle_event.assert_not_called()
+
+    _route(
+        container,
+        _event("MOUSEBUTTONDOWN", pos=(45, 10)),
+        _event("MOUSEBUTTONUP", pos=(45, 10)),
+    )
+    widget.on_click.assert_called_once()
+    widgets[2].handle_event.assert_not_called()
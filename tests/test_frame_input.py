@@ -0,0 +1,50 @@
+import pytest
+
+from puffkit.frame_input import EMPTY_FRAME_INPUT, PkFrameInput
+
+
+def test_pkframeinput_defaults() -> None:
+    """Test that the empty frame input has no input."""
+    assert EMPTY_FRAME_INPUT == PkFrameInput()
+    assert EMPTY_FRAME_INPUT.events == ()
+    assert EMPTY_FRAME_INPUT.mouse_pos == (0, 0)
+    assert EMPTY_FRAME_INPUT.mouse_buttons == (False, False, False)
+
+
+def test_pkframeinput_getitem() -> None:
+    """Test that the values can be read by index and by their old keys."""
+    events = ["event"]
+    keys = (False, True)
+    frame_input = PkFrameInput(events, keys, (1, 2), (True, False, False))
+
+    assert frame_input["events"] is events
+    assert frame_input["keys"] is keys
+    assert frame_input["mouse_pos"] == (1, 2)
+    assert frame_input["mouse_buttons"] == (True, False, False)
+    assert frame_input[1] is keys
+    assert frame_input[2:] == ((1, 2), (True, False, False))
+    with pytest.raises(KeyError):
+        frame_input["pressed_keys"]
+
+
+def test_pkframeinput_unpack() -> None:
+    """Test that the frame input unpacks like the old input dictionaries."""
+    frame_input = PkFrameInput(["event"], (True,), (1, 2), (True, False, False))
+    assert list(frame_input.keys()) == [
+        "events",
+        "keys",
+        "mouse_pos",
+        "mouse_buttons",
+    ]
+    assert dict(**frame_input) == {
+        "events": ["event"],
+        "keys": (True,),
+        "mouse_pos": (1, 2),
+        "mouse_buttons": (True, False, False),
+    }
+
+
+def test_pkframeinput_immutable() -> None:
+    """Test that the frame input can not be modified."""
+    with pytest.raises(AttributeError):
+        EMPTY_FRAME_INPUT.mouse_pos = (1, 1)  # type: ignore[misc]
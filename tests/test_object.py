@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+from puffkit.frame_input import EMPTY_FRAME_INPUT, PkFrameInput
 from puffkit.object import PkObject
 
 
@@ -16,12 +17,7 @@ def test_pkobject_initialization(pk_object: PkObject) -> None:
     """Test the initialization of PkObject."""
     assert pk_object.class_name == "PkObject"
     assert pk_object.full_class_name == "puffkit.object.PkObject"
-    assert pk_object._input == {
-        "events": [],
-        "keys": {},
-        "mouse_pos": (0, 0),
-        "mouse_buttons": (False, False, False),
-    }
+    assert pk_object._input is EMPTY_FRAME_INPUT
 
 
 @pytest.mark.parametrize(
@@ -41,12 +37,20 @@ def test_pkobject_input(
 ) -> None:
     """Test the input method of PkObject."""
     pk_object.input(events, keys, mouse_pos, mouse_buttons)
-    assert pk_object._input == {
-        "events": events,
-        "keys": keys,
-        "mouse_pos": mouse_pos,
-        "mouse_buttons": mouse_buttons,
-    }
+    assert pk_object._input == PkFrameInput(events, keys, mouse_pos, mouse_buttons)
+    assert pk_object._input["keys"] is keys
+
+
+def test_pkobject_input_frame_input(pk_object: PkObject) -> None:
+    """Test that a frame input is kept by reference."""
+    frame_input = PkFrameInput(["event"], (True,), (1, 2), (True, False, False))
+    pk_object.input(frame_input)
+    assert pk_object._input is frame_input
+
+    # old style unpacking still works
+    other = PkObject()
+    other.input(**pk_object._input)
+    assert other._input == frame_input
 
 
 def test_pkobject_update_not_implemented(pk_object: PkObject) -> None:
@@ -0,0 +1,92 @@
+from unittest import mock
+
+import pytest
+
+from puffkit.profiler import PkFrameProfiler
+
+
+def _record(profiler: PkFrameProfiler, durations: list[float]) -> None:
+    """Record frames where the "update" phase takes the given durations."""
+    for duration in durations:
+        with mock.patch("puffkit.profiler.t.perf_counter") as perf_counter:
+            perf_counter.side_effect = [0.0, duration, duration]
+            profiler.start_frame()
+            profiler.lap("update")
+            profiler.end_frame()
+
+
+def test_pkframeprofiler_initialization() -> None:
+    """Test the initialization of PkFrameProfiler."""
+    profiler = PkFrameProfiler(10)
+    assert profiler.capacity == 10
+    assert profiler.frames == 0
+    assert len(profiler) == 0
+
+
+def test_pkframeprofiler_invalid_capacity() -> None:
+    """Test that a non-positive capacity is rejected."""
+    with pytest.raises(ValueError):
+        PkFrameProfiler(0)
+
+
+def test_pkframeprofiler_stats_empty() -> None:
+    """Test statistics without recorded frames."""
+    profiler = PkFrameProfiler()
+    assert profiler.stats() == {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+
+def test_pkframeprofiler_stats() -> None:
+    """Test percentiles of a phase."""
+    profiler = PkFrameProfiler(100)
+    _record(profiler, [i / 1000 for i in range(100, 0, -1)])
+    assert profiler.stats("update") == {
+        "p50": 0.05,
+        "p95": 0.095,
+        "p99": 0.099,
+        "max": 0.1,
+    }
+    assert profiler.stats() == profiler.stats("update")
+    assert profiler.stats("render")["max"] == 0.0
+
+
+def test_pkframeprofiler_laps_accumulate() -> None:
+    """Test that laps of the same phase in a frame are added up."""
+    profiler = PkFrameProfiler()
+    with mock.patch("puffkit.profiler.t.perf_counter") as perf_counter:
+        perf_counter.side_effect = [0.0, 1.0, 3.0, 6.0, 6.0]
+        profiler.start_frame()
+        profiler.lap("scale")
+        profiler.lap("flip")
+        profiler.lap("scale")
+        profiler.end_frame()
+    assert profiler.stats("scale")["max"] == 4.0
+    assert profiler.stats("flip")["max"] == 2.0
+    assert profiler.stats("frame")["max"] == 6.0
+
+
+def test_pkframeprofiler_ring_buffer() -> None:
+    """Test that only the last `capacity` frames are kept."""
+    profiler = PkFrameProfiler(3)
+    _record(profiler, [10.0, 1.0, 2.0, 3.0])
+    assert profiler.frames == 4
+    assert len(profiler) == 3
+    assert profiler.stats("update")["max"] == 3.0
+
+
+def test_pkframeprofiler_report() -> None:
+    """Test getting statistics of all phases."""
+    profiler = PkFrameProfiler()
+    _record(profiler, [1.0])
+    report = profiler.report()
+    assert list(report) == [*PkFrameProfiler.PHASES, "frame"]
+    assert report["update"]["p50"] == 1.0
+
+
+def test_pkframeprofiler_reset() -> None:
+    """Test forgetting recorded frames."""
+    profiler = PkFrameProfiler()
+    _record(profiler, [1.0, 2.0])
+    profiler.reset()
+    assert len(profiler) == 0
+    _record(profiler, [0.5])
+    assert profiler.stats("update")["max"] == 0.5
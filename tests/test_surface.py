@@ -4,9 +4,10 @@ import pytest
 
 from puffkit.color.color import ColorValue, PkColor
 from puffkit.font.font import PkFont
-from puffkit.geometry import RectValue
+from puffkit.geometry import PkCoordinate, RectValue
 from puffkit.geometry.rect import PkRect
 from puffkit.surface import PkSurface
+from puffkit.surface_pool import surface_pool
 
 
 @pytest.fixture(scope="module")
@@ -60,6 +61,25 @@ def test_pksurface_size(surface: PkSurface) -> None:
     assert surface.size == (100, 100)
 
 
+def test_pksurface_masks() -> None:
+    """Test creating a surface with explicit masks."""
+    masks = (0xFF, 0xFF00, 0xFF0000, 0xFF000000)
+    surface = PkSurface((10, 10), masks=masks)
+    assert surface.internal_surface.get_masks() == masks
+
+
+@pytest.mark.parametrize("flags", [0, pygame.SRCALPHA])
+def test_pksurface_from_pygame(flags: int) -> None:
+    """Test wrapping a pygame surface."""
+    pygame_surface = pygame.Surface((10, 20), flags)
+    surface = PkSurface.from_pygame(pygame_surface)
+    assert surface.internal_surface is pygame_surface
+    assert surface.size == (10, 20)
+    assert surface.pos == (0, 0)
+    assert surface.transparent is bool(flags)
+    assert surface.masks == pygame_surface.get_masks()
+
+
 def test_pksurface_width(surface: PkSurface) -> None:
     """Test getting the width of the surface."""
     assert surface.width == 100
@@ -89,6 +109,61 @@ def test_pksurface_blits(surface: PkSurface, surfaces: list[PkSurface]) -> None:
     surface.blits(surfaces)
 
 
+def test_pksurface_blit_pk_values(surface: PkSurface) -> None:
+    """Test blitting with a PkCoordinate destination and a PkRect area."""
+    source = PkSurface((10, 10))
+    source.fill(PkColor(255, 0, 0))
+    surface.blit(source, PkCoordinate(5, 5), PkRect(0, 0, 2, 2))
+    assert surface.get_at((6, 6)) == (255, 0, 0, 255)
+    assert surface.get_at((7, 7)) != (255, 0, 0, 255)
+
+
+def test_pksurface_blits_return(surface: PkSurface) -> None:
+    """Test that blits returns the changed areas."""
+    source = PkSurface((10, 10))
+    source.fill(PkColor(255, 0, 0))
+    pygame_source = pygame.Surface((10, 10))
+    pygame_source.fill((0, 255, 0))
+
+    changed = surface.blits(
+        [
+            (source, (0, 0)),
+            (pygame_source, PkCoordinate(20, 20), PkRect(0, 0, 5, 5)),
+            (source, (40, 40), None, pygame.BLEND_ADD),
+        ]
+    )
+    assert changed == [
+        PkRect(0, 0, 10, 10),
+        PkRect(20, 20, 5, 5),
+        PkRect(40, 40, 10, 10),
+    ]
+    assert surface.get_at((0, 0)) == (255, 0, 0, 255)
+    assert surface.get_at((24, 24)) == (0, 255, 0, 255)
+    assert surface.get_at((25, 25)) != (0, 255, 0, 255)
+
+
+def test_pksurface_blits_no_return(surface: PkSurface) -> None:
+    """Test the blits fast path which doesn't return the changed areas."""
+    source = PkSurface((10, 10))
+    source.fill(PkColor(255, 0, 0))
+    assert surface.blits(((source, (i, i)) for i in range(5)), False) is None
+    assert surface.get_at((13, 13)) == (255, 0, 0, 255)
+
+
+def test_pksurface_fblits(surface: PkSurface) -> None:
+    """Test blitting many surfaces with the fast path."""
+    source = PkSurface((10, 10))
+    source.fill(PkColor(255, 0, 0))
+    surface.fill(PkColor(0, 0, 0))
+    surface.fblits(
+        [(source, PkCoordinate(0, 0)), (source.internal_surface, (50, 50))],
+        pygame.BLEND_ADD,
+    )
+    assert surface.get_at((5, 5)) == (255, 0, 0, 255)
+    assert surface.get_at((55, 55)) == (255, 0, 0, 255)
+    assert surface.get_at((30, 30)) == (0, 0, 0, 255)
+
+
 @pytest.mark.parametrize(
     "new_surface",
     [
@@ -424,6 +499,41 @@ def test_pksurface_draw_rect(
     surface.draw_rect(rect, color, width)
 
 
+def test_pksurface_blit_text_reuses_surface(surface: PkSurface) -> None:
+    """Test that blit_text draws through a pooled temporary surface."""
+    pygame.font.init()
+    font = PkFont(None, 12)
+    surface_pool.clear()
+    surface.blit_text("pooled", (0, 0, 50, 20), font=font)
+    hits = surface_pool.hits
+    surface.blit_text("pooled", (0, 0, 50, 20), font=font)
+    assert surface_pool.hits == hits + 1
+
+
+def test_pksurface_draw_rect_translucent(surface: PkSurface) -> None:
+    """Test that translucent rectangles are blended within their rect only."""
+    surface.fill(PkColor(0, 0, 0))
+    surface.draw_rect((10, 10, 20, 20), PkColor(255, 0, 0, 128), border_radius=4)
+    assert surface.get_at((20, 20)) == (128, 0, 0, 255)
+    assert surface.get_at((10, 10)) == (0, 0, 0, 255)
+    assert surface.get_at((35, 35)) == (0, 0, 0, 255)
+
+
+def test_pksurface_draw_rect_shape_cache(surface: PkSurface) -> None:
+    """Test that translucent shape surfaces are reused."""
+    PkSurface._shape_cache.clear()
+    surface.draw_rect((0, 0, 10, 10), PkColor(255, 0, 0, 128), width=1)
+    surface.draw_rect((50, 50, 10, 10), PkColor(255, 0, 0, 128), width=1)
+    assert len(PkSurface._shape_cache) == 1
+    (shape_surface,) = PkSurface._shape_cache.values()
+    assert shape_surface.get_size() == (10, 10)
+
+    for size in range(PkSurface.SHAPE_CACHE_SIZE):
+        surface.draw_rect((0, 0, size, 1), PkColor(0, 0, 0, 1))
+    assert len(PkSurface._shape_cache) == PkSurface.SHAPE_CACHE_SIZE
+    assert shape_surface not in PkSurface._shape_cache.values()
+
+
 @pytest.mark.parametrize(
     "text, rect, wrap, text_align, vertical_align, tab_size, font_size, color, bg_color, antialias",
     [
@@ -0,0 +1,115 @@
+import pygame
+import pytest
+
+from puffkit.surface import PkSurface
+from puffkit.surface_pool import PkSurfacePool
+
+
+@pytest.fixture
+def pool() -> PkSurfacePool:
+    return PkSurfacePool()
+
+
+def test_pksurfacepool_initialization(pool: PkSurfacePool) -> None:
+    """Test the initialization of PkSurfacePool."""
+    assert pool.max_bytes == PkSurfacePool.DEFAULT_MAX_BYTES
+    assert pool.pooled_bytes == 0
+    assert (pool.hits, pool.misses, pool.evictions) == (0, 0, 0)
+
+
+def test_pksurfacepool_negative_max_bytes() -> None:
+    """Test that a negative byte limit is rejected."""
+    with pytest.raises(ValueError):
+        PkSurfacePool(-1)
+
+
+@pytest.mark.parametrize(
+    "kwargs, flags, depth",
+    [
+        ({}, 0, 32),
+        ({"transparent": True}, pygame.SRCALPHA, 32),
+        ({"flags": pygame.SRCALPHA}, pygame.SRCALPHA, 32),
+        ({"depth": 24}, 0, 24),
+    ],
+)
+def test_pksurfacepool_acquire(
+    pool: PkSurfacePool, kwargs: dict, flags: int, depth: int
+) -> None:
+    """Test acquiring a new surface."""
+    surface = pool.acquire((10, 20), **kwargs)
+    assert surface.size == (10, 20)
+    assert surface.internal_surface.get_flags() & pygame.SRCALPHA == flags
+    assert surface.internal_surface.get_bitsize() == depth
+    assert surface.transparent is bool(flags)
+    assert pool.misses == 1
+
+
+def test_pksurfacepool_release(pool: PkSurfacePool) -> None:
+    """Test that released surfaces are reused for the same key only."""
+    surface = pool.acquire((10, 10), transparent=True)
+    surface.pos = (5, 5)
+    surface.set_clip((0, 0, 1, 1))
+    pool.release(surface)
+    assert pool.pooled_bytes == 400
+
+    assert pool.acquire((10, 10)) is not surface
+    assert pool.acquire((10, 10), transparent=True) is surface
+    assert surface.pos == (0, 0)
+    assert surface.get_clip() == (0, 0, 10, 10)
+    assert pool.hits == 1
+    assert pool.misses == 2
+    assert pool.pooled_bytes == 0
+
+
+def test_pksurfacepool_release_ignored(pool: PkSurfacePool) -> None:
+    """Test that foreign and already released surfaces are ignored."""
+    pool.release(PkSurface((10, 10)))
+    assert pool.pooled_bytes == 0
+
+    surface = pool.acquire((10, 10))
+    pool.release(surface)
+    pool.release(surface)
+    assert pool.pooled_bytes == 400
+
+
+def test_pksurfacepool_eviction() -> None:
+    """Test that the least recently released surfaces are evicted."""
+    pool = PkSurfacePool(800)
+    first, second, third = (pool.acquire((10, 10)) for _ in range(3))
+    too_big = pool.acquire((20, 20))
+    pool.release(first)
+    pool.release(second)
+    pool.release(third)
+    pool.release(too_big)
+    assert pool.evictions == 1
+    assert pool.pooled_bytes == 800
+
+    assert pool.acquire((10, 10)) is third
+    assert pool.acquire((10, 10)) is second
+    assert pool.acquire((20, 20)) is not too_big
+
+    pool.clear()
+    small = pool.acquire((5, 5))
+    pool.release(small)
+    pool.release(pool.acquire((20, 10)))
+    assert pool.acquire((5, 5)) is not small
+
+
+def test_pksurfacepool_borrow(pool: PkSurfacePool) -> None:
+    """Test borrowing a surface for a with block."""
+    with pytest.raises(RuntimeError):
+        with pool.borrow((10, 10)) as surface:
+            raise RuntimeError
+    assert pool.pooled_bytes == 400
+
+    with pool.borrow((10, 10)) as reused:
+        assert reused is surface
+
+
+def test_pksurfacepool_clear(pool: PkSurfacePool) -> None:
+    """Test dropping all pooled surfaces."""
+    pool.release(pool.acquire((10, 10)))
+    pool.clear()
+    assert pool.pooled_bytes == 0
+    pool.acquire((10, 10))
+    assert pool.hits == 0
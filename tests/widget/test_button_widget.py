@@ -7,6 +7,7 @@ from puffkit.geometry import PkRect
 from puffkit.container import PkContainer
 from puffkit.widget.button_widget import PkButtonWidget
 from puffkit.event import PkEvent
+from puffkit.scene import PkFocusManager
 
 
 @pytest.fixture(scope="module")
@@ -33,6 +34,7 @@ def mock_container(app: PkApp) -> Mock:
     mock = Mock(spec=PkContainer)
     mock.app = app
     mock.rect = PkRect(0, 0, 200, 150)
+    mock.focus_manager = PkFocusManager()
     return mock
 
 
@@ -286,3 +288,43 @@ def test_button_on_key_up(button_widget: PkButtonWidget, event: Mock):
         assert not button_widget._pressed
     else:
         assert button_widget._pressed
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [
+        ("label", "Changed"),
+        ("background_color", PkColor(255, 0, 0)),
+        ("background_color_disabled", PkColor(0, 255, 0)),
+        ("background_color_pressed", PkColor(0, 0, 255)),
+        ("background_color_hovered", PkColor(255, 255, 0)),
+        ("text_color", PkColor(0, 255, 255)),
+        ("text_align", "right"),
+        ("border_radius", 10),
+    ],
+)
+def test_button_property_change_marks_dirty(
+    button_widget: PkButtonWidget, attribute: str, value: Any
+):
+    button_widget.container.surface = MagicMock()
+    button_widget.render()
+    assert button_widget.dirty is False
+
+    setattr(button_widget, attribute, getattr(button_widget, attribute))
+    assert button_widget.dirty is False
+
+    setattr(button_widget, attribute, value)
+    assert getattr(button_widget, attribute) == value
+    assert button_widget.dirty is True
+
+
+def test_button_label_properties_update_label_widget(
+    button_widget: PkButtonWidget,
+):
+    label_widget = button_widget.inner_container.get_widget("label")
+    button_widget.label = "Changed"
+    button_widget.text_color = PkColor(255, 0, 0)
+    button_widget.text_align = "left"
+    assert label_widget.get_text() == "Changed"
+    assert label_widget.text_color == PkColor(255, 0, 0)
+    assert label_widget.text_align == "left"
@@ -81,6 +81,25 @@ def test_image_widget_resize_mode_invalid(image_widget: PkImageWidget) -> None:
         image_widget._resize_image("INVALID_MODE")
 
 
+def test_image_widget_resize_mode_setter(image_widget: PkImageWidget) -> None:
+    image_widget.container.surface = MagicMock()
+    image_widget.render()
+    assert image_widget.dirty is False
+
+    image_widget.resize_mode = "stretch"
+    assert image_widget.dirty is False
+
+    resized_image = image_widget.resized_image
+    image_widget.resize_mode = "tile"
+    assert image_widget.resize_mode == "tile"
+    assert image_widget.resized_image is not resized_image
+    assert image_widget.dirty is True
+
+    with pytest.raises(ValueError):
+        image_widget.resize_mode = "INVALID_MODE"
+    assert image_widget.resize_mode == "tile"
+
+
 def test_image_widget_image_property_setter(image_widget: PkImageWidget) -> None:
     new_surface: PkSurface = PkSurface((50, 50))
     new_image = PkImage("new_image", new_surface)
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock
 from puffkit import ColorValue, PkApp, PkColor, PkContainer, PkRect, PkSurface
 from puffkit.font import PkFont
 from puffkit.geometry import RectValue
+from puffkit.scene import PkFocusManager
 from puffkit.widget.label_widget import PkLabelWidget
 
 
@@ -16,7 +17,13 @@ def container() -> PkContainer:
     parent_surface = MagicMock(spec=PkSurface)
     parent_surface.get_width.return_value = 100
     parent_surface.get_height.return_value = 100
-    container = PkContainer(app, parent_surface, "test_container", (0, 0, 100, 100))
+    container = PkContainer(
+        app,
+        parent_surface,
+        "test_container",
+        (0, 0, 100, 100),
+        focus_manager=PkFocusManager(),
+    )
     return container
 
 
@@ -136,11 +143,57 @@ def test_set_text_various(label_widget: PkLabelWidget, text, expected):
 
 
 def test_on_render(label_widget: PkLabelWidget):
-    label_widget.on_render()
+    label_widget.render()
     assert label_widget.needs_redraw is False
 
+    label_widget.needs_redraw = True
+    assert label_widget.dirty is True
+
 
 def test_on_render_needs_redraw(label_widget: PkLabelWidget):
     label_widget.needs_redraw = False
     label_widget.on_render()
     assert label_widget.needs_redraw is False
+
+
+def test_set_text_marks_dirty(label_widget: PkLabelWidget):
+    label_widget.render()
+    label_widget.set_text("Test Label")
+    assert label_widget.dirty is False
+
+    label_widget.set_text("Changed")
+    assert label_widget.dirty is True
+
+
+def test_render_reuses_surface(label_widget: PkLabelWidget):
+    label_widget.on_render = Mock()
+    label_widget.render()
+    label_widget.render()
+    label_widget.on_render.assert_called_once()
+
+    label_widget.set_text("Changed")
+    label_widget.render()
+    assert label_widget.on_render.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [
+        ("text_color", PkColor(255, 0, 0)),
+        ("background_color", PkColor(0, 255, 0)),
+        ("font", Mock(spec=PkFont)),
+        ("text_wrap", False),
+        ("text_align", "right"),
+        ("vertical_align", "bottom"),
+    ],
+)
+def test_property_change_marks_dirty(label_widget: PkLabelWidget, attribute, value):
+    label_widget.render()
+    assert label_widget.dirty is False
+
+    setattr(label_widget, attribute, getattr(label_widget, attribute))
+    assert label_widget.dirty is False
+
+    setattr(label_widget, attribute, value)
+    assert getattr(label_widget, attribute) == value
+    assert label_widget.dirty is True
@@ -8,6 +8,7 @@ from puffkit import PkApp, PkSurface
 
 # from puffkit.color import PkBasicPalette
 from puffkit import PkContainer
+from puffkit.scene import PkFocusManager
 
 
 @pytest.fixture
@@ -19,7 +20,13 @@ def mock_container() -> PkContainer:
     parent_surface = MagicMock(spec=PkSurface)
     parent_surface.get_width.return_value = 200
     parent_surface.get_height.return_value = 100
-    container = PkContainer(app, parent_surface, "test_container", (0, 0, 200, 50))
+    container = PkContainer(
+        app,
+        parent_surface,
+        "test_container",
+        (0, 0, 200, 50),
+        focus_manager=PkFocusManager(),
+    )
     return container
 
 
@@ -187,3 +194,34 @@ def test_set_text_with_suppress(text_input_widget):
     assert text_input_widget.text == new_text
     assert text_input_widget.cursor == len(new_text)  # cursor should be at the end
     text_input_widget.on_change_hook.assert_not_called()  # hook should not be called
+
+
+def test_on_update_cursor_blink_marks_dirty(text_input_widget):
+    """Test that a cursor blink phase change reports the widget as changed."""
+    text_input_widget.focused = True
+    text_input_widget.cursor_blink_interval = 0.6
+    text_input_widget.cursor_blink_timer = 0
+    text_input_widget.on_update(0)  # sync the inner labels first
+    text_input_widget.mark_dirty = Mock()
+
+    text_input_widget.on_update(0.1)
+    text_input_widget.mark_dirty.assert_not_called()
+
+    text_input_widget.on_update(0.3)
+    text_input_widget.mark_dirty.assert_called_once()
+
+
+def test_on_update_requests_frame_at_next_blink(text_input_widget):
+    """Test that a focused text input requests a frame when it blinks next."""
+    app = text_input_widget.container.app
+    text_input_widget.cursor_blink_interval = 0.6
+    text_input_widget.cursor_blink_timer = 0
+
+    text_input_widget.on_update(0.1)
+    delays = [c.args for c in app.request_frame.call_args_list if c.args]
+    assert delays == []
+
+    text_input_widget.focused = True
+    text_input_widget.on_update(0.1)
+    delays = [c.args for c in app.request_frame.call_args_list if c.args]
+    assert delays == [(pytest.approx(0.2),)]
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock
 from puffkit.widget.widget import PkWidget
 from puffkit.geometry import PkRect, RectValue
+from puffkit.scene import PkFocusManager
 from collections.abc import Generator
 
 
@@ -13,6 +14,7 @@ def mock_container() -> Generator[MagicMock, None, None]:
     container = MagicMock()
     container.rect = PkRect(0, 0, 100, 100)
     container.parent_surface = MagicMock()
+    container.focus_manager = PkFocusManager()
     yield container
 
 
@@ -73,7 +75,7 @@ def test_widget_update_calls_on_update(mock_container: MagicMock) -> None:
 
 def test_widget_update_event_handling(mock_container: MagicMock) -> None:
     """Test update method handles events by calling specific `on` methods."""
-    widget = PkWidget("test", mock_container, PkRect(0, 0, 10, 10))
+    widget = PkWidget("test", mock_container, PkRect(0, 0, 10, 10), focusable=True)
 
     KEYDOWN = MagicMock()
     KEYUP = MagicMock()
@@ -232,6 +234,9 @@ def test_widget_focused(mock_container: MagicMock) -> None:
     widget.focused = True
     assert widget.focused
     assert widget._focused
+    assert mock_container.focus_manager.focused is widget
+    widget.focused = False
+    assert mock_container.focus_manager.focused is None
 
 
 def test_widget_visible(mock_container: MagicMock) -> None:
@@ -252,6 +257,16 @@ def test_widget_focusable(mock_container: MagicMock) -> None:
     assert not widget._focusable
 
 
+def test_widget_focusable_unfocus(mock_container: MagicMock) -> None:
+    """Test that a widget made unfocusable loses the focus."""
+    widget = PkWidget("test", mock_container, PkRect(0, 0, 10, 10), focusable=True)
+    widget.focused = True
+    assert mock_container.focus_manager.focused is widget
+    widget.focusable = False
+    assert not widget.focused
+    assert mock_container.focus_manager.focused is None
+
+
 def test_widget_hovered(mock_container: MagicMock) -> None:
     """Test that setting hovered property sets the widget as hovered."""
     widget = PkWidget("test", mock_container, PkRect(0, 0, 10, 10), focusable=True)
@@ -286,3 +301,60 @@ def test_widget_unfocus_escape_keypress(mock_container: MagicMock) -> None:
 
     assert not widget.focused
     widget.on_unfocus.assert_called_once_with(event)
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [
+        ("visible", False),
+        ("disabled", True),
+        ("hovered", True),
+        ("pressed", True),
+        ("focused", True),
+    ],
+)
+def test_widget_state_change_marks_dirty(
+    mock_container: MagicMock, attribute: str, value: bool
+) -> None:
+    """Test that changing a visual state reports the widget area as changed."""
+    widget = PkWidget("test", mock_container, PkRect(10, 10, 10, 10), focusable=True)
+
+    setattr(widget, attribute, value)
+    mock_container.mark_dirty.assert_called_once_with(PkRect(9, 9, 12, 12))
+
+    # setting the same value again does not report anything
+    mock_container.mark_dirty.reset_mock()
+    setattr(widget, attribute, value)
+    mock_container.mark_dirty.assert_not_called()
+
+
+def test_widget_focusable_marks_dirty(mock_container: MagicMock) -> None:
+    """Test that disabling focus on a focused widget reports it as changed."""
+    widget = PkWidget("test", mock_container, PkRect(0, 0, 10, 10), focusable=True)
+    widget.focused = True
+    mock_container.mark_dirty.reset_mock()
+
+    widget.focusable = False
+    mock_container.mark_dirty.assert_called_once()
+
+    mock_container.mark_dirty.reset_mock()
+    widget.focusable = False
+    mock_container.mark_dirty.assert_not_called()
+
+
+def test_widget_render_reuses_surface(mock_container: MagicMock) -> None:
+    """Test that clean widgets are blitted without calling on_render."""
+    widget = PkWidget("test", mock_container, PkRect(0, 0, 10, 10))
+    widget.on_render = MagicMock()
+    assert widget.dirty
+
+    widget.render()
+    widget.render()
+    assert not widget.dirty
+    widget.on_render.assert_called_once()
+    assert mock_container.surface.blit.call_count == 2
+
+    widget.mark_dirty()
+    assert widget.dirty
+    widget.render()
+    assert widget.on_render.call_count == 2